@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+from pybox.datastore.data_table import DataTable
+
+import timeit
+import argparse
+
+
+def scanned_column_index(table, column_name):
+    """Return position of the column found by scanning the column map,
+    as `DataTable.column_index` did before the columns were indexed."""
+    for column_index, (name, _) in enumerate(table._data_map):
+        if name == column_name:
+            return column_index
+    raise IndexError(
+        f"A column called `{column_name}` has not been found in DataTable.")
+
+
+def run_benchmark(rows_number, columns_number, repeats):
+    """Compare the column lookups by name made with the index of columns
+    with the ones made by scanning the column map, as well as the value
+    access through `table[name, row]`.
+
+    Args:
+        rows_number (int): number of rows of the table.
+        columns_number (int): number of integer columns of the table.
+        repeats (int): number of lookups of every column name.
+    """
+    names = [f"Column{idx}" for idx in range(columns_number)]
+    table = DataTable({name: list(range(rows_number)) for name in names})
+    lookups = repeats * columns_number
+    timings = {
+        "scanned column map":
+        timeit.timeit(lambda: [scanned_column_index(table, name)
+                               for name in names],
+                      number=repeats),
+        "indexed column_index":
+        timeit.timeit(lambda: [table.column_index(name) for name in names],
+                      number=repeats),
+        "table[name, row]":
+        timeit.timeit(lambda: [table[name, 0] for name in names],
+                      number=repeats)
+    }
+
+    print(f"{lookups} lookups on a {rows_number}x{columns_number} table:")
+    for name, timing in timings.items():
+        print(f"  {name:<22}{timing:.3f} s "
+              f"({timing / lookups * 1e6:.2f} us/lookup)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=1000)
+    parser_arg = parser.parse_args()
+
+    run_benchmark(parser_arg.rows, parser_arg.columns, parser_arg.repeats)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+import pybox.datastore.database as pbdsdb
+
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+
+DATABASE_NAME = "Benchmark"
+
+
+def create_database(database_directory, rows_number):
+    """Create database with the `Lookup` table of a given number of rows.
+
+    Args:
+        database_directory (str): directory of the database file.
+        rows_number (int): number of rows in the table.
+    """
+    connection = sqlite3.connect(
+        pbdsdb.database_path(DATABASE_NAME, database_directory))
+    with connection:
+        connection.execute(
+            "CREATE TABLE Lookup (Key INTEGER PRIMARY KEY, Value TEXT)")
+        connection.executemany("INSERT INTO Lookup VALUES (?, ?)",
+                               ((key, f"value {key}")
+                                for key in range(rows_number)))
+    connection.close()
+
+
+def lookup(connect, keys):
+    """Return time in seconds of the point lookups of supplied keys,
+    connection of every query is returned by `connect`."""
+    start = time.perf_counter()
+    for key in keys:
+        connect().execute("SELECT Value FROM Lookup WHERE Key = ?",
+                          (key, )).fetchone()
+    return time.perf_counter() - start
+
+
+def run_benchmark(rows_number, queries_number):
+    """Compare point lookups made with a new connection per query (as before
+    connections were reused) with the ones made with `create_connection`.
+
+    Args:
+        rows_number (int): number of rows in the queried table.
+        queries_number (int): number of the point lookups.
+    """
+    keys = [random.randrange(rows_number) for _ in range(queries_number)]
+    with tempfile.TemporaryDirectory() as database_directory:
+        create_database(database_directory, rows_number)
+        database = pbdsdb.database_path(DATABASE_NAME, database_directory)
+        timings = {
+            "new connection per query":
+            lookup(lambda: sqlite3.connect(database), keys),
+            "reused connection":
+            lookup(
+                lambda: pbdsdb.create_connection(DATABASE_NAME,
+                                                 database_directory,
+                                                 read_only=True), keys)
+        }
+        pbdsdb.close_connections()
+
+    print(f"{queries_number} point lookups on a {rows_number}-row table:")
+    for name, timing in timings.items():
+        print(f"  {name:<26}{timing:.2f} s "
+              f"({timing / queries_number * 1e6:.0f} us/query)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=20000)
+    parser_arg = parser.parse_args()
+
+    run_benchmark(parser_arg.rows, parser_arg.queries)
@@ -99,4 +99,7 @@ task.run(
         "TopicDataLDA",
         "TopicDataNMF"
     ],
-    task_outputs=["ArticleTopics"])
+    task_outputs=["ArticleTopics"],
+    inputs_requirements={"PapersFiltered": {
+        "columns": ["Abstract"]
+    }})
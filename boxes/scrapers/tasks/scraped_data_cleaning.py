@@ -25,8 +25,7 @@ def clean_reuters(inputs):
         cleaned_reuters.concatenate(
             input_data, inner_columns=data_columns, outer_columns=data_columns)
 
-    # cleaned_reuters.filter(
-    #     lambda row: all(row[column] is not None for column in data_columns))
+    cleaned_reuters.drop_nulls(data_columns)
 
     # cleaned_reuters.apply("Body", lambda row: re.sub(r'[,\.!?]', '', row))
     # cleaned_reuters.apply("Body", lambda row: ' '.join(
@@ -1,8 +1,5 @@
 #!/usr/bin/env python
 import os
-import yaml
-import logging
-import logging.config
 from pathlib import Path
 
 APP_PATH = str(Path(os.path.realpath(__file__)).parents[1])
@@ -11,9 +8,19 @@ GLOBAL_DATA_PATH = "/".join([APP_PATH, "data"])
 EXTERN_PATH = "/".join([APP_PATH, "extern"])
 BOXES_PATH = "/".join([APP_PATH, "boxes"])
 TESTS_PATH = "/".join([APP_PATH, "tests"])
+CACHE_PATH = "/".join([APP_PATH, "cache"])
 
 LOGGING_CONFIG = "/".join([APP_PATH, "config.yml"])
 
-with open(LOGGING_CONFIG, 'r') as stream:
-    config = yaml.load(stream, Loader=yaml.FullLoader)
-logging.config.dictConfig(config)
+
+def configure_logging():
+    """Configure logging as described in the LOGGING_CONFIG file. It is
+    called by the entry points of the application, importing pybox modules
+    does not change the logging configuration."""
+    import yaml
+    import logging.config
+
+    with open(LOGGING_CONFIG, 'r') as stream:
+        config = yaml.load(stream, Loader=yaml.FullLoader)
+    logging.config.dictConfig(config)
+
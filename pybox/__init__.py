@@ -1,4 +1,29 @@
 #!/usr/bin/env python
-from pybox.datastore.data_table import DataTable
-from pybox.scraper.news_reader import NewsReader
-import pybox.datastore.data_flow as flow
+import importlib
+
+# Package attributes are imported on the first access (PEP 562), so that
+# importing any `pybox` module does not import all of them, together with
+# their dependencies, e.g. NumPy or Selenium.
+_LAZY_ATTRIBUTES = {
+    "DataTable": ("pybox.datastore.data_table", "DataTable"),
+    "col": ("pybox.datastore.data_expression", "col"),
+    "NewsReader": ("pybox.scraper.news_reader", "NewsReader"),
+    "flow": ("pybox.datastore.data_flow", None),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+    value = importlib.import_module(module_name)
+    if attribute_name is not None:
+        value = getattr(value, attribute_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
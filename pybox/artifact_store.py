@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+import pybox.datastore.data_flow as pbddf
+from pybox.datastore.data_table import DataTable
+
+import os
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+# Environment variable with the directory in which outputs are shared
+# between processes as Arrow IPC files, set by the task scheduler.
+HANDOFF_DIRECTORY_VARIABLE = "PYBOX_HANDOFF_DIRECTORY"
+# Size of the outputs kept in memory above which the oldest ones, already
+# written as parquet files, are discarded.
+MAX_ARTIFACT_BYTES = 1024**3
+
+
+class ArtifactStore:
+    """Outputs of the tasks run in the current process, handed directly
+    to the tasks consuming them.
+
+    Outputs are kept as DataTables sharing (read-only) column buffers,
+    so consumers receive them without the parquet encoding and decoding.
+    Parquet files are written in a background thread. If the handoff
+    directory is set, outputs are also written there as Arrow IPC files,
+    which other processes memory-map without copying.
+
+    Memory taken by the stored outputs is bounded by `max_bytes`, the oldest
+    outputs already written as parquet files are discarded above it,
+    so consumers load them from these files instead.
+    """
+
+    def __init__(self, max_bytes=MAX_ARTIFACT_BYTES):
+        """Initialization of the ArtifactStore class.
+
+        Args:
+            max_bytes (int, optional): size of the outputs kept in memory,
+                exceeding it discards the oldest written ones.
+                Defaults to MAX_ARTIFACT_BYTES.
+        """
+        self.max_bytes = max_bytes
+        self.artifacts = dict()
+        self.artifact_bytes = dict()
+        self.persistence = dict()
+        self._executor = None
+        self._executor_pid = None
+        self._submitted = list()
+
+    @property
+    def handoff_directory(self):
+        """Return directory of the Arrow IPC files shared between processes,
+        or None if outputs are not shared."""
+        return os.environ.get(HANDOFF_DIRECTORY_VARIABLE)
+
+    def put(self, table, name, directory):
+        """Store the task output and schedule writing it as a parquet file.
+
+        Args:
+            table (DataTable): output of the task.
+            name (str): name of the output.
+            directory (str): directory in which parquet file is written.
+        """
+        file_path = f"{directory}/{name}.parquet"
+        table = table.shared_copy()
+        self.discard(file_path)
+        self.artifacts[file_path] = table
+        self.artifact_bytes[file_path] = sum(table.memory_usage().values())
+        if self.handoff_directory is not None:
+            _write_handoff(table, self._handoff_path(file_path))
+        self.persistence[file_path] = self.submit(pbddf.table_to_parquet,
+                                                  table, name, directory)
+        self._evict()
+
+    def load(self,
+             name,
+             directory,
+             columns=None,
+             filters=None,
+             batch_size=None,
+             categorical=None):
+        """Return stored output, or None if it is not found. Output is
+        limited in the same manner as by `table_from_parquet`, or returned
+        as an iterator of batches if `batch_size` is supplied.
+
+        Args:
+            name (str): name of the output.
+            directory (str): directory of the output parquet file.
+            columns (list, optional): names of the columns to be returned.
+                Defaults to None.
+            filters (list, optional): row filters in the `pyarrow.parquet`
+                form. Defaults to None.
+            batch_size (int, optional): maximum number of rows in a single
+                batch. Defaults to None.
+            categorical (list, optional): names of the columns returned
+                as the categorical ones. Defaults to None.
+        """
+        file_path = f"{directory}/{name}.parquet"
+        if file_path in self.artifacts:
+            # Columns are returned in the requested order and missing ones
+            # raise an error, as in the parquet and Arrow projections.
+            table = self.artifacts[file_path].shared_copy(columns)
+            if categorical is not None:
+                table.categorize(categorical)
+            if filters is None and batch_size is None:
+                return table
+            arrow_table = table.to_arrow_table
+        elif (self.handoff_directory is not None
+              and os.path.exists(self._handoff_path(file_path))):
+            arrow_table = _read_handoff(self._handoff_path(file_path))
+        else:
+            return None
+
+        import pyarrow as pa
+
+        if columns is not None and arrow_table.column_names != columns:
+            arrow_table = arrow_table.select(columns)
+        for column_name in categorical or list():
+            column_index = arrow_table.column_names.index(column_name)
+            column = arrow_table.column(column_index)
+            if not pa.types.is_dictionary(column.type):
+                arrow_table = arrow_table.set_column(
+                    column_index, column_name, column.dictionary_encode())
+        if filters is not None:
+            import pyarrow.parquet as pq
+
+            arrow_table = arrow_table.filter(pq.filters_to_expression(filters))
+        if batch_size is not None:
+            return (DataTable.from_arrow(batch)
+                    for batch in arrow_table.to_batches(batch_size)
+                    if batch.num_rows)
+        return DataTable.from_arrow(arrow_table)
+
+    def discard(self, file_path):
+        """Remove stored output of a given parquet file path."""
+        self.artifacts.pop(file_path, None)
+        self.artifact_bytes.pop(file_path, None)
+
+    def submit(self, function, *args, **kwargs):
+        """Run function in the background thread, after all previously
+        submitted ones, and return its future."""
+        if self._executor_pid != os.getpid():
+            # Threads are not inherited by forked processes.
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._executor_pid = os.getpid()
+            self._submitted = list()
+        future = self._executor.submit(function, *args, **kwargs)
+        self._submitted.append(future)
+        return future
+
+    def wait(self, file_paths=None):
+        """Wait until outputs are written as parquet files. The first error
+        raised in the background thread is raised again, once all awaited
+        functions are finished.
+
+        Args:
+            file_paths (list, optional): parquet file paths of the awaited
+                outputs, if None all outputs, as well as all other functions
+                submitted to the background thread, are awaited.
+                Defaults to None.
+        """
+        if file_paths is None:
+            self.persistence = dict()
+            submitted, self._submitted = self._submitted, list()
+            errors = [future.exception() for future in submitted]
+            for error in errors:
+                if error is not None:
+                    raise error
+        for file_path in file_paths or list():
+            future = self.persistence.pop(file_path, None)
+            if future is not None:
+                future.result()
+
+    def clear(self):
+        """Wait for all outputs to be written and remove them from memory."""
+        self.wait()
+        self.artifacts = dict()
+        self.artifact_bytes = dict()
+
+    def _evict(self):
+        """Discard the oldest outputs already written as parquet files,
+        until the stored ones fit in `max_bytes`."""
+        stored_bytes = sum(self.artifact_bytes.values())
+        for file_path in list(self.artifacts):
+            if stored_bytes <= self.max_bytes:
+                break
+            future = self.persistence.get(file_path)
+            if future is None or future.done():
+                stored_bytes -= self.artifact_bytes.get(file_path, 0)
+                self.discard(file_path)
+
+    def _handoff_path(self, file_path):
+        name = file_path.replace("/", "_").replace("\\", "_")
+        return f"{self.handoff_directory}/{name}.arrow"
+
+
+def _write_handoff(table, handoff_path):
+    """Write DataTable as an Arrow IPC file."""
+    import pyarrow as pa
+
+    arrow_table = table.to_arrow_table
+    temporary_path = f"{handoff_path}.tmp{os.getpid()}"
+    with pa.OSFile(temporary_path, "wb") as sink:
+        with pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+    os.replace(temporary_path, handoff_path)
+
+
+def _read_handoff(handoff_path):
+    """Return Arrow table memory-mapped from the Arrow IPC file."""
+    import pyarrow as pa
+
+    with pa.memory_map(handoff_path, "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+ARTIFACT_STORE = ArtifactStore()
+# Runs wait for their outputs explicitly, so that errors raised while writing
+# them are not lost, it is only a backstop for the other callers.
+atexit.register(ARTIFACT_STORE.wait)
@@ -0,0 +1,891 @@
+#!/usr/bin/env python
+import pybox.helpers.data as data_helpers
+
+import numpy as np
+from datetime import date, datetime
+
+# Python types whose values can be stored in the typed NumPy buffers.
+NUMPY_DTYPES = {
+    int: np.dtype("int64"),
+    float: np.dtype("float64"),
+    complex: np.dtype("complex128"),
+    bool: np.dtype("bool"),
+    date: np.dtype("datetime64[D]"),
+    datetime: np.dtype("datetime64[us]")
+}
+PYTHON_TYPES = {
+    numpy_dtype: python_type
+    for python_type, numpy_dtype in NUMPY_DTYPES.items()
+}
+# Number of the objects, whose sizes are measured to estimate the memory
+# footprint of the object column.
+BYTESIZE_SAMPLE_SIZE = 1000
+# Types of the values, which can be stored in the typed buffers of the
+# Python types, narrower ones are converted without loss.
+COMPATIBLE_TYPES = {
+    int: {int},
+    float: {int, float},
+    complex: {int, float, complex},
+    bool: {bool},
+    date: {date},
+    datetime: {date, datetime}
+}
+
+
+class DataColumn:
+    """Column-major storage of the DataTable values.
+
+    Values of int, float, complex, bool, date and datetime columns are kept
+    in typed NumPy buffers, all the others are kept in NumPy object buffers.
+    Missing values of the typed columns are marked in the validity mask
+    (True for valid values, as in Arrow), so the columns with missing values
+    stay typed, while object buffers keep them as None. Buffer grows
+    geometrically, so appending rows one by one is amortized O(1).
+    """
+
+    __slots__ = ["_buffer", "_length", "_validity"]
+
+    def __init__(self, values=None, datatype=None):
+        """Initialization of the DataColumn class.
+
+        Args:
+            values (array-like, optional): values stored in the column.
+                Defaults to None.
+            datatype (type, optional): data type of supplied values, which
+                determines the type of the buffer. Defaults to None.
+        """
+        self._buffer, self._validity = _create_buffer(values, datatype)
+        self._length = len(self._buffer)
+
+    @classmethod
+    def from_buffer(cls, buffer, validity=None):
+        """Return DataColumn wrapping supplied NumPy array without conversion.
+
+        Args:
+            buffer (numpy.ndarray): one dimensional array of column values.
+            validity (numpy.ndarray, optional): boolean array marking valid
+                values of the typed buffer, values under False positions
+                are missing. Defaults to None.
+        """
+        column = cls.__new__(cls)
+        column._buffer = buffer
+        column._length = len(buffer)
+        column._validity = None if validity is None or validity.all() \
+            else validity
+        return column
+
+    @classmethod
+    def from_arrow(cls, array):
+        """Return DataColumn wrapping supplied Arrow array, together with
+        the Python type of its values. Buffers of numeric and timestamp
+        arrays without missing values are shared with Arrow (zero-copy),
+        such a column is copied on the first in-place modification.
+
+        Args:
+            array (pyarrow.Array, pyarrow.ChunkedArray): column values.
+        """
+        import pyarrow as pa
+
+        if pa.types.is_dictionary(array.type):
+            return CategoricalColumn.from_arrow(array)
+        if isinstance(array, pa.ChunkedArray):
+            array = array.chunk(0) if array.num_chunks == 1 \
+                else array.combine_chunks()
+        datatype = _arrow_python_type(array.type)
+        if datatype is None:
+            values = array.to_pylist()
+            datatype = data_helpers.recognize_type(values) if values else object
+            return cls(values, datatype), datatype
+
+        if pa.types.is_uint64(array.type):
+            import pyarrow.compute as pc
+
+            if (pc.max(array).as_py() or 0) > np.iinfo(np.int64).max:
+                # Values out of the int64 range are kept as Python ints
+                # in the object buffer.
+                return cls(array.to_pylist(), datatype), datatype
+
+        numpy_dtype = NUMPY_DTYPES.get(datatype, np.dtype(object))
+        if array.null_count == 0:
+            buffer = array.to_numpy(zero_copy_only=False)
+            if buffer.dtype != numpy_dtype:
+                buffer = buffer.astype(numpy_dtype)
+            return cls.from_buffer(buffer), datatype
+
+        # Arrow validity bitmap is unpacked into the boolean mask, missing
+        # values of the typed buffer are left zeroed.
+        valid = array.is_valid().to_numpy(zero_copy_only=False)
+        if numpy_dtype == object:
+            buffer = np.full(len(array), None, dtype=object)
+        else:
+            buffer = np.zeros(len(array), dtype=numpy_dtype)
+        buffer[valid] = array.drop_null().to_numpy(
+            zero_copy_only=False).astype(numpy_dtype)
+        if numpy_dtype == object:
+            return cls.from_buffer(buffer), datatype
+        return cls.from_buffer(buffer, valid), datatype
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if self._validity is not None and not isinstance(index, slice) \
+                and not self.validity[index]:
+            return None
+        value = self.data[index]
+        if self.is_typed:
+            return value.item()
+        return value
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __repr__(self):
+        return f"DataColumn({self.dtype},{self._length})"
+
+    @property
+    def values(self):
+        """Return NumPy array view on the values stored in the column. If
+        the typed column has missing values, object array is returned
+        instead, with None values in place of the missing ones."""
+        values = self._buffer[:self._length]
+        if self._validity is None:
+            return values
+        return _with_nulls(values, self.validity)
+
+    @property
+    def data(self):
+        """Return NumPy array view on the column buffer, values under
+        the missing positions of the typed buffer are arbitrary."""
+        return self._buffer[:self._length]
+
+    @property
+    def validity(self):
+        """Return boolean array marking valid values of the typed buffer,
+        or None if none of them is missing."""
+        if self._validity is None:
+            return None
+        return self._validity[:self._length]
+
+    @property
+    def null_count(self):
+        """Return number of the missing values in the column."""
+        return int(self.is_null().sum())
+
+    @property
+    def dtype(self):
+        """Return NumPy data type of the column buffer."""
+        return self._buffer.dtype
+
+    @property
+    def is_typed(self):
+        """Return True if values are stored in a typed (non-object) buffer."""
+        return self._buffer.dtype != object
+
+    @property
+    def nbytes(self):
+        """Return the approximate memory footprint of the column,
+        see `memory_usage`."""
+        return self.memory_usage()
+
+    def memory_usage(self, exact=False):
+        """Return memory footprint of the column in bytes. Sizes of the
+        buffers are exact, sizes of the objects stored in the object buffer
+        are estimated on a sample of BYTESIZE_SAMPLE_SIZE of them.
+
+        Args:
+            exact (bool, optional): if True sizes of all stored objects are
+                measured, objects stored several times are counted once.
+                Defaults to False.
+        """
+        size = self._buffer.nbytes
+        if self._validity is not None:
+            size += self._validity.nbytes
+        if not self.is_typed:
+            size += _objects_size(self.data, exact)
+        return size
+
+    def is_null(self):
+        """Return boolean array marking missing values of the column."""
+        if self._validity is not None:
+            return ~self.validity
+        if self.is_typed:
+            return np.zeros(self._length, dtype=bool)
+        return np.fromiter((value is None for value in self.data),
+                           dtype=bool,
+                           count=self._length)
+
+    def fill_null(self, value):
+        """Return copy of the column with missing values replaced by the
+        supplied one, typed buffer is converted to the object one if
+        the value does not match its type.
+
+        Args:
+            value (any): value replacing the missing ones.
+        """
+        column = self.copy()
+        nulls = column.is_null()
+        if value is None or not nulls.any():
+            return column
+        if not column._accepts(value):
+            column._to_object()
+        column._buffer[nulls] = value
+        column._validity = None
+        return column
+
+    def to_arrow(self):
+        """Return Arrow array of the column values. Buffers of numeric and
+        timestamp columns are shared with the created array (zero-copy),
+        validity mask is packed into the Arrow validity bitmap. Shared
+        buffers are copied on the first in-place modification of the column.
+        """
+        import pyarrow as pa
+
+        self._share()
+        if self._validity is None:
+            return pa.array(self.values)
+        return pa.array(self.data, mask=~self.validity)
+
+    def to_list(self):
+        """Return column values as a list of Python objects."""
+        return self.values.tolist()
+
+    def copy(self):
+        """Return copy of the column, trimmed to its length."""
+        validity = self.validity
+        return DataColumn.from_buffer(
+            self.data.copy(), None if validity is None else validity.copy())
+
+    def view(self, rows=None):
+        """Return column sharing values with the current one. Shared values
+        are read-only in both columns, so each of them copies its buffers
+        on the first in-place modification.
+
+        Args:
+            rows (slice, optional): range of the rows shared with the returned
+                column. Defaults to None, in which case all rows are shared.
+        """
+        rows = slice(None) if rows is None else rows
+        self._share()
+        validity = self.validity
+        return DataColumn.from_buffer(
+            self.data[rows], None if validity is None else validity[rows])
+
+    def take(self, indices, fill_missing=False):
+        """Return new column consisting of values under supplied indices.
+
+        Args:
+            indices (array-like): integer positions or boolean mask.
+            fill_missing (bool, optional): if True negative positions are
+                treated as missing rows and filled with None. Defaults to False.
+        """
+        indices = np.asarray(indices)
+        validity = self.validity
+        if fill_missing and indices.dtype != bool:
+            missing = indices < 0
+        else:
+            missing = None
+        if missing is None or not missing.any():
+            return DataColumn.from_buffer(
+                self.data[indices],
+                None if validity is None else validity[indices])
+
+        if self._length == 0:
+            positions = np.zeros(len(indices), dtype=np.int64)
+            buffer = np.zeros(len(indices), dtype=self.dtype)
+        else:
+            positions = np.where(missing, 0, indices)
+            buffer = self.data[positions]
+        if not self.is_typed:
+            buffer[missing] = None
+            return DataColumn.from_buffer(buffer)
+        if validity is None or self._length == 0:
+            return DataColumn.from_buffer(buffer, ~missing)
+        return DataColumn.from_buffer(buffer, validity[positions] & ~missing)
+
+    def set_item(self, index, value):
+        """Set value under supplied index, buffer is converted to the
+        object one if the value does not match its type.
+
+        Args:
+            index (int): position of the value.
+            value (any): value to be set.
+        """
+        if not self._accepts(value):
+            self._to_object()
+        self._reserve(self._length)
+        if value is None and self.is_typed:
+            self._missing_validity()
+            self.validity[index] = False
+            return
+        self.data[index] = value
+        if self._validity is not None:
+            self.validity[index] = True
+
+    def insert(self, index, value):
+        """Insert value before supplied index, following `list.insert` rules.
+
+        Args:
+            index (int): position before which value is inserted.
+            value (any): value to be inserted.
+        """
+        if not self._accepts(value):
+            self._to_object()
+        if index < 0:
+            index += self._length
+        index = min(max(index, 0), self._length)
+        missing = value is None and self.is_typed
+
+        self._reserve(self._length + 1)
+        if missing:
+            self._missing_validity()
+        for buffer in (self._buffer, self._validity):
+            if buffer is not None:
+                buffer[index + 1:self._length + 1] = buffer[index:self._length]
+        if self._validity is not None:
+            self._validity[index] = not missing
+        if not missing:
+            self._buffer[index] = value
+        self._length += 1
+
+    def extend(self, values):
+        """Append supplied values at the end of the column.
+
+        Args:
+            values (array-like, DataColumn): values to be appended.
+        """
+        if isinstance(values, DataColumn):
+            other_buffer, other_validity = values.data, values.validity
+        else:
+            other_buffer, other_validity = _create_buffer(
+                values, PYTHON_TYPES.get(self.dtype))
+        if other_buffer.dtype != self.dtype:
+            self._to_object()
+            other_buffer = other_buffer.astype(object) \
+                if other_validity is None \
+                else _with_nulls(other_buffer, other_validity)
+            other_validity = None
+
+        new_length = self._length + len(other_buffer)
+        self._reserve(new_length)
+        if other_validity is not None:
+            self._missing_validity()
+        self._buffer[self._length:new_length] = other_buffer
+        if self._validity is not None:
+            self._validity[self._length:new_length] = True \
+                if other_validity is None else other_validity
+        self._length = new_length
+
+    def _accepts(self, value):
+        """Check if supplied value can be stored in the current buffer,
+        missing values are accepted by all of them."""
+        if not self.is_typed or value is None:
+            return True
+        python_type = PYTHON_TYPES.get(self.dtype)
+        if python_type is None:
+            return isinstance(value, np.generic)
+        return type(value) in COMPATIBLE_TYPES[python_type] and (
+            type(value) is not datetime or value.tzinfo is None)
+
+    def _to_object(self):
+        """Convert typed buffer into the object one."""
+        if self.is_typed:
+            self._buffer = self.values.astype(object, copy=False)
+            self._validity = None
+
+    def _missing_validity(self):
+        """Create validity mask of the buffer, if it does not exist yet."""
+        if self._validity is None:
+            self._validity = np.ones(len(self._buffer), dtype=bool)
+
+    def _share(self):
+        """Mark buffers of the column as read-only, before sharing them
+        with other columns."""
+        self._buffer.flags.writeable = False
+        if self._validity is not None:
+            self._validity.flags.writeable = False
+
+    def _shared(self):
+        """Check if buffers of the column are read-only, i.e. shared
+        with other columns."""
+        return not self._buffer.flags.writeable or (
+            self._validity is not None and not self._validity.flags.writeable)
+
+    def _reserve(self, capacity):
+        """Grow the buffer geometrically to hold at least `capacity` values,
+        read-only buffers shared with other columns are copied."""
+        if capacity > len(self._buffer) or self._shared():
+            new_capacity = len(self._buffer)
+            if capacity > new_capacity:
+                new_capacity = max(capacity, 2 * new_capacity)
+            new_buffer = np.empty(new_capacity, dtype=self._buffer.dtype)
+            new_buffer[:self._length] = self._buffer[:self._length]
+            self._buffer = new_buffer
+            if self._validity is not None:
+                new_validity = np.ones(new_capacity, dtype=bool)
+                new_validity[:self._length] = self._validity[:self._length]
+                self._validity = new_validity
+
+
+class CategoricalColumn(DataColumn):
+    """Dictionary-encoded storage of the DataTable values.
+
+    Every distinct value (category) is stored once, in the sorted array
+    of categories, and rows keep only integer codes of their categories,
+    None values are coded as -1. Order of the codes follows the order
+    of the categories, so rows can be compared, grouped and sorted
+    by their codes. It suits columns repeating a handful of values,
+    e.g. labels or levels of a categorical variable.
+    """
+
+    __slots__ = ["_categories"]
+
+    def __init__(self, values=None, datatype=None):
+        """Initialization of the CategoricalColumn class.
+
+        Args:
+            values (array-like, optional): values stored in the column.
+                Defaults to None.
+            datatype (type, optional): data type of supplied values, not used
+                in encoding, kept for compatibility with DataColumn.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the values can not be sorted.
+        """
+        codes, self._categories, _ = _encode(
+            list() if values is None else values)
+        self._buffer = codes
+        self._length = len(codes)
+        self._validity = None
+
+    @classmethod
+    def from_codes(cls, codes, categories):
+        """Return CategoricalColumn wrapping supplied codes and categories
+        without conversion.
+
+        Args:
+            codes (numpy.ndarray): int32 codes of the values, -1 for None.
+            categories (numpy.ndarray): sorted object array of categories.
+        """
+        column = cls.__new__(cls)
+        column._buffer = codes
+        column._length = len(codes)
+        column._validity = None
+        column._categories = categories
+        return column
+
+    @classmethod
+    def from_arrow(cls, array):
+        """Return CategoricalColumn created from the Arrow dictionary array,
+        together with the Python type of its values.
+
+        Args:
+            array (pyarrow.DictionaryArray, pyarrow.ChunkedArray): column
+                values of the dictionary type.
+        """
+        import pyarrow as pa
+
+        if isinstance(array, pa.ChunkedArray):
+            array = array.unify_dictionaries().combine_chunks() \
+                if array.num_chunks else pa.array(list(), array.type)
+        dictionary = array.dictionary.to_pylist()
+        datatype = _arrow_python_type(array.type.value_type)
+        if datatype is None:
+            datatype = data_helpers.recognize_type(
+                dictionary) if dictionary else object
+
+        indices = array.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        try:
+            order = sorted(range(len(dictionary)),
+                           key=dictionary.__getitem__)
+        except TypeError:
+            raise ValueError("Values of the categorical column must be "
+                             "comparable with each other.")
+        mapping = np.empty(len(dictionary) + 1, dtype=np.int32)
+        mapping[order] = np.arange(len(dictionary))
+        mapping[-1] = -1
+        categories = _object_array([dictionary[idx] for idx in order])
+        return cls.from_codes(mapping[indices], categories), datatype
+
+    def __getitem__(self, index):
+        codes = self.codes[index]
+        if isinstance(codes, np.ndarray):
+            return self._decode(codes)
+        return None if codes < 0 else self._categories[codes]
+
+    def __repr__(self):
+        return (f"CategoricalColumn({len(self._categories)} categories,"
+                f"{self._length})")
+
+    @property
+    def values(self):
+        """Return NumPy object array of the decoded column values."""
+        return self._decode(self.codes)
+
+    @property
+    def data(self):
+        """Return NumPy object array of the decoded column values."""
+        return self.values
+
+    @property
+    def codes(self):
+        """Return NumPy array view on the codes of the column values."""
+        return self._buffer[:self._length]
+
+    @property
+    def categories(self):
+        """Return sorted NumPy array of the column categories."""
+        return self._categories
+
+    @property
+    def dtype(self):
+        """Return NumPy data type of the decoded values."""
+        return np.dtype(object)
+
+    def memory_usage(self, exact=False):
+        """Return memory footprint of the column in bytes, consisting of
+        the codes and categories, see `DataColumn.memory_usage`.
+
+        Args:
+            exact (bool, optional): if True sizes of all categories are
+                measured. Defaults to False.
+        """
+        return self._buffer.nbytes + self._categories.nbytes + _objects_size(
+            self._categories, exact)
+
+    def code(self, value):
+        """Return code of the supplied value, or None if it is not one
+        of the categories.
+
+        Args:
+            value (any): searched value.
+        """
+        if value is None:
+            return None
+        try:
+            position = int(np.searchsorted(self._categories, value))
+        except TypeError:
+            return None
+        if (position < len(self._categories)
+                and self._categories[position] == value):
+            return position
+        return None
+
+    def is_null(self):
+        """Return boolean array marking missing values of the column."""
+        return self.codes < 0
+
+    def fill_null(self, value):
+        """Return copy of the column with missing values replaced by the
+        supplied one, which is added to the categories if necessary.
+
+        Args:
+            value (any): value replacing the missing ones.
+        """
+        column = self.copy()
+        nulls = column.is_null()
+        if value is not None and nulls.any():
+            code, = column._codes_of([value])
+            column.codes[nulls] = code
+        return column
+
+    def to_arrow(self):
+        """Return Arrow dictionary array of the column values."""
+        import pyarrow as pa
+
+        codes = self.codes
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes, mask=codes < 0), pa.array(self._categories))
+
+    def to_list(self):
+        """Return column values as a list of Python objects."""
+        return self.values.tolist()
+
+    def copy(self):
+        """Return copy of the column, trimmed to its length."""
+        return CategoricalColumn.from_codes(self.codes.copy(),
+                                            self._categories)
+
+    def view(self, rows=None):
+        """Return column sharing codes with the current one. Shared codes
+        are read-only in both columns, so each of them copies its codes
+        on the first in-place modification.
+
+        Args:
+            rows (slice, optional): range of the rows shared with the returned
+                column. Defaults to None, in which case all rows are shared.
+        """
+        rows = slice(None) if rows is None else rows
+        self._share()
+        return CategoricalColumn.from_codes(self.codes[rows],
+                                            self._categories)
+
+    def take(self, indices, fill_missing=False):
+        """Return new column consisting of values under supplied indices.
+
+        Args:
+            indices (array-like): integer positions or boolean mask.
+            fill_missing (bool, optional): if True negative positions are
+                treated as missing rows and filled with None. Defaults to False.
+        """
+        indices = np.asarray(indices)
+        if not fill_missing or indices.dtype == bool:
+            return CategoricalColumn.from_codes(self.codes[indices],
+                                                self._categories)
+        missing = indices < 0
+        if self._length == 0:
+            codes = np.full(len(indices), -1, dtype=np.int32)
+        else:
+            codes = self.codes[np.where(missing, 0, indices)]
+            codes[missing] = -1
+        return CategoricalColumn.from_codes(codes, self._categories)
+
+    def set_item(self, index, value):
+        """Set value under supplied index, value which is not one of the
+        categories is added to them.
+
+        Args:
+            index (int): position of the value.
+            value (any): value to be set.
+        """
+        code, = self._codes_of([value])
+        self._reserve(self._length)
+        self.codes[index] = code
+
+    def insert(self, index, value):
+        """Insert value before supplied index, following `list.insert` rules.
+
+        Args:
+            index (int): position before which value is inserted.
+            value (any): value to be inserted.
+        """
+        code, = self._codes_of([value])
+        if index < 0:
+            index += self._length
+        index = min(max(index, 0), self._length)
+
+        self._reserve(self._length + 1)
+        self._buffer[index + 1:self._length + 1] = \
+            self._buffer[index:self._length]
+        self._buffer[index] = code
+        self._length += 1
+
+    def extend(self, values):
+        """Append supplied values at the end of the column.
+
+        Args:
+            values (array-like, DataColumn): values to be appended.
+        """
+        if isinstance(values, CategoricalColumn):
+            mapping = self._merge_categories(values.categories)
+            codes = mapping[values.codes]
+        else:
+            if isinstance(values, DataColumn):
+                values = values.values
+            codes = self._codes_of(values)
+
+        new_length = self._length + len(codes)
+        self._reserve(new_length)
+        self._buffer[self._length:new_length] = codes
+        self._length = new_length
+
+    def _codes_of(self, values):
+        """Return codes of the supplied values, adding missing categories."""
+        codes, categories, mapping = _encode(values, self._categories)
+        if len(categories) != len(self._categories):
+            self._buffer = mapping[self.codes]
+            self._categories = categories
+        return codes
+
+    def _merge_categories(self, categories):
+        """Add supplied categories to the column ones and return array
+        mapping codes of the supplied categories to the new codes (its last
+        element maps -1 onto itself)."""
+        return self._codes_of(list(categories) + [None])
+
+    def _decode(self, codes):
+        """Return object array of the values represented by the codes."""
+        lookup = np.empty(len(self._categories) + 1, dtype=object)
+        lookup[:-1] = self._categories
+        return lookup[codes]
+
+
+def _create_buffer(values, datatype):
+    """Return NumPy array storing supplied values, together with the validity
+    mask of its missing values (None if there are none). Typed buffer is
+    created only if every value, except the missing ones, is exactly of
+    the supplied type, otherwise values are stored in the object buffer.
+
+    Args:
+        values (array-like): values to be stored.
+        datatype (type): data type of supplied values.
+    """
+    if values is None:
+        values = list()
+    numpy_dtype = NUMPY_DTYPES.get(datatype)
+    if numpy_dtype is None and getattr(datatype, "__module__", "") == "numpy":
+        numpy_dtype = np.dtype(datatype)
+
+    if isinstance(values, np.ndarray):
+        if numpy_dtype is not None and values.dtype == numpy_dtype:
+            if values.dtype.kind == "M":
+                # NaT marks missing dates, e.g. returned by `to_datetime64`.
+                validity = ~np.isnat(values)
+                if not validity.all():
+                    return values.copy(), validity
+            return values.copy(), None
+        if numpy_dtype is None:
+            return values.astype(object), None
+        values = values.tolist()
+
+    if numpy_dtype is not None:
+        # Single pass over the values collects their types, None values
+        # are searched only if they occur.
+        value_types = set(map(type, values))
+        has_nulls = type(None) in value_types
+        value_types.discard(type(None))
+        present = [value for value in values if value is not None] \
+            if has_nulls else values
+        if _compatible_types(value_types, datatype, present):
+            try:
+                buffer = np.array(present, dtype=numpy_dtype)
+            except (OverflowError, TypeError, ValueError):
+                pass
+            else:
+                if not has_nulls:
+                    return buffer, None
+                validity = np.fromiter(
+                    (value is not None for value in values),
+                    dtype=bool,
+                    count=len(values))
+                full_buffer = np.zeros(len(values), dtype=numpy_dtype)
+                full_buffer[validity] = buffer
+                return full_buffer, validity
+    return np.fromiter(values, dtype=object, count=len(values)), None
+
+
+def _compatible_types(value_types, datatype, values):
+    """Check if values of the supplied types can be stored in the typed
+    buffer of a given data type, e.g. int values in the float buffer.
+
+    Args:
+        value_types (set): types of the values, without NoneType.
+        datatype (type): data type of the buffer.
+        values (list): values without None, checked for time zones.
+    """
+    if datatype not in PYTHON_TYPES.values():
+        return True
+    if not value_types <= COMPATIBLE_TYPES[datatype]:
+        return False
+    if datetime in value_types:
+        return all(value.tzinfo is None for value in values
+                   if type(value) is datetime)
+    return True
+
+
+def _arrow_python_type(arrow_type):
+    """Return Python type corresponding to the Arrow data type, or None if
+    values of this type have to be converted one by one.
+    """
+    import pyarrow as pa
+
+    if pa.types.is_integer(arrow_type):
+        return int
+    elif pa.types.is_floating(arrow_type):
+        return float
+    elif pa.types.is_boolean(arrow_type):
+        return bool
+    elif pa.types.is_date(arrow_type):
+        return date
+    elif pa.types.is_timestamp(arrow_type) and arrow_type.tz is None:
+        return datetime
+    elif pa.types.is_string(arrow_type) or pa.types.is_large_string(
+            arrow_type):
+        return str
+    return None
+
+
+def _encode(values, categories=()):
+    """Return codes of the values, sorted array of categories extended with
+    the new values and array mapping codes of the supplied categories
+    to their new codes (its last element maps -1 onto itself).
+
+    Args:
+        values (array-like): values to be encoded, None is coded as -1.
+        categories (array-like, optional): already existing categories.
+            Defaults to ().
+
+    Raises:
+        ValueError: If the values and categories can not be sorted.
+    """
+    codes_map = {category: code for code, category in enumerate(categories)}
+    known_number = len(codes_map)
+    raw_codes = np.fromiter(
+        (-1 if value is None else codes_map.setdefault(value, len(codes_map))
+         for value in values),
+        dtype=np.int64,
+        count=len(values))
+
+    all_categories = list(codes_map)
+    if len(all_categories) == known_number:
+        new_categories = categories
+        order = range(known_number)
+    else:
+        try:
+            order = sorted(range(len(all_categories)),
+                           key=all_categories.__getitem__)
+        except TypeError:
+            raise ValueError("Values of the categorical column must be "
+                             "comparable with each other.")
+        new_categories = _object_array([all_categories[idx] for idx in order])
+
+    if not isinstance(new_categories, np.ndarray):
+        new_categories = _object_array(list(new_categories))
+    mapping = np.empty(len(all_categories) + 1, dtype=np.int32)
+    mapping[list(order)] = np.arange(len(all_categories))
+    mapping[-1] = -1
+    categories_mapping = np.append(mapping[:known_number], np.int32(-1))
+    return mapping[raw_codes], new_categories, categories_mapping
+
+
+def _objects_size(values, exact=False):
+    """Return size of the objects stored in the object array, None values
+    are not counted. Size is estimated on a sample of the objects, unless
+    `exact` is True or there are only a few of them.
+
+    Args:
+        values (numpy.ndarray): object array of values.
+        exact (bool, optional): if True all objects are measured, objects
+            stored several times are counted once. Defaults to False.
+    """
+    if exact or len(values) <= BYTESIZE_SAMPLE_SIZE:
+        seen = set()
+        size = 0
+        for value in values:
+            if value is not None and id(value) not in seen:
+                seen.add(id(value))
+                size += data_helpers.byte_size(value)
+        return size
+
+    positions = np.linspace(0, len(values) - 1, BYTESIZE_SAMPLE_SIZE)
+    sample = values[positions.astype(np.int64)]
+    return round(
+        sum(data_helpers.byte_size(value)
+            for value in sample
+            if value is not None) * len(values) / BYTESIZE_SAMPLE_SIZE)
+
+
+def _with_nulls(values, validity):
+    """Return object array of the values, with None in place of the missing
+    ones, marked by False in the validity mask."""
+    values = values.astype(object)
+    values[~validity] = None
+    return values
+
+
+def _object_array(values):
+    """Return one dimensional NumPy object array of the supplied values."""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+import pybox.datastore.data_column as pbdsdc
+
+import numpy as np
+import operator
+from datetime import date
+
+COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge
+}
+ARITHMETIC_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv
+}
+LOGICAL_OPERATORS = {"&": np.logical_and, "|": np.logical_or}
+
+
+def col(column_name):
+    """Return expression referring to the DataTable column of a given name.
+
+    Expressions can be compared, combined with boolean operators and used
+    to filter DataTable, e.g.:
+
+        table.filter((col("Label") == "Business") & (col("Year") > 2019))
+
+    Args:
+        column_name (str): name of the referred column.
+    """
+    return ColumnExpression("column", column_name)
+
+
+def lit(value):
+    """Return expression representing a literal value.
+
+    Args:
+        value (any): value of the literal.
+    """
+    return ColumnExpression("literal", value)
+
+
+class ColumnExpression:
+    """Tree of operations on DataTable columns, which is evaluated
+    on entire columns at once, producing NumPy arrays.
+
+    Comparisons involving None values are always False, so missing
+    values never meet the filtering condition. Typed columns with missing
+    values are evaluated as NumPy masked arrays, so they are not converted
+    into the object ones.
+    """
+
+    __slots__ = ["operator", "operands"]
+
+    def __init__(self, operator, *operands):
+        """Initialization of the ColumnExpression class.
+
+        Args:
+            operator (str): name of the operation, `column` and `literal`
+                denote leaves of the expression tree.
+            operands (any): operands of the operation, ColumnExpression objects
+                or, for the leaves, column name and literal value.
+        """
+        self.operator = operator
+        self.operands = operands
+
+    def __eq__(self, other):
+        return self._binary("==", other)
+
+    def __ne__(self, other):
+        return self._binary("!=", other)
+
+    def __lt__(self, other):
+        return self._binary("<", other)
+
+    def __le__(self, other):
+        return self._binary("<=", other)
+
+    def __gt__(self, other):
+        return self._binary(">", other)
+
+    def __ge__(self, other):
+        return self._binary(">=", other)
+
+    def __add__(self, other):
+        return self._binary("+", other)
+
+    def __sub__(self, other):
+        return self._binary("-", other)
+
+    def __mul__(self, other):
+        return self._binary("*", other)
+
+    def __truediv__(self, other):
+        return self._binary("/", other)
+
+    def __and__(self, other):
+        return self._binary("&", other)
+
+    def __or__(self, other):
+        return self._binary("|", other)
+
+    def __invert__(self):
+        return ColumnExpression("~", self)
+
+    def __bool__(self):
+        raise TypeError(
+            "ColumnExpression has no truth value, use `&`, `|` and `~` "
+            "instead of `and`, `or` and `not`.")
+
+    __hash__ = None
+
+    def __repr__(self):
+        if self.operator == "column":
+            return f"col({self.operands[0]!r})"
+        elif self.operator == "literal":
+            return repr(self.operands[0])
+        elif self.operator == "~":
+            return f"~{self.operands[0]!r}"
+        elif self.operator == "is_in":
+            return f"{self.operands[0]!r}.is_in({self.operands[1]!r})"
+        elif self.operator == "is_null":
+            return f"{self.operands[0]!r}.is_null()"
+        left, right = self.operands
+        return f"({left!r} {self.operator} {right!r})"
+
+    @property
+    def columns(self):
+        """Return set of column names referred in the expression."""
+        if self.operator == "column":
+            return {self.operands[0]}
+        elif self.operator in ["literal", "is_in"]:
+            return set().union(*[
+                operand.columns
+                for operand in self.operands
+                if isinstance(operand, ColumnExpression)
+            ])
+        return set().union(*[operand.columns for operand in self.operands])
+
+    def is_in(self, values):
+        """Return expression checking if values are in the supplied collection.
+
+        Args:
+            values (iterable): collection of accepted values.
+        """
+        return ColumnExpression("is_in", self, list(values))
+
+    def is_null(self):
+        """Return expression checking if values are missing, e.g.:
+
+            table.filter(~col("Body").is_null())
+        """
+        return ColumnExpression("is_null", self)
+
+    def evaluate(self, table):
+        """Return NumPy array (or scalar for literals) being the result of
+        the expression computed on the supplied DataTable.
+
+        Args:
+            table (DataTable): table containing referred columns.
+        """
+        if self.operator == "column":
+            column = table._data[table.column_index(self.operands[0])]
+            validity = column.validity
+            if validity is None:
+                return column.values
+            return np.ma.MaskedArray(column.data, mask=~validity)
+        elif self.operator == "literal":
+            return self.operands[0]
+        elif self.operator == "is_null":
+            values = self.operands[0].evaluate(table)
+            if not isinstance(values, np.ndarray):
+                return values is None
+            nulls = _null_mask(values)
+            return np.zeros(len(values), dtype=bool) if nulls is None \
+                else nulls
+        elif self.operator == "~":
+            return np.logical_not(_as_mask(self.operands[0].evaluate(table)))
+        elif self.operator == "is_in":
+            codes = self._categorical_codes(table)
+            if codes is not None:
+                column, literal_codes = codes
+                return np.isin(column.codes, literal_codes)
+            values = self.operands[0].evaluate(table)
+            return _null_safe(values, lambda v: np.isin(v, self.operands[1]))
+        elif self.operator in LOGICAL_OPERATORS:
+            left, right = (_as_mask(operand.evaluate(table))
+                           for operand in self.operands)
+            return LOGICAL_OPERATORS[self.operator](left, right)
+
+        if self.operator in ["==", "!="]:
+            codes = self._categorical_codes(table)
+            if codes is not None:
+                column, literal_codes = codes
+                if self.operator == "==":
+                    return np.isin(column.codes, literal_codes)
+                return ~np.isin(column.codes, literal_codes + [-1])
+
+        left, right = (operand.evaluate(table) for operand in self.operands)
+        left, right = _align_dates(left, right)
+        if self.operator in COMPARISON_OPERATORS:
+            function = COMPARISON_OPERATORS[self.operator]
+            return _null_safe_binary(left, right, function, False)
+        return _null_safe_binary(left, right,
+                                 ARITHMETIC_OPERATORS[self.operator], None)
+
+    def mask(self, table):
+        """Return boolean array of the DataTable length, created from
+        the evaluated expression.
+
+        Args:
+            table (DataTable): table containing referred columns.
+        """
+        result = _as_mask(self.evaluate(table))
+        if result.ndim == 0:
+            result = np.full(table.length, bool(result))
+        return result
+
+    def _categorical_codes(self, table):
+        """Return categorical column compared with literal values, together
+        with the list of codes of these values, if the expression compares
+        such a column with literals. Otherwise return None.
+
+        Comparison is then performed on the integer codes, without decoding
+        the column values.
+        """
+        if self.operator == "is_in":
+            column_operand, values = self.operands
+        else:
+            column_operand, literal_operand = self.operands
+            if column_operand.operator == "literal":
+                column_operand, literal_operand = (literal_operand,
+                                                   column_operand)
+            if literal_operand.operator != "literal":
+                return None
+            values = [literal_operand.operands[0]]
+        if column_operand.operator != "column" or None in values:
+            return None
+
+        column = table._data[table.column_index(column_operand.operands[0])]
+        if not isinstance(column, pbdsdc.CategoricalColumn):
+            return None
+        codes = [column.code(value) for value in values]
+        return column, [code for code in codes if code is not None]
+
+    def _binary(self, operator, other):
+        """Return expression combining the current one with the other."""
+        if not isinstance(other, ColumnExpression):
+            other = lit(other)
+        return ColumnExpression(operator, self, other)
+
+
+def _as_mask(values):
+    """Return boolean array from the evaluated expression."""
+    if isinstance(values, np.ma.MaskedArray):
+        values = values.filled(False)
+    values = np.asarray(values)
+    if values.dtype != bool:
+        values = values.astype(bool)
+    return values
+
+
+def _null_mask(values):
+    """Return boolean array marking None (or masked) values, or None if
+    there are none."""
+    if isinstance(values, np.ma.MaskedArray):
+        nulls = np.ma.getmaskarray(values)
+        return nulls if nulls.any() else None
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        nulls = np.fromiter((value is None for value in values),
+                            dtype=bool,
+                            count=len(values))
+        if nulls.any():
+            return nulls
+    return None
+
+
+def _null_safe(values, function, fill_value=False):
+    """Apply function on the array skipping None values, whose results
+    are replaced by the `fill_value`.
+    """
+    nulls = _null_mask(values)
+    if isinstance(values, np.ma.MaskedArray):
+        values = values.data
+    if nulls is None:
+        return function(values)
+    result = np.full(len(values), fill_value,
+                     dtype=bool if isinstance(fill_value, bool) else object)
+    result[~nulls] = function(values[~nulls])
+    return result
+
+
+def _null_safe_binary(left, right, function, fill_value):
+    """Apply binary function on the operands skipping positions in which
+    any of them is None. Results on such positions are replaced by the
+    `fill_value`.
+    """
+    nulls = [
+        nulls for nulls in (_null_mask(left), _null_mask(right))
+        if nulls is not None
+    ]
+    if left is None or right is None:
+        return fill_value
+    left, right = (operand.data if isinstance(operand, np.ma.MaskedArray)
+                   else operand for operand in (left, right))
+    if not nulls:
+        return function(left, right)
+
+    nulls = np.logical_or.reduce(nulls)
+    valid = ~nulls
+    result = np.full(len(nulls), fill_value,
+                     dtype=bool if isinstance(fill_value, bool) else object)
+    result[valid] = function(*(
+        operand[valid] if isinstance(operand, np.ndarray) else operand
+        for operand in (left, right)))
+    return result
+
+
+def _align_dates(left, right):
+    """Convert date/datetime literals into NumPy datetime64 when
+    they are compared with the typed date/datetime columns.
+    """
+    def is_datetime_array(operand):
+        return isinstance(operand, np.ndarray) and operand.dtype.kind == "M"
+
+    if is_datetime_array(left) and isinstance(right, date):
+        right = np.datetime64(right)
+    elif is_datetime_array(right) and isinstance(left, date):
+        left = np.datetime64(left)
+    return left, right
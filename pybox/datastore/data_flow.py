@@ -2,37 +2,203 @@
 from pybox.GLOBALS import GLOBAL_DATA_PATH
 from pybox.datastore.data_table import DataTable
 import pybox.datastore.database as pbdsdb
+import pybox.datastore.data_column as pbdsdc
+import pybox.helpers.data as data_helpers
 
-import pyarrow.parquet as pq
-import numpy as np
-import requests
-import xmltodict
+import os
+from datetime import date, datetime
 
+# Number of rows fetched at once from the SQLite database.
+SQLITE_CHUNK_SIZE = 10000
 
-def table_from_sqlite(table_name, database, database_directory=None):
+
+def table_from_sqlite(table_name,
+                      database,
+                      database_directory=None,
+                      columns=None,
+                      where=None,
+                      parameters=(),
+                      chunk_size=SQLITE_CHUNK_SIZE):
     """Load SQLite table and return it as the `DataTable` object.
 
+    Rows are fetched in chunks, which are converted straight into typed
+    columns, so only a single chunk of rows is kept as Python tuples.
+    Types of the columns are taken from their declared SQLite types, columns
+    declared without a type (or of NUMERIC affinity) get the type recognized
+    from their values, in which ISO 8601 strings are read as dates.
+    Only the selected part of the table can be loaded, e.g.:
+
+        table_from_sqlite("NewsClassification", "AGNEWS",
+                          columns=["Classification", "Lead"],
+                          where="Classification = ?", parameters=(3,))
+
     Args:
 
         table_name (str): name of the SQLite table which will be loaded.
         database (str): name of the SQLite database which will be used.
         database_directory (str, optional): directory in which used SQLite
             database is stored. Defaults to None.
+        columns (list, optional): names of the columns to be loaded, all
+            of them are loaded if None. Defaults to None.
+        where (str, optional): condition of the SQL WHERE clause, values
+            should be supplied as `parameters` instead of being placed
+            in the condition. Defaults to None.
+        parameters (tuple, dict, optional): values bound to the `?` (or named)
+            placeholders of the `where` condition. Defaults to ().
+        chunk_size (int, optional): number of rows fetched at once.
+            Defaults to SQLITE_CHUNK_SIZE.
+
+    Raises:
+        ValueError: If any of the selected columns is not in the table.
+    """
+    if database_directory:
+        conn = pbdsdb.create_connection(database,
+                                        database_directory,
+                                        read_only=True)
+    else:
+        conn = pbdsdb.create_connection(database, read_only=True)
+    with conn:
+        table_columns = pbdsdb.table_columns(conn, table_name)
+        if columns is not None:
+            declared_types = dict(table_columns)
+            missing_columns = [
+                name for name in columns if name not in declared_types
+            ]
+            if missing_columns:
+                raise ValueError(f"Columns {missing_columns} not found "
+                                 f"in the table `{table_name}`.")
+            table_columns = [[name, declared_types[name]] for name in columns]
+
+        query = "SELECT {} FROM {}".format(
+            ", ".join(
+                pbdsdb.quote_identifier(name) for name, _ in table_columns),
+            pbdsdb.quote_identifier(table_name))
+        if where is not None:
+            query = f"{query} WHERE {where}"
+        cursor = conn.execute(query, parameters)
+
+        data_columns = [
+            pbdsdc.DataColumn(datatype=datatype)
+            for _, datatype in table_columns
+        ]
+        rows = cursor.fetchmany(chunk_size)
+        while rows:
+            for data_column, values in zip(data_columns, zip(*rows)):
+                data_column.extend(values)
+            rows = cursor.fetchmany(chunk_size)
+
+    data_map = list()
+    for idx, (name, datatype) in enumerate(table_columns):
+        if datatype is None:
+            # Dates are stored by SQLite as ISO 8601 strings.
+            values = data_columns[idx].to_list()
+            datatype = data_helpers.recognize_type(
+                values, parse_dates=True) if values else object
+            if datatype in [date, datetime]:
+                values = data_helpers.change_types(values, datatype)
+            data_columns[idx] = pbdsdc.DataColumn(values, datatype)
+        data_map.append([name, datatype])
+    return DataTable._from_columns(data_map, data_columns)
+
+
+def table_to_sqlite(table,
+                    table_name,
+                    database,
+                    database_directory=None,
+                    if_exists="fail",
+                    key=None,
+                    batch_size=SQLITE_CHUNK_SIZE,
+                    bulk_load=False):
+    """Store `DataTable` object in the SQLite table. Table is created with
+    the column types corresponding to `DataTable.datatypes` and rows are
+    inserted with `executemany`, every batch in a single transaction, e.g.:
+
+        table_to_sqlite(news, "News", "NEWS", if_exists="append", key="Link")
+
+    Args:
+
+        table (DataTable): data structure that will be saved.
+        table_name (str): name of the SQLite table.
+        database (str): name of the SQLite database which will be used.
+        database_directory (str, optional): directory in which used SQLite
+            database is stored. Defaults to None.
+        if_exists (str, optional): behaviour if the table already exists,
+            `fail` raises ValueError, `replace` drops the table beforehand
+            and `append` inserts rows into it. Defaults to `fail`.
+        key (str, optional): name of the key column, rows with the key
+            already stored in the table are updated instead of being
+            inserted (upsert). Defaults to None.
+        batch_size (int, optional): number of rows inserted in a single
+            transaction. Defaults to SQLITE_CHUNK_SIZE.
+        bulk_load (bool, optional): if true, rows are inserted with
+            `synchronous=NORMAL`, which speeds up large inserts at the cost
+            of durability of the last transactions in the case of a power
+            loss. Defaults to False.
+
+    Raises:
+        ValueError: If `if_exists` is not known, the table exists and
+            `if_exists` is `fail`, or the key is not a column of the table.
     """
+    if if_exists not in ["fail", "replace", "append"]:
+        raise ValueError(f"Not known `if_exists` value: {if_exists}.")
+    if key is not None and key not in table.columns:
+        raise ValueError(f"Key column `{key}` not found in the DataTable.")
+
     if database_directory:
         conn = pbdsdb.create_connection(database, database_directory)
     else:
         conn = pbdsdb.create_connection(database)
-    with conn:
-        cur = conn.cursor()
-        cur.execute(f"SELECT * FROM '{table_name}'")
-        data = cur.fetchall()
-        cur.execute(f"PRAGMA TABLE_INFO('{table_name}')")
-        info = cur.fetchall()
+    quoted_table = pbdsdb.quote_identifier(table_name)
+    quoted_columns = [pbdsdb.quote_identifier(name) for name in table.columns]
+    # Connection is shared, so its synchronous mode is restored afterwards.
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    try:
+        if bulk_load:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+        with conn:
+            table_exists = conn.execute(
+                "SELECT count(name) FROM sqlite_master "
+                "WHERE type='table' AND name=?", (table_name, )).fetchone()[0]
+            if table_exists and if_exists == "fail":
+                raise ValueError(f"Table `{table_name}` already exists.")
+            elif table_exists and if_exists == "replace":
+                conn.execute(f"DROP TABLE {quoted_table}")
+            conn.execute("CREATE TABLE IF NOT EXISTS {} ({})".format(
+                quoted_table, ", ".join(
+                    f"{quoted_column} "
+                    f"{pbdsdb.SQLITE_TYPES.get(datatype, '')}".rstrip()
+                    for quoted_column, datatype in zip(
+                        quoted_columns, table.datatypes.values()))))
+            if key is not None:
+                # Upsert requires the key to be unique.
+                conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS {} ON {} ({})".
+                             format(
+                                 pbdsdb.quote_identifier(
+                                     f"{table_name}_{key}_key"), quoted_table,
+                                 pbdsdb.quote_identifier(key)))
 
-    data_columns = [column[1] for column in info]
+        statement = "INSERT INTO {} ({}) VALUES ({})".format(
+            quoted_table, ", ".join(quoted_columns),
+            ", ".join(["?"] * len(quoted_columns)))
+        if key is not None:
+            statement = "{} ON CONFLICT({}) DO UPDATE SET {}".format(
+                statement, pbdsdb.quote_identifier(key), ", ".join(
+                    f"{quoted_column} = excluded.{quoted_column}"
+                    for quoted_column in quoted_columns))
 
-    return DataTable(np.array(data), names=data_columns)
+        datatypes = list(table.datatypes.values())
+        table_values = [column.values for column in table._data]
+        for start in range(0, table.length, batch_size):
+            columns = [
+                pbdsdb.sqlite_values(
+                    values[start:start + batch_size].tolist(), datatype)
+                for values, datatype in zip(table_values, datatypes)
+            ]
+            with conn:
+                conn.executemany(statement, zip(*columns))
+    finally:
+        conn.execute(f"PRAGMA synchronous={synchronous}")
 
 
 def table_to_parquet(table, file_name, directory=GLOBAL_DATA_PATH):
@@ -47,28 +213,108 @@ def table_to_parquet(table, file_name, directory=GLOBAL_DATA_PATH):
         directory (str, optional): string containing directory in which
             DataTable is going to be saved. Defaults to GLOBAL_DATA_PATH.
     """
+    import pyarrow.parquet as pq
+
     file_path = f"{directory}/{file_name}.parquet"
     arrow_table = table.to_arrow_table
-    pq.write_table(arrow_table, file_path)
+    # File is replaced atomically instead of being overwritten in place,
+    # it may be hard linked with the task cache.
+    temporary_path = f"{file_path}.tmp{os.getpid()}"
+    pq.write_table(arrow_table, temporary_path)
+    os.replace(temporary_path, file_path)
 
 
-def table_from_parquet(file_name, directory=GLOBAL_DATA_PATH):
+def table_from_parquet(file_name,
+                       directory=GLOBAL_DATA_PATH,
+                       columns=None,
+                       filters=None,
+                       categorical=None):
     """Load parquet format file as the `DataTable` object. Function works based
     on the `PyArrow` module, firstly reading file and storing it as an Arrow
-    object and afterwards transforming it into `DataTable`.
+    object and afterwards wrapping its columns with `DataTable`, without
+    converting numeric and timestamp values into Python objects.
+
+    Only selected columns are decoded, and row groups whose statistics
+    exclude the `filters` are skipped without being read, e.g.:
+
+        table_from_parquet("NewsData", columns=["Title", "PublishingDate"],
+                           filters=[("PublishingDate", ">=", date(2021, 1, 1))])
 
     Args:
 
         file_name (str): name of parquet file which will be loaded.
         directory (str, optional): string containing directory in which parquet
             file is stored. Defaults to GLOBAL_DATA_PATH.
+        columns (list, optional): names of the columns to be loaded, all
+            of them are loaded if None. Defaults to None.
+        filters (list, optional): row filters in the `pyarrow.parquet` form,
+            list of `(column, operator, value)` tuples combined with AND,
+            or list of such lists combined with OR. Defaults to None.
+        categorical (list, optional): names of the columns loaded as the
+            categorical ones, see `DataTable.categorize`. Columns written
+            as categorical are loaded this way regardless. Defaults to None.
 
     Returns:
         DataTable: loaded data in a form of DataTable object.
     """
+    import pyarrow.parquet as pq
+
     file_path = f"{directory}/{file_name}.parquet"
-    arrow_table = pq.read_table(file_path)
-    return DataTable(arrow_table.to_pydict())
+    arrow_table = pq.read_table(file_path,
+                                columns=columns,
+                                filters=filters,
+                                read_dictionary=categorical)
+    return DataTable.from_arrow(arrow_table)
+
+
+def iter_parquet_batches(file_name,
+                         directory=GLOBAL_DATA_PATH,
+                         batch_size=65536,
+                         columns=None,
+                         filters=None,
+                         categorical=None):
+    """Return iterator of `DataTable` batches read from the parquet format
+    file. Only a single batch is kept in memory at a time, so files larger
+    than the available memory can be processed, e.g.:
+
+        for batch in iter_parquet_batches("NewsData", columns=["Body"]):
+            ...
+
+    File is opened immediately, so FileNotFoundError is raised on call.
+
+    Args:
+
+        file_name (str): name of parquet file which will be loaded.
+        directory (str, optional): string containing directory in which parquet
+            file is stored. Defaults to GLOBAL_DATA_PATH.
+        batch_size (int, optional): maximum number of rows in a single batch.
+            Defaults to 65536.
+        columns (list, optional): names of the columns to be loaded, all
+            of them are loaded if None. Defaults to None.
+        filters (list, optional): row filters in the `pyarrow.parquet` form,
+            see `table_from_parquet`. Defaults to None.
+        categorical (list, optional): names of the columns loaded as the
+            categorical ones, see `table_from_parquet`. Defaults to None.
+    """
+    import pyarrow.parquet as pq
+
+    file_path = f"{directory}/{file_name}.parquet"
+    if filters is None:
+        batches = pq.ParquetFile(
+            file_path, read_dictionary=categorical).iter_batches(
+                batch_size=batch_size, columns=columns)
+    else:
+        import pyarrow.dataset as ds
+
+        file_format = ds.ParquetFileFormat(read_options=ds.ParquetReadOptions(
+            dictionary_columns=categorical or list()))
+        batches = ds.dataset(file_path, format=file_format).to_batches(
+            columns=columns,
+            filter=pq.filters_to_expression(filters),
+            batch_size=batch_size)
+    return (DataTable.from_arrow(batch)
+            for batch in batches
+            if batch.num_rows)
 
 
 def dict_from_xml(file_name, branch=None):
@@ -82,6 +328,8 @@ def dict_from_xml(file_name, branch=None):
 
                  `/dict_key/child_of_dict_key/child_of_child_of_dict_key/...` 
     """
+    import xmltodict
+
     text = read_text(file_name)
     xml_dict = xmltodict.parse(text)
 
@@ -100,6 +348,8 @@ def read_text(file_name, decoding="utf-8"):
         file_name (str): localization of the file to be read.
         decoding (str, optional): decoding type. Defaults to "utf-8".
     """
+    import requests
+
     try:
         text = requests.get(file_name).content.decode(decoding)
     except ValueError:
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+import pybox.helpers.data as data_helpers
+import pybox.datastore.data_column as pbdsdc
+
+import numpy as np
+
+REDUCERS = [
+    "count", "sum", "mean", "std", "min", "max", "first", "last", "n_unique"
+]
+
+
+class DataTableGroupBy:
+    """Rows of the DataTable grouped by the values of key columns.
+
+    Groups are created with hashing, every row receives an integer code of
+    its group, and reducers are afterwards computed for all groups at once
+    on the column buffers sorted by these codes. Groups are kept in
+    the order of their first appearance in the DataTable, rows with None
+    keys create their own group.
+    """
+
+    def __init__(self, table, keys):
+        """Initialization of the DataTableGroupBy class.
+
+        Args:
+            table (DataTable): table which rows are grouped.
+            keys (str, list): name or list of names of the key columns.
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        self.table = table
+        self.keys = list(keys)
+
+        self.codes = np.zeros(table.length, dtype=np.int64)
+        self.groups_number = min(table.length, 1)
+        for idx, key in enumerate(self.keys):
+            key_codes, key_groups = _column_codes(
+                table._data[table.column_index(key)])
+            if idx == 0:
+                self.codes, self.groups_number = key_codes, key_groups
+            else:
+                self.codes, self.groups_number = factorize(self.codes *
+                                                           key_groups +
+                                                           key_codes)
+
+        # Stable order of rows grouped by their codes is shared by all
+        # reducers, codes follow first appearance, so do the group starts.
+        self.order = np.argsort(self.codes, kind="stable")
+        group_sizes = np.bincount(self.codes, minlength=self.groups_number)
+        self.first_rows = self.order[np.cumsum(group_sizes) - group_sizes]
+
+    def __repr__(self):
+        return (f"DataTableGroupBy(keys={self.keys},"
+                f"groups={self.groups_number})")
+
+    def aggregate(self, aggregations):
+        """Return new DataTable with key columns and aggregated values,
+        one row for each group. Reducers skip None values.
+
+        Aggregations are supplied as a dictionary, whose keys are names
+        of the output columns and values are pairs of the aggregated column
+        name and the reducer, e.g.:
+
+            group_by("Topic").aggregate({
+                "ScoreMean": ("Score", "mean"),
+                "Score": "std",
+                "Words": ("Word", lambda values: ",".join(values))
+            })
+
+        If only the reducer is supplied, column of the output name is used.
+
+        Args:
+            aggregations (dict): output column names and aggregations.
+                Reducer is either one of: `count`, `sum`, `mean`, `std`,
+                `min`, `max`, `first`, `last`, `n_unique`, or a function
+                that receives list of group values and returns single value.
+        """
+        data_map = list()
+        columns = list()
+        for key in self.keys:
+            column_index = self.table.column_index(key)
+            data_map.append(self.table._data_map[column_index])
+            columns.append(self.table._data[column_index].take(
+                self.first_rows))
+
+        for output_name, aggregation in aggregations.items():
+            if isinstance(aggregation, tuple):
+                column_name, reducer = aggregation
+            else:
+                column_name, reducer = output_name, aggregation
+            column = self.table._data[self.table.column_index(column_name)]
+
+            values = self._reduce(column.data, column.is_null(), reducer)
+            datatype = data_helpers.recognize_type(values) if values else object
+            data_map.append([output_name, datatype])
+            columns.append(pbdsdc.DataColumn(values, datatype))
+
+        return type(self.table)._from_columns(data_map, columns)
+
+    def _reduce(self, values, nulls, reducer):
+        """Return list of reduced values, one for each group.
+
+        Args:
+            values (numpy.ndarray): column values of all rows.
+            nulls (numpy.ndarray): boolean array marking missing values,
+                which are skipped.
+            reducer (str, function): reducer name or custom function.
+        """
+        if not callable(reducer) and reducer not in REDUCERS:
+            raise ValueError(
+                f"Wrong reducer supplied: {reducer}, it must be "
+                f"a function or one of: {', '.join(REDUCERS)}.")
+
+        order = self.order
+        if nulls.any():
+            order = order[~nulls[order]]
+        codes = self.codes[order]
+        values = values[order]
+
+        if reducer == "count":
+            return np.bincount(codes, minlength=self.groups_number).tolist()
+
+        reduced = [None] * self.groups_number
+        if len(codes) == 0:
+            return reduced
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        counts = np.diff(np.r_[starts, len(codes)])
+
+        if callable(reducer):
+            results = [
+                reducer(group_values.tolist())
+                for group_values in np.split(values, starts[1:])
+            ]
+        else:
+            if values.dtype == object and reducer in ["sum", "mean", "std"]:
+                values = np.array(values.tolist())
+            results = _REDUCER_FUNCTIONS[reducer](values, starts,
+                                                  counts).tolist()
+
+        for code, result in zip(codes[starts].tolist(), results):
+            reduced[code] = result
+        return reduced
+
+
+def factorize(values):
+    """Return integer codes of the values, numbered in order of their first
+    appearance, and the number of distinct values.
+
+    Args:
+        values (numpy.ndarray): values to be factorized.
+    """
+    if values.dtype == object:
+        codes_map = dict()
+        codes = np.fromiter(
+            (codes_map.setdefault(value, len(codes_map)) for value in values),
+            dtype=np.int64,
+            count=len(values))
+        return codes, len(codes_map)
+
+    _, first_index, inverse = np.unique(values,
+                                        return_index=True,
+                                        return_inverse=True)
+    ranks = np.empty(len(first_index), dtype=np.int64)
+    ranks[np.argsort(first_index, kind="stable")] = np.arange(len(first_index))
+    return ranks[inverse.reshape(-1)], len(first_index)
+
+
+def _column_codes(column):
+    """Return integer codes of the column values and the number of distinct
+    values. Categorical columns are factorized by their codes, missing
+    values of the typed columns receive their own code.
+
+    Args:
+        column (DataColumn): column to be factorized.
+    """
+    if isinstance(column, pbdsdc.CategoricalColumn):
+        return factorize(column.codes)
+    validity = column.validity
+    if validity is None:
+        return factorize(column.data)
+    codes, _ = factorize(column.data)
+    return factorize(np.where(validity, codes, -1))
+
+
+def _sum(values, starts, counts):
+    if values.dtype == bool:
+        values = values.astype(np.int64)
+    return np.add.reduceat(values, starts)
+
+
+def _mean(values, starts, counts):
+    return np.add.reduceat(values.astype(float), starts) / counts
+
+
+def _std(values, starts, counts):
+    """Sample standard deviation, computed in two passes for stability."""
+    values = values.astype(float)
+    means = np.add.reduceat(values, starts) / counts
+    squares = (values - np.repeat(means, counts))**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variances = np.add.reduceat(squares, starts) / (counts - 1)
+    return np.sqrt(np.where(counts > 1, variances, np.nan))
+
+
+def _min(values, starts, counts):
+    return np.minimum.reduceat(values, starts)
+
+
+def _max(values, starts, counts):
+    return np.maximum.reduceat(values, starts)
+
+
+def _first(values, starts, counts):
+    return values[starts]
+
+
+def _last(values, starts, counts):
+    return values[starts + counts - 1]
+
+
+def _n_unique(values, starts, counts):
+    value_codes, values_number = factorize(values)
+    group_codes = np.repeat(np.arange(len(starts)), counts)
+    pairs = np.unique(group_codes * values_number + value_codes)
+    return np.bincount(pairs // values_number, minlength=len(starts))
+
+
+_REDUCER_FUNCTIONS = {
+    "sum": _sum,
+    "mean": _mean,
+    "std": _std,
+    "min": _min,
+    "max": _max,
+    "first": _first,
+    "last": _last,
+    "n_unique": _n_unique
+}
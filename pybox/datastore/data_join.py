@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+import numpy as np
+
+JOIN_TYPES = ["inner", "left", "right", "outer"]
+JOIN_METHODS = ["hash", "merge"]
+
+
+def join_indices(inner_keys,
+                 outer_keys,
+                 join_type="left",
+                 join_method="hash"):
+    """Return pair of arrays with row indices of inner and outer tables,
+    which together create the joined table. Index equal to -1 means that
+    a given row has no counterpart in the particular table.
+
+    Rows are returned in the order of the inner table, each inner row is
+    repeated for every matching outer row (in the order of the outer table).
+    In `right` and `outer` joins outer rows without a match are appended
+    at the end. Keys equal to None never match.
+
+    Args:
+        inner_keys (list, numpy.ndarray): join keys of the inner table rows,
+            multi-column keys should be supplied as tuples.
+        outer_keys (list, numpy.ndarray): join keys of the outer table rows,
+            multi-column keys should be supplied as tuples.
+        join_type (str, optional): one of `inner`, `left`, `right` or
+            `outer`. Defaults to "left".
+        join_method (str, optional): `hash` builds hash table on the outer
+            keys, `merge` requires outer keys to be sorted and locates
+            matches with binary search. Defaults to "hash".
+    """
+    if join_type not in JOIN_TYPES:
+        raise ValueError(f"Wrong join type supplied: {join_type}, "
+                         f"it must be one of: {', '.join(JOIN_TYPES)}.")
+    if join_method == "hash":
+        starts, counts, outer_order = _hash_matches(inner_keys, outer_keys)
+    elif join_method == "merge":
+        starts, counts, outer_order = _merge_matches(inner_keys, outer_keys)
+    else:
+        raise ValueError(f"Wrong join method supplied: {join_method}, "
+                         f"it must be one of: {', '.join(JOIN_METHODS)}.")
+
+    inner_indices, outer_indices = _expand_matches(
+        starts, counts, outer_order, join_type in ["left", "outer"])
+
+    if join_type in ["right", "outer"]:
+        outer_matched = np.zeros(len(outer_keys), dtype=bool)
+        outer_matched[outer_indices[outer_indices >= 0]] = True
+        outer_unmatched = np.flatnonzero(~outer_matched)
+        inner_indices = np.concatenate(
+            [inner_indices,
+             np.full(len(outer_unmatched), -1, dtype=np.int64)])
+        outer_indices = np.concatenate([outer_indices, outer_unmatched])
+
+    return inner_indices, outer_indices
+
+
+def _hash_matches(inner_keys, outer_keys):
+    """Return for every inner key the position of the first match in the
+    `outer_order`, the number of matches and the `outer_order` itself.
+
+    Each distinct outer key receives an integer code from the hash table,
+    afterwards outer rows are grouped by their codes, so all matches
+    of a given inner key occupy a continuous range of the `outer_order`.
+    """
+    buckets = dict()
+    outer_codes = np.fromiter(
+        (-1 if key is None else buckets.setdefault(key, len(buckets))
+         for key in outer_keys),
+        dtype=np.int64,
+        count=len(outer_keys))
+    inner_codes = np.fromiter((buckets.get(key, -1) for key in inner_keys),
+                              dtype=np.int64,
+                              count=len(inner_keys))
+
+    outer_order = np.argsort(outer_codes, kind="stable")
+    sorted_codes = outer_codes[outer_order]
+    starts = np.searchsorted(sorted_codes, inner_codes, side="left")
+    ends = np.searchsorted(sorted_codes, inner_codes, side="right")
+    counts = np.where(inner_codes >= 0, ends - starts, 0)
+    return starts, counts, outer_order
+
+
+def _merge_matches(inner_keys, outer_keys):
+    """Return for every inner key the position of the first match in the
+    `outer_order`, the number of matches and the `outer_order` itself.
+
+    Outer keys must be sorted in ascending order, the ranges of matching
+    keys are found with vectorized binary search.
+    """
+    inner_keys = _keys_array(inner_keys)
+    outer_keys = _keys_array(outer_keys)
+    if inner_keys.dtype != outer_keys.dtype:
+        inner_keys = inner_keys.astype(object)
+        outer_keys = outer_keys.astype(object)
+
+    outer_order = np.flatnonzero(~_null_keys(outer_keys))
+    sorted_keys = outer_keys[outer_order]
+    if not np.all(sorted_keys[:-1] <= sorted_keys[1:]):
+        raise ValueError("Merge join requires outer keys sorted ascending.")
+
+    inner_nulls = _null_keys(inner_keys)
+    if inner_nulls.any():
+        # Null keys are replaced by any valid one, their matches are
+        # discarded afterwards by zeroing the counts.
+        inner_keys = inner_keys.copy()
+        inner_keys[inner_nulls] = sorted_keys[0] if len(sorted_keys) else 0
+    starts = np.searchsorted(sorted_keys, inner_keys, side="left")
+    ends = np.searchsorted(sorted_keys, inner_keys, side="right")
+    counts = np.where(inner_nulls, 0, ends - starts)
+    return starts, counts, outer_order
+
+
+def _expand_matches(starts, counts, outer_order, keep_unmatched):
+    """Return inner and outer row indices created by repeating every inner
+    row for each of its matches.
+
+    Args:
+        starts (numpy.ndarray): positions of the first match in `outer_order`.
+        counts (numpy.ndarray): number of matches of every inner row.
+        outer_order (numpy.ndarray): outer row indices grouped by keys.
+        keep_unmatched (bool): if True inner rows without any match are
+            kept with outer index equal to -1.
+    """
+    matched = counts > 0
+    output_counts = np.where(matched, counts, 1 if keep_unmatched else 0)
+    inner_indices = np.repeat(np.arange(len(counts), dtype=np.int64),
+                              output_counts)
+
+    group_starts = np.cumsum(output_counts) - output_counts
+    offsets = np.arange(len(inner_indices)) - np.repeat(
+        group_starts, output_counts)
+    positions = np.repeat(starts, output_counts) + offsets
+    output_matched = np.repeat(matched, output_counts)
+
+    outer_indices = np.full(len(inner_indices), -1, dtype=np.int64)
+    outer_indices[output_matched] = outer_order[positions[output_matched]]
+    return inner_indices, outer_indices
+
+
+def _keys_array(keys):
+    """Return NumPy array of keys, tuples are kept as single objects."""
+    if isinstance(keys, np.ndarray):
+        return keys
+    return np.fromiter(keys, dtype=object, count=len(keys))
+
+
+def _null_keys(keys):
+    """Return boolean array marking keys equal to None."""
+    if keys.dtype != object:
+        return np.zeros(len(keys), dtype=bool)
+    return np.fromiter((key is None for key in keys),
+                       dtype=bool,
+                       count=len(keys))
@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+import pybox.datastore.data_expression as pbdsde
+
+
+class LazyDataTable:
+    """Lazily evaluated DataTable operations.
+
+    Operations are recorded as steps of a plan, which is optimized and
+    executed at once with `collect`. Optimization consists of:
+
+        - predicate pushdown, filters are moved before sorts, selections,
+          maps of other columns and (when possible) joins, consecutive
+          expression filters are merged into a single mask,
+        - fused per-column maps, consecutive `apply` steps are composed,
+          so every column is transformed in a single pass,
+        - projection pruning, only columns required by the following steps
+          are taken from the source tables, maps of unused columns are
+          skipped.
+
+    Source DataTable is never modified, and its columns are not copied
+    unless they are returned unchanged by the plan.
+    """
+
+    def __init__(self, table, steps=None):
+        """Initialization of the LazyDataTable class.
+
+        Args:
+            table (DataTable): source table of the plan.
+            steps (list, optional): already recorded steps. Defaults to None.
+        """
+        self.table = table
+        self.steps = list(steps) if steps else list()
+
+    def __repr__(self):
+        return f"LazyDataTable({self.table!r},steps={len(self.steps)})"
+
+    def select(self, column_names):
+        """Record selection of the supplied columns, in the same manner
+        as `DataTable.separate_columns`.
+
+        Args:
+            column_names (list): column names to be selected.
+        """
+        return self._add_step("select", list(column_names))
+
+    def filter(self, filtering_function):
+        """Record filtering of the rows, see `DataTable.filter`.
+
+        Args:
+            filtering_function (function, ColumnExpression): used to select
+                rows meeting the condition.
+        """
+        return self._add_step("filter", filtering_function)
+
+    def apply(self, column_name, function):
+        """Record transformation of the column values, see `DataTable.apply`.
+
+        Args:
+            column_name (str): name of the transformed column.
+            function (function): transformation of the single value.
+        """
+        return self._add_step("apply", column_name, function)
+
+    def sort(self, column_names, reverse_order=False, sort_function=None):
+        """Record sorting of the rows, see `DataTable.sort`.
+
+        Args:
+            column_names (list): column names based on which rows are sorted.
+            reverse_order (bool, optional): if True order is descending.
+                Defaults to False.
+            sort_function (function, optional): key of the sort.
+                Defaults to None.
+        """
+        return self._add_step("sort", list(column_names), reverse_order,
+                              sort_function)
+
+    def join(self,
+             outer_data,
+             inner_column,
+             outer_column,
+             join_type="left",
+             join_method="hash"):
+        """Record join with an external DataTable, see `DataTable.join`.
+
+        Args:
+            outer_data (DataTable): external DataTable to be join with.
+            inner_column (str, list): key column name(s) of the inner table.
+            outer_column (str, list): key column name(s) of the outer table.
+            join_type (str, optional): `inner`, `left`, `right` or `outer`.
+                Defaults to "left".
+            join_method (str, optional): `hash` or `merge`. Defaults to "hash".
+        """
+        if isinstance(inner_column, str):
+            inner_column = [inner_column]
+        if isinstance(outer_column, str):
+            outer_column = [outer_column]
+        return self._add_step("join", outer_data, list(inner_column),
+                              list(outer_column), join_type, join_method,
+                              list())
+
+    def group_by(self, column_names):
+        """Record grouping of the rows, which is completed with `aggregate`.
+
+        Args:
+            column_names (str, list): name or list of names of key columns.
+        """
+        if isinstance(column_names, str):
+            column_names = [column_names]
+        return LazyGroupBy(self, list(column_names))
+
+    def explain(self):
+        """Return string describing the optimized plan."""
+        lines = [f"Source: {self.table!r}"]
+        for step in self.optimized_steps():
+            operation, *arguments = step
+            description = ", ".join(map(repr, arguments[:5]))
+            if operation == "join" and step[-1]:
+                description += f", outer filters={step[-1]!r}"
+            lines.append(f"{operation}: {description}")
+        return "\n".join(lines)
+
+    def collect(self):
+        """Execute the optimized plan and return resulting DataTable."""
+        steps = self.optimized_steps()
+        required_after = _required_columns(steps)
+        table = _project(self.table, required_after[0])
+        source_columns = {id(column) for column in self.table._data}
+
+        for step, required in zip(steps, required_after[1:]):
+            operation = step[0]
+            if operation == "select":
+                table = _project(table, step[1])
+            elif operation == "filter":
+                table.filter(step[1])
+            elif operation == "apply":
+                table.apply(step[1], step[2])
+            elif operation == "sort":
+                table.sort(step[1], step[2], step[3])
+            elif operation == "join":
+                table.join(_join_outer_table(step, required), step[2],
+                           step[3], step[4], step[5])
+            elif operation == "aggregate":
+                table = table.group_by(step[1]).aggregate(step[2])
+
+        # Columns passed through the plan untouched are still shared with
+        # the source table, they are copied to keep the source unchanged.
+        table._data = [
+            column.copy() if id(column) in source_columns else column
+            for column in table._data
+        ]
+        return table
+
+    def optimized_steps(self):
+        """Return list of plan steps after optimization."""
+        steps = _push_down_predicates(self.steps, self.table.columns)
+        steps = _merge_filters(steps)
+        steps = _fuse_maps(steps)
+        return _prune_maps(steps)
+
+    def _add_step(self, *step):
+        """Return new LazyDataTable with supplied step appended to the plan."""
+        return LazyDataTable(self.table, self.steps + [step])
+
+
+class LazyGroupBy:
+    """Grouping recorded in the LazyDataTable plan."""
+
+    def __init__(self, lazy_table, column_names):
+        self.lazy_table = lazy_table
+        self.column_names = column_names
+
+    def aggregate(self, aggregations):
+        """Record aggregation of the groups, see `DataTableGroupBy.aggregate`.
+
+        Args:
+            aggregations (dict): output column names and aggregations.
+        """
+        return self.lazy_table._add_step("aggregate", self.column_names,
+                                         dict(aggregations))
+
+
+def _is_expression(condition):
+    return isinstance(condition, pbdsde.ColumnExpression)
+
+
+def _push_down_predicates(steps, columns):
+    """Return steps with filters moved as early in the plan as possible.
+    Filters referring only to the outer table columns of `inner` and `right`
+    joins are moved to the outer table itself, unless these columns exist
+    also in the inner table (their names refer to the inner columns).
+
+    Args:
+        steps (list): steps of the plan.
+        columns (list): column names of the source table.
+    """
+    optimized = list()
+    for step in steps:
+        if step[0] != "filter":
+            optimized.append(step)
+            continue
+
+        position = len(optimized)
+        while position > 0:
+            previous = optimized[position - 1]
+            pushdown = _pushdown_type(
+                step[1], previous,
+                _columns_after(optimized[:position - 1], columns))
+            if pushdown == "before":
+                position -= 1
+                continue
+            elif pushdown == "outer":
+                optimized[position - 1] = (*previous[:-1],
+                                           previous[-1] + [step[1]])
+                position = None
+            break
+        if position is not None:
+            optimized.insert(position, step)
+    return optimized
+
+
+def _pushdown_type(condition, previous, columns):
+    """Return `before` if filter can be moved before the previous step,
+    `outer` if it can be moved to the outer table of the previous join step,
+    or None if it has to stay in place. `columns` are names of the columns
+    available before the previous step.
+    """
+    operation = previous[0]
+    if operation in ["sort", "select"]:
+        return "before"
+    elif not _is_expression(condition):
+        return None
+    elif operation == "apply" and previous[1] not in condition.columns:
+        return "before"
+    elif operation == "join":
+        outer_columns = set(previous[1].columns) - set(previous[3])
+        if (previous[4] in ["inner", "left"]
+                and not condition.columns & outer_columns):
+            return "before"
+        elif (previous[4] in ["inner", "right"]
+              and condition.columns <= outer_columns
+              and not condition.columns & columns):
+            return "outer"
+    return None
+
+
+def _columns_after(steps, columns):
+    """Return set of column names available after the steps, provided that
+    `columns` are available before them."""
+    columns = set(columns)
+    for step in steps:
+        operation = step[0]
+        if operation == "select":
+            columns &= set(step[1])
+        elif operation == "join":
+            columns |= set(step[1].columns) - set(step[3])
+        elif operation == "aggregate":
+            columns = set(step[1]) | set(step[2])
+    return columns
+
+
+def _merge_filters(steps):
+    """Return steps with consecutive expression filters merged into one."""
+    merged = list()
+    for step in steps:
+        if (step[0] == "filter" and merged and merged[-1][0] == "filter"
+                and _is_expression(step[1]) and _is_expression(merged[-1][1])):
+            merged[-1] = ("filter", merged[-1][1] & step[1])
+        else:
+            merged.append(step)
+    return merged
+
+
+def _fuse_maps(steps):
+    """Return steps with consecutive maps composed into one map per column."""
+    fused = list()
+    maps = dict()
+    for step in steps + [("end",)]:
+        if step[0] == "apply":
+            maps.setdefault(step[1], list()).append(step[2])
+            continue
+        for column_name, functions in maps.items():
+            fused.append(("apply", column_name, _compose(functions)))
+        maps = dict()
+        if step[0] != "end":
+            fused.append(step)
+    return fused
+
+
+def _compose(functions):
+    """Return function applying all supplied functions one after another."""
+    if len(functions) == 1:
+        return functions[0]
+
+    def composed(value):
+        for function in functions:
+            value = function(value)
+        return value
+
+    return composed
+
+
+def _prune_maps(steps):
+    """Return steps without maps of columns unused in the rest of the plan."""
+    pruned = list()
+    required = None
+    for step in reversed(steps):
+        if step[0] == "apply" and required is not None \
+                and step[1] not in required:
+            continue
+        pruned.append(step)
+        required = _columns_before(step, required)
+    return list(reversed(pruned))
+
+
+def _required_columns(steps):
+    """Return list of column sets required before each of the steps and
+    at the end of the plan. None means that all columns are required.
+    """
+    required = [None]
+    for step in reversed(steps):
+        required.insert(0, _columns_before(step, required[0]))
+    return required
+
+
+def _columns_before(step, required):
+    """Return set of columns required before the step, provided that
+    `required` columns (None meaning all) are needed after it.
+    """
+    operation = step[0]
+    if operation == "select":
+        return set(step[1]) if required is None else required & set(step[1])
+    elif operation == "aggregate":
+        columns = set(step[1])
+        for output_name, aggregation in step[2].items():
+            columns.add(aggregation[0] if isinstance(aggregation, tuple)
+                        else output_name)
+        return columns
+    elif required is None:
+        return None
+    elif operation == "filter":
+        if not _is_expression(step[1]):
+            return None
+        return required | step[1].columns
+    elif operation == "apply":
+        return required | {step[1]}
+    elif operation == "sort":
+        if step[3] is not None:
+            return None
+        return required | set(step[1])
+    elif operation == "join":
+        return required | set(step[2])
+    return required
+
+
+def _project(table, column_names):
+    """Return DataTable sharing columns with the supplied one, limited to
+    `column_names` (in the table order), or all of them if it is None.
+    """
+    if column_names is None:
+        return type(table)._from_columns(table._data_map, table._data)
+    column_names = set(column_names)
+    selected = [
+        (column_map, column)
+        for column_map, column in zip(table._data_map, table._data)
+        if column_map[0] in column_names
+    ]
+    return type(table)._from_columns([column_map for column_map, _ in selected],
+                                     [column for _, column in selected])
+
+
+def _join_outer_table(step, required):
+    """Return outer table of the join step, pruned to required columns
+    and filtered with the pushed down predicates.
+
+    Args:
+        step (tuple): join step of the plan.
+        required (set): columns required after the join, None if all.
+    """
+    _, outer_data, _, outer_column, _, _, outer_filters = step
+    if required is not None:
+        required = required | set(outer_column)
+        for outer_filter in outer_filters:
+            required = required | outer_filter.columns
+    outer_table = _project(outer_data, required)
+    for outer_filter in outer_filters:
+        outer_table.filter(outer_filter)
+    return outer_table
@@ -2,84 +2,151 @@
 import pybox.helpers.data as data_helpers
 import pybox.datastore.data_to_html as pbdsdth
 import pybox.datastore.data_table_row as pbdsdtr
+import pybox.datastore.data_column as pbdsdc
+import pybox.datastore.data_join as pbdsdj
+import pybox.datastore.data_expression as pbdsde
+import pybox.datastore.data_group as pbdsdg
+import pybox.datastore.data_plan as pbdsdp
 
+import numpy as np
 from copy import deepcopy
 from datetime import date, datetime
 from math import ceil, floor
-from tabulate import tabulate
-from tqdm import tqdm
 
-DATA_TYPES = [int, float, complex, bool, str, type(None), date, datetime]
+DATA_TYPES = [
+    int, float, complex, bool, str, type(None), date, datetime, object
+]
 
 
 class DataTable:
-    """Data structure with typed columns and mutable entities."""
+    """Data structure with typed columns and mutable entities.
 
-    __slots__ = ["_data", "_data_map"]
+    Values are stored column-major, each column is a `DataColumn` holding
+    a typed NumPy buffer (or an object one for text and mixed data).
+    Positions of the columns are additionally indexed by their names,
+    so the column lookup is performed in constant time. Slices of rows and
+    lists of columns, e.g. `table[100:200]` or `table[["A", "B"]]`, share
+    buffers with the table, copying them only on in-place modification.
+    """
+
+    __slots__ = ["_data", "_data_map", "_columns_index"]
 
     def __init__(self, data=None, names=None, dtypes=None):
-        DATA_TYPES.append(self.__class__)
+        if self.__class__ not in DATA_TYPES:
+            DATA_TYPES.append(self.__class__)
         self._data = list()
         self._data_map = list()
 
-        if isinstance(data, dict):
-            self._data = list(map(list, zip(*data.values())))
+        columns = list()
+        if _is_arrow_data(data):
+            arrow_table = DataTable.from_arrow(data)
+            self._data_map = arrow_table._data_map
+            self._data = arrow_table._data
+            self._reindex_columns()
+            return
+        elif isinstance(data, dict):
+            columns = list(data.values())
             if not names:
                 names = list(data.keys())
         elif type(data).__module__ == "numpy":
-            self._data = data.tolist()
+            columns = list(map(list, zip(*data.tolist())))
 
-        if self.length == 0 or data is None:
+        if not columns or len(columns[0]) == 0:
             if names and dtypes:
                 for name, dtype in zip(names, dtypes):
                     self._data_map.append([name, dtype])
+                    self._data.append(pbdsdc.DataColumn(datatype=dtype))
             else:
                 raise ValueError(
                     "If data not supplied, both `names` and `dtypes` must not be none."
                 )
         else:
-            for column_idx in range(len(self._data[0])):
-                self._data_map.append([
-                    names[column_idx],
-                    data_helpers.recognize_type(
-                        (self._data[row_idx][column_idx]
-                         for row_idx in range(len(self._data))))
-                ])
+            for name, values in zip(names, columns):
+                datatype = data_helpers.recognize_type(values)
+                self._data_map.append([name, datatype])
+                self._data.append(pbdsdc.DataColumn(values, datatype))
+        self._reindex_columns()
+
+    @classmethod
+    def from_arrow(cls, arrow_data):
+        """Return DataTable wrapping columns of the supplied Arrow table.
+        Numeric and timestamp columns without missing values share memory
+        with Arrow buffers, no Python objects are created for them.
+
+        Args:
+            arrow_data (pyarrow.Table, dict): Arrow table or dictionary
+                of column names and Arrow arrays (or chunked arrays).
+        """
+        if isinstance(arrow_data, dict):
+            arrays = arrow_data.items()
+        else:
+            arrays = zip(arrow_data.column_names, arrow_data.columns)
+
+        data_map = list()
+        columns = list()
+        for name, array in arrays:
+            column, datatype = pbdsdc.DataColumn.from_arrow(array)
+            data_map.append([name, datatype])
+            columns.append(column)
+        return cls._from_columns(data_map, columns)
+
+    @classmethod
+    def _from_columns(cls, data_map, columns):
+        """Return DataTable built directly from already prepared columns.
+
+        Args:
+            data_map (list): list of [column name, data type] pairs.
+            columns (list): `DataColumn` objects in the order of `data_map`.
+        """
+        table = cls.__new__(cls)
+        table._data_map = [list(column_map) for column_map in data_map]
+        table._data = list(columns)
+        table._reindex_columns()
+        return table
 
     def __getitem__(self, key):
         if isinstance(key, tuple):
             name, index = key
-            return self._data[index][self.column_index(name)]
+            return self._data[self.column_index(name)][index]
         elif isinstance(key, str):
-            return [
-                self._data[index][self.column_index(key)]
-                for index in range(self.length)
-            ]
+            return self._data[self.column_index(key)].to_list()
+        elif isinstance(key, slice):
+            return self.shared_copy(rows=key)
+        elif isinstance(key, list):
+            return self.shared_copy(column_names=key)
+        raise ValueError(
+            "The wrong key type was supplied, it should be `str` or pair "
+            "of `str` and `int`, slice of rows or list of column names.")
 
     def __setitem__(self, key, value):
         if isinstance(key, tuple):
             name, idx = key
-            if name not in self.columns:
+            if name not in self._columns_index:
                 self.insert_column(name, [None] * self.length, type(value))
             try:
-                self._data[idx][self.column_index(name)] = value
+                self._data[self.column_index(name)].set_item(idx, value)
             except IndexError:
                 self.remove_columns([name])
                 raise IndexError("List assignment index out of range.")
         elif isinstance(key, str):
-            if key not in self.columns:
+            if key not in self._columns_index:
                 self.insert_column(key, [None] * self.length, type(value))
+            column_index = self.column_index(key)
 
             if isinstance(value, list) or isinstance(value, tuple):
+                if len(value) > self.length:
+                    raise IndexError("List assignment index out of range.")
                 datatype = data_helpers.recognize_type(value)
-                for index, element in enumerate(value):
-                    self._data[index][self.column_index(key)] = (
-                        data_helpers.change_type(element, datatype))
+                column = pbdsdc.DataColumn(
+                    data_helpers.change_types(value, datatype), datatype)
+                column.extend(self._data[column_index].values[len(value):])
+                self._data[column_index] = column
+                self._data_map[column_index][1] = datatype
             else:
-                self._data[0][self.column_index(key)] = value
-                for idx in range(1, self.length):
-                    self._data[idx][self.column_index(key)] = None
-                self._data_map[self.column_index(key)][1] = object
+                self._data[column_index] = pbdsdc.DataColumn(
+                    [None] * self.length, object)
+                self._data[column_index].set_item(0, value)
+                self._data_map[column_index][1] = object
         else:
             raise ValueError(
                 "The wrong key type was supplied, it should be `str`",
@@ -104,7 +171,9 @@ class DataTable:
     @property
     def length(self):
         """Return length of the DataTable, in other words number of rows in it."""
-        return len(self._data)
+        if not self._data:
+            return 0
+        return len(self._data[0])
 
     @property
     def width(self):
@@ -123,41 +192,94 @@ class DataTable:
 
     @property
     def bytesize(self):
-        """Returns the approximate memory DataTable footprint."""
-        return data_helpers.byte_size(self._data) + data_helpers.byte_size(
-            self._data_map)
+        """Returns the approximate memory DataTable footprint, see
+        `memory_usage`."""
+        return sum(column.nbytes for column in self._data) + \
+            data_helpers.byte_size(self._data_map)
 
     @property
     def info(self):
-        """Return information about shape and bytesize of the DataTable."""
+        """Return information about shape and bytesize of the DataTable,
+        together with data types and bytesizes of its columns."""
+        columns_sizes = [column.nbytes for column in self._data]
+        bytesize = sum(columns_sizes) + data_helpers.byte_size(self._data_map)
         info = ("DataTable"
                 f"(shape={self.width}x{self.length},"
-                f"bytesize={self.bytesize})")
-        for name, dtype in self.datatypes.items():
-            info = "".join([info, "\n", name, ": ", dtype.__name__])
+                f"bytesize={bytesize})")
+        for (name, dtype), size in zip(self._data_map, columns_sizes):
+            info = "".join(
+                [info, "\n", name, ": ", dtype.__name__, f" ({size} B)"])
         return info
 
+    def memory_usage(self, exact=False):
+        """Return a dictionary of column names and memory footprints of
+        the columns in bytes. Sizes of the typed buffers are exact, while
+        sizes of the values in the object columns are estimated on a sample
+        of them, so the footprint is computed without walking all objects.
+
+        Args:
+            exact (bool, optional): if True sizes of all objects stored
+                in the object columns are measured. Defaults to False.
+        """
+        return {
+            column_name: column.memory_usage(exact)
+            for (column_name, _), column in zip(self._data_map, self._data)
+        }
+
+    def shared_copy(self, column_names=None, rows=None):
+        """Return copy of the DataTable sharing column buffers with the current
+        one, buffers are copied only when they are modified in place. Copy
+        can be limited to the selected columns and range of rows, which is
+        also available as slicing, e.g. `table[100:200]` or
+        `table[["A", "B"]]`. No values are copied in either case.
+
+        Args:
+            column_names (list, optional): names of the columns in the copy,
+                in the returned order. Defaults to None, in which case all
+                columns are kept.
+            rows (slice, optional): range of the rows in the copy.
+                Defaults to None, in which case all rows are kept.
+        """
+        if column_names is None:
+            selected = range(self.width)
+        else:
+            selected = [self.column_index(name) for name in column_names]
+        return DataTable._from_columns(
+            [self._data_map[idx] for idx in selected],
+            [self._data[idx].view(rows) for idx in selected])
+
     @property
     def to_numpy_array(self):
         """Return numpy structured array object created from the DataTable."""
-        from numpy import array
-
         types_list = list(self.datatypes.items())
-        numpy_array = array(self._data, dtype=types_list)
+        numpy_array = np.array(
+            list(zip(*(column.to_list() for column in self._data))),
+            dtype=types_list)
         return numpy_array
 
     @property
     def to_arrow_table(self):
-        """Return arrow table object created from the DataTable."""
-        from pyarrow import Table, array
+        """Return arrow table object created from the DataTable. Buffers
+        of numeric and timestamp columns are shared, not copied."""
+        from pyarrow import Table
 
         arrow_table = Table.from_arrays(
-            [array(column) for column in list(map(list, zip(*self._data)))],
-            names=self.columns)
+            [column.to_arrow() for column in self._data], names=self.columns)
         return arrow_table
 
+    def lazy(self):
+        """Return lazily evaluated version of the DataTable. Operations
+        called on it are recorded, optimized and executed at once with
+        `collect`, e.g.:
+
+            table.lazy().filter(col("Label") == "Business").apply(
+                "Body", str.lower).sort(["PublishingDate"]).collect()
+        """
+        return pbdsdp.LazyDataTable(self)
+
     def rows(self):
         """Returns rows interable which called, displays progress bar."""
+        from tqdm import tqdm
         return (
             pbdsdtr.DataTableRow(self, row) for row in tqdm(range(self.length)))
 
@@ -178,16 +300,21 @@ class DataTable:
             rows_number (int, optional): rows number to print. Defaults to 10.
             text_format (str, optional): string output format. Defaults to `simple`.
         """
+        from tabulate import tabulate
         if self.length <= rows_number:
-            data_subset = self._data
+            data_subset = [self._row_values(idx) for idx in self.rows_range()]
             indices = True
         else:
             lower_bound = ceil(rows_number / 2)
             upper_bound = self.length - floor(rows_number / 2)
 
             data_subset = [
-                *self._data[:lower_bound], [None for _ in range(self.width)],
-                *self._data[upper_bound:]
+                *[self._row_values(idx) for idx in range(lower_bound)],
+                [None for _ in range(self.width)],
+                *[
+                    self._row_values(idx)
+                    for idx in range(upper_bound, self.length)
+                ]
             ]
             indices = [
                 *[i for i in range(lower_bound)], "..",
@@ -236,11 +363,12 @@ class DataTable:
         Args:
             column_name (str): name of the specified column.
         """
-        for column_index, element in enumerate(self._data_map):
-            if element[0] == column_name:
-                return column_index
-        raise IndexError(
-            f"A column called `{column_name}` has not been found in DataTable.")
+        try:
+            return self._columns_index[column_name]
+        except KeyError:
+            raise IndexError(
+                f"A column called `{column_name}` has not been found in DataTable."
+            )
 
     def rows_range(self, start=None, stop=None, step=None):
         """Return an iterator containing the range of DataTable indices.
@@ -272,15 +400,15 @@ class DataTable:
             column_value (any): value of the newly created column.
             datatype (type, optional): data type of supplied data. Defaults to None.
         """
-        if column_name in self.columns:
+        if column_name in self._columns_index:
             raise NameError("Supplied column name already exists.")
 
         length_difference = self.length - len(column_values)
         if length_difference > 0:
-            column_values.extend([None] * length_difference)
+            column_values = [*column_values, *[None] * length_difference]
         elif length_difference < 0:
-            for _ in range(abs(length_difference)):
-                self._data.append([None] * self.width)
+            for column in self._data:
+                column.extend([None] * abs(length_difference))
 
         if not datatype:
             datatype = data_helpers.recognize_type(column_values)
@@ -291,13 +419,13 @@ class DataTable:
                 )
 
         if column_index is None:
-            column_index = self.length
-        for idx in range(self.length):
-            self._data[idx].insert(
-                column_index,
-                data_helpers.change_type(column_values[idx], datatype))
+            column_index = self.width
+        column = pbdsdc.DataColumn(
+            data_helpers.change_types(column_values, datatype), datatype)
 
+        self._data.insert(column_index, column)
         self._data_map.insert(column_index, [column_name, datatype])
+        self._reindex_columns()
 
     def separate_columns(self, column_names):
         """Create copy of a DataTable only with supplied columns.
@@ -305,12 +433,30 @@ class DataTable:
         Args:
             column_names (list): column names to be separated.
         """
-        data_copy = self.copy
-        columns_to_remove = [
-            col for col in self.columns if col not in column_names
+        columns_to_keep = set(column_names)
+        selected = [
+            idx for idx, (column_name, _) in enumerate(self._data_map)
+            if column_name in columns_to_keep
         ]
-        data_copy.remove_columns(columns_to_remove)
-        return data_copy
+        return DataTable._from_columns(
+            [self._data_map[idx] for idx in selected],
+            [self._data[idx].copy() for idx in selected])
+
+    def categorize(self, column_names):
+        """Convert in place selected columns into the categorical ones,
+        storing every distinct value once and integer codes for the rows.
+        It decreases memory footprint of the columns repeating a handful
+        of values and speeds up their filtering, grouping and sorting.
+
+        Args:
+            column_names (list): names of the columns to be converted.
+        """
+        for column_name in column_names:
+            column_index = self.column_index(column_name)
+            column = self._data[column_index]
+            if not isinstance(column, pbdsdc.CategoricalColumn):
+                self._data[column_index] = pbdsdc.CategoricalColumn(
+                    column.values)
 
     def remove_columns(self, column_names):
         """Remove selected columns from the DataTable.
@@ -319,12 +465,11 @@ class DataTable:
             column_names (list): column names to be removed.
         """
         for column_name in column_names:
-            for idx, column_map in enumerate(self._data_map):
-                if column_map[0] == column_name:
-                    self._data_map.remove(column_map)
-                    for row_idx in range(self.length):
-                        del self._data[row_idx][idx]
-                    break
+            if column_name in self._columns_index:
+                idx = self._columns_index[column_name]
+                del self._data_map[idx]
+                del self._data[idx]
+                self._reindex_columns()
 
     def insert_row(self, row_values, row_index=None):
         """Insert a row into the DataTable object.
@@ -337,13 +482,13 @@ class DataTable:
             raise ValueError(
                 "Supplied row needs to be the same width as DataTable",
                 f", which is {self.width}.")
-        for idx, value in enumerate(row_values):
-            row_values[idx] = data_helpers.change_type(value,
-                                                       self._data_map[idx][1])
 
         if row_index is None:
             row_index = self.length
-        self._data.insert(row_index, row_values)
+        for column, (_, datatype), value in zip(self._data, self._data_map,
+                                                row_values):
+            column.insert(row_index,
+                          data_helpers.change_type(value, datatype))
 
     def rename_columns(self, old_names, new_names):
         """Rename selected column names.
@@ -356,6 +501,7 @@ class DataTable:
         for column_map in self._data_map:
             if column_map[0] in columns_dict.keys():
                 column_map[0] = columns_dict[column_map[0]]
+        self._reindex_columns()
 
     def sort(self, column_names, reverse_order=False, sort_function=None):
         """Sort in place the DataTable based on the supplied column name values.
@@ -368,47 +514,101 @@ class DataTable:
             sort_function (function, optional): function that allows to pass
                 additional commands to the sorter. Defaults to None.
         """
+        sorting_columns = set(column_names)
         other_columns = [
-            column for column, _ in self._data_map if column not in column_names
+            column for column, _ in self._data_map
+            if column not in sorting_columns
         ]
-        data_to_sort = []
-        new_data_map = []
-        for column in column_names + other_columns:
-            data_to_sort.append([
-                self._data[index][self.column_index(column)]
-                for index in range(self.length)
-            ])
-            new_data_map.append([column, self.datatypes[column]])
-
-        data_to_sort = list(map(list, zip(*data_to_sort)))
-        self._data_map = new_data_map
-        self._data = sorted(data_to_sort,
-                            key=sort_function,
-                            reverse=reverse_order)
+        new_order = [
+            self.column_index(column)
+            for column in column_names + other_columns
+        ]
+        self._data_map = [self._data_map[idx] for idx in new_order]
+        self._data = [self._data[idx] for idx in new_order]
+        self._reindex_columns()
+
+        if sort_function is None:
+            rows_order = self._sorting_order(column_names or self.columns,
+                                             reverse_order)
+        else:
+            rows = list(
+                map(list, zip(*(column.to_list() for column in self._data))))
+            rows_order = sorted(self.rows_range(),
+                                key=lambda idx: sort_function(rows[idx]),
+                                reverse=reverse_order)
+        self._data = [column.take(rows_order) for column in self._data]
 
     def filter(self, filtering_function, return_filtered_out=False):
         """Filters in place the DataTable rows, removing rows which do not
         meet condition from provided functiom. If `return_filtered_out` is
         True method additionaly returns object with filtered out rows.
 
+        Condition can be supplied as a column expression, e.g.:
+
+            table.filter((col("Label") == "Business") & (col("Year") > 2019))
+
+        which is evaluated on entire columns at once, instead of calling
+        the function on every single row.
+
         Args:
-            filtering_function (function): used to select rows meeting the
-                condition set in the function.
+            filtering_function (function, ColumnExpression): used to select
+                rows meeting the condition set in the function.
             return_filtered_out (bool, optional): indicating whether to save
                 the filtered rows in a separate table. Defaults to False.
         """
+        if isinstance(filtering_function, pbdsde.ColumnExpression):
+            mask = filtering_function.mask(self)
+        else:
+            mask = np.fromiter(
+                (bool(filtering_function(row)) for row in self),
+                dtype=bool,
+                count=self.length)
+        if return_filtered_out:
+            filtered_out = DataTable._from_columns(
+                self._data_map, [column.take(~mask) for column in self._data])
+        self._data = [column.take(mask) for column in self._data]
         if return_filtered_out:
-            filtered_out = self.copy
-            for index, row in reversed(list(enumerate(self))):
-                if not filtering_function(row):
-                    del self._data[index]
-                else:
-                    del filtered_out._data[index]
             return filtered_out
-        else:
-            for index, row in reversed(list(enumerate(self))):
-                if not filtering_function(row):
-                    del self._data[index]
+
+    def drop_nulls(self, column_names=None):
+        """Remove in place rows containing missing values in any of
+        the selected columns.
+
+        Args:
+            column_names (list, optional): names of the checked columns.
+                Defaults to None, in which case all columns are checked.
+        """
+        if column_names is None:
+            column_names = self.columns
+        nulls = np.zeros(self.length, dtype=bool)
+        for column_name in column_names:
+            nulls |= self._missing_mask(self.column_index(column_name))
+        if nulls.any():
+            self._data = [column.take(~nulls) for column in self._data]
+
+    def fill_null(self, value, column_names=None):
+        """Replace in place missing values of the selected columns with
+        the supplied value, converted to the data type of each column if it
+        is compatible with it. Columns of other data types are converted
+        into the object ones.
+
+        Args:
+            value (any): value replacing the missing ones.
+            column_names (list, optional): names of the filled columns.
+                Defaults to None, in which case all columns are filled.
+        """
+        if column_names is None:
+            column_names = self.columns
+        for column_name in column_names:
+            column_index = self.column_index(column_name)
+            datatype = self._data_map[column_index][1]
+            fill_value = value
+            if type(value) in pbdsdc.COMPATIBLE_TYPES.get(datatype, ()):
+                fill_value = data_helpers.change_type(value, datatype)
+            column = self._data[column_index].fill_null(fill_value)
+            if self._data[column_index].is_typed and not column.is_typed:
+                self._data_map[column_index][1] = object
+            self._data[column_index] = column
 
     def create_dummies(self, column_name, remove_in_place=True):
         """Convert specified column containing categorical variables into
@@ -419,26 +619,46 @@ class DataTable:
             remove_in_place (bool, optional): if True after creating new dummy
                 columns original column is deleted. Defaults to True.
         """
-        levels = set(self[column_name])
-        levels.discard(None)
-        levels = sorted(levels, reverse=True)
         main_column_index = self.column_index(column_name)
+        main_column = self._data[main_column_index]
+        missing_values = self._missing_mask(main_column_index)
+        if isinstance(main_column, pbdsdc.CategoricalColumn):
+            # Dummies are compared on codes, levels are the used categories.
+            main_values = main_column.codes
+            level_codes = np.unique(main_values[main_values >= 0])[::-1]
+            levels = zip(main_column.categories[level_codes].tolist(),
+                         level_codes)
+        else:
+            main_values = main_column.data
+            levels = set(main_column.to_list())
+            levels.discard(None)
+            levels = [(level, level) for level in sorted(levels, reverse=True)]
 
-        for level in levels:
+        for level, level_value in levels:
             level_column_name = "".join([column_name, str(level)])
-            self.insert_column(level_column_name, [None] * self.length,
-                               datatype=int,
-                               column_index=main_column_index + 1)
-            for idx in self.rows_range():
-                if self._data[idx][main_column_index] is None:
-                    continue
-                elif self._data[idx][main_column_index] == level:
-                    self._data[idx][self.column_index(level_column_name)] = 1
-                else:
-                    self._data[idx][self.column_index(level_column_name)] = 0
+            if level_column_name in self._columns_index:
+                raise NameError("Supplied column name already exists.")
+            dummies = (main_values == level_value).astype(np.int64)
+            self._data.insert(
+                main_column_index + 1,
+                pbdsdc.DataColumn.from_buffer(dummies, ~missing_values))
+            self._data_map.insert(main_column_index + 1,
+                                  [level_column_name, int])
+            self._reindex_columns()
         if remove_in_place:
             self.remove_columns([column_name])
 
+    def group_by(self, column_names):
+        """Group the DataTable rows by the values of supplied columns.
+        Aggregated DataTable can be afterwards created with `aggregate`, e.g.:
+
+            table.group_by("Topic").aggregate({"ScoreMean": ("Score", "mean")})
+
+        Args:
+            column_names (str, list): name or list of names of key columns.
+        """
+        return pbdsdg.DataTableGroupBy(self, column_names)
+
     def concatenate(self, outer_data, inner_columns=None, outer_columns=None):
         """Concatenate the DataTable with an external one.
 
@@ -455,39 +675,77 @@ class DataTable:
             outer_columns = outer_data.columns
 
         columns_dict = dict(zip(inner_columns, outer_columns))
-        for row in outer_data:
-            row_to_append = []
-            for column in self.columns:
-                if column in columns_dict.keys():
-                    row_to_append.append(row[columns_dict[column]])
-                else:
-                    row_to_append.append(None)
-            self._data.append(row_to_append)
-
-    def join(self, outer_data, inner_column, outer_column):
-        """Join the DataTable with an external one.
+        outer_length = outer_data.length
+        for (column_name, _), column in zip(self._data_map, self._data):
+            if column_name in columns_dict.keys():
+                column.extend(outer_data._data[outer_data.column_index(
+                    columns_dict[column_name])])
+            else:
+                column.extend([None] * outer_length)
+
+    def join(self,
+             outer_data,
+             inner_column,
+             outer_column,
+             join_type="left",
+             join_method="hash"):
+        """Join in place the DataTable with an external one. Columns of the
+        external DataTable, except the ones it is joined on, are appended to
+        the DataTable. Every row is repeated for each matching external row.
 
         Args:
             outer_data (DataTable): external DataTable to be join with.
-            inner_column (str): name of the column in the inner DataTable,
-                based on which join is to be performed
-            outer_column (str): name of the column in the outer DataTable,
-                based on which join is to be performed
+            inner_column (str, list): name of the column in the inner DataTable
+                (or list of names), based on which join is to be performed
+            outer_column (str, list): name of the column in the outer DataTable
+                (or list of names), based on which join is to be performed
+            join_type (str, optional): one of `inner`, `left`, `right` or
+                `outer`. In `right` and `outer` joins inner key columns of
+                the rows without a match are filled with the outer key values,
+                categorical key columns stay categorical. Defaults to "left".
+            join_method (str, optional): `hash` for hash join or `merge` for
+                sort-merge join, which requires the outer DataTable to be
+                sorted by the key columns. Defaults to "hash".
         """
-        outer_data_copy = outer_data.copy
-        outer_data_copy.rename_columns([outer_column], ["OuterMainColumn"])
-        outer_data_copy.sort(["OuterMainColumn"])
-        outer_data_width = outer_data_copy.width
-        self._data_map.extend(outer_data_copy._data_map)
-
-        for idx in self.rows_range():
-            position = data_helpers.binary_search(
-                outer_data_copy["OuterMainColumn"], self[inner_column, idx])
-            if position is None:
-                self._data[idx].extend([None] * outer_data_width)
-            else:
-                self._data[idx].extend(outer_data_copy._data[position])
-        self.remove_columns(["OuterMainColumn"])
+        if isinstance(inner_column, str):
+            inner_column = [inner_column]
+        if isinstance(outer_column, str):
+            outer_column = [outer_column]
+        if len(inner_column) != len(outer_column):
+            raise ValueError(
+                "Inner and outer join keys need to have the same length.")
+
+        inner_indices, outer_indices = pbdsdj.join_indices(
+            self._join_keys(inner_column, join_method),
+            outer_data._join_keys(outer_column, join_method), join_type,
+            join_method)
+
+        new_data = [
+            column.take(inner_indices, fill_missing=True)
+            for column in self._data
+        ]
+        inner_missing = inner_indices < 0
+        if inner_missing.any():
+            for inner_name, outer_name in zip(inner_column, outer_column):
+                column_index = self.column_index(inner_name)
+                values = new_data[column_index].to_list()
+                outer_values = outer_data._data[outer_data.column_index(
+                    outer_name)].take(outer_indices[inner_missing])
+                for position, value in zip(np.flatnonzero(inner_missing),
+                                           outer_values.to_list()):
+                    values[position] = value
+                # Filled key column keeps its kind, e.g. stays categorical.
+                new_data[column_index] = type(new_data[column_index])(
+                    values, self._data_map[column_index][1])
+
+        outer_keys = set(outer_column)
+        for (name, datatype), column in zip(outer_data._data_map,
+                                            outer_data._data):
+            if name not in outer_keys:
+                self._data_map.append([name, datatype])
+                new_data.append(column.take(outer_indices, fill_missing=True))
+        self._data = new_data
+        self._reindex_columns()
 
     def apply(self, column_name, function):
         """Apply supplied transformation on all values in the selected column.
@@ -499,6 +757,94 @@ class DataTable:
                 performed on the selected column.
         """
         column_index = self.column_index(column_name)
-        for index in self.rows_range():
-            self._data[index][column_index] = function(
-                self._data[index][column_index])
+        self._data[column_index] = pbdsdc.DataColumn(
+            list(map(function, self._data[column_index].to_list())),
+            self._data_map[column_index][1])
+
+    def _join_keys(self, column_names, join_method="hash"):
+        """Return join keys of the DataTable rows. Multi-column keys are
+        returned as tuples, keys containing None are replaced by None.
+
+        Args:
+            column_names (list): names of the key columns.
+            join_method (str, optional): for `merge` method single typed
+                column is returned as NumPy array. Defaults to "hash".
+        """
+        columns = [self._data[self.column_index(name)] for name in column_names]
+        if len(columns) == 1:
+            if (join_method == "merge" and columns[0].is_typed
+                    and columns[0].validity is None):
+                return columns[0].values
+            return columns[0].to_list()
+        return [
+            None if None in key else key
+            for key in zip(*(column.to_list() for column in columns))
+        ]
+
+    def _reindex_columns(self):
+        """Rebuild the index mapping column names to their positions. If the
+        name is duplicated, the position of its first occurrence is stored.
+        """
+        self._columns_index = dict()
+        for column_index, (column_name, _) in enumerate(self._data_map):
+            self._columns_index.setdefault(column_name, column_index)
+
+    def _row_values(self, row_index):
+        """Return list of values stored in the row under supplied index.
+
+        Args:
+            row_index (int): index of the row.
+        """
+        return [column[row_index] for column in self._data]
+
+    def _missing_mask(self, column_index):
+        """Return boolean array marking None values of the selected column.
+
+        Args:
+            column_index (int): index of the column.
+        """
+        return self._data[column_index].is_null()
+
+    def _sorting_order(self, column_names, reverse_order=False):
+        """Return indices that stably sort the DataTable rows, based on
+        the supplied column name values.
+
+        Each column is ranked with `numpy.unique`, which allows to sort
+        text and date columns the same way as the numeric ones. Categorical
+        columns are ranked by their codes. Missing values precede all
+        the others, or follow them in the reverse order.
+
+        Args:
+            column_names (list): column names based on which sorting
+                is performed, first one is the primary key.
+            reverse_order (bool, optional): value that indicates whether
+                the order should be descending. Defaults to False.
+        """
+        sorting_keys = list()
+        for column_name in reversed(column_names):
+            column = self._data[self.column_index(column_name)]
+            if isinstance(column, pbdsdc.CategoricalColumn):
+                ranks = column.codes
+            else:
+                nulls = column.is_null()
+                if nulls.any():
+                    ranks = np.full(len(column), -1, dtype=np.int64)
+                    _, ranks[~nulls] = np.unique(column.data[~nulls],
+                                                 return_inverse=True)
+                else:
+                    _, ranks = np.unique(column.data, return_inverse=True)
+            if reverse_order:
+                ranks = ranks.max(initial=0) - ranks
+            sorting_keys.append(ranks)
+        if not sorting_keys:
+            return np.arange(self.length)
+        return np.lexsort(sorting_keys)
+
+
+def _is_arrow_data(data):
+    """Check if data is an Arrow table or a dictionary of Arrow arrays."""
+    if isinstance(data, dict):
+        return bool(data) and all(
+            type(values).__module__.startswith("pyarrow")
+            for values in data.values())
+    return type(data).__module__.startswith("pyarrow")
@@ -7,25 +7,30 @@ from datetime import datetime, date
 class DataTableRow:
     """Auxiliary class of DataTable objects used for rows operations."""
 
+    __slots__ = ["row_index", "instance"]
+
     def __init__(self, instance, row_index):
         self.row_index = row_index
         self.instance = instance
 
-        self.content = {
-            column_name: self.instance._data[self.row_index][column_index]
-            for column_index, (column_name,
-                               _) in enumerate(self.instance._data_map)
+    @property
+    def content(self):
+        """Return a dictionary of column names and row values."""
+        return {
+            column_name: column[self.row_index]
+            for (column_name, _), column in zip(self.instance._data_map,
+                                                self.instance._data)
         }
 
     def __getitem__(self, key):
         if isinstance(key, str):
             column_index = self.instance.column_index(key)
-            return self.instance._data[self.row_index][column_index]
+            return self.instance._data[column_index][self.row_index]
         else:
-            return self.instance._data[self.row_index]
+            return self.instance._row_values(self.row_index)
 
     def __setitem__(self, key, value):
-        if key not in self.instance.columns:
+        if key not in self.instance._columns_index:
             self.instance.insert_column(key, [], datatype=type(value))
         column_index = self.instance.column_index(key)
 
@@ -40,7 +45,8 @@ class DataTableRow:
             transformed_value = to_datetime(value)
         else:
             transformed_value = column_type(value)
-        self.instance._data[self.row_index][column_index] = transformed_value
+        self.instance._data[column_index].set_item(self.row_index,
+                                                   transformed_value)
 
     def __repr__(self):
         return f"DataTableRow({self.content})"
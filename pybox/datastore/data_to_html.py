@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 from math import ceil, floor
 from random import sample
-from IPython.core.display import display, HTML
 
 
 def show_table(data, data_map, rows_number, string_length=255):
@@ -18,7 +17,7 @@ def show_table(data, data_map, rows_number, string_length=255):
         string_length (int, optional): maximal length of returned string, 
             if None entire string is printed. Defaults to 255.
     """
-    data_length = len(data)
+    data_length = len(data[0]) if data else 0
 
     html_table_fragment = _create_table_header(data_map)
     if data_length > rows_number:
@@ -37,7 +36,7 @@ def show_table(data, data_map, rows_number, string_length=255):
                                                  string_length)
 
     html_table_fragment = "".join([html_table_fragment, "</table>"])
-    display(HTML(html_table_fragment))
+    _display_html(html_table_fragment)
 
 
 def show_table_random(data, data_map, rows_number, string_length=255):
@@ -55,7 +54,7 @@ def show_table_random(data, data_map, rows_number, string_length=255):
         string_length (int, optional): maximal length of returned string, 
             if None entire string is printed. Defaults to 255.
     """
-    data_length = len(data)
+    data_length = len(data[0]) if data else 0
 
     html_table_fragment = _create_table_header(data_map)
     if data_length > rows_number:
@@ -68,7 +67,7 @@ def show_table_random(data, data_map, rows_number, string_length=255):
                                                  string_length)
 
     html_table_fragment = "".join([html_table_fragment, "</table>"])
-    display(HTML(html_table_fragment))
+    _display_html(html_table_fragment)
 
 
 def show_table_head(data, data_map, rows_number, string_length=255):
@@ -85,7 +84,7 @@ def show_table_head(data, data_map, rows_number, string_length=255):
         string_length (int, optional): maximal length of returned string, 
             if None entire string is printed. Defaults to 255.
     """
-    data_length = len(data)
+    data_length = len(data[0]) if data else 0
 
     html_table_fragment = _create_table_header(data_map)
     if data_length > rows_number:
@@ -100,7 +99,7 @@ def show_table_head(data, data_map, rows_number, string_length=255):
                                                  string_length)
 
     html_table_fragment = "".join([html_table_fragment, "</table>"])
-    display(HTML(html_table_fragment))
+    _display_html(html_table_fragment)
 
 
 def show_table_tail(data, data_map, rows_number, string_length=255):
@@ -117,7 +116,7 @@ def show_table_tail(data, data_map, rows_number, string_length=255):
         string_length (int, optional): maximal length of returned string, 
             if None entire string is printed. Defaults to 255.
     """
-    data_length = len(data)
+    data_length = len(data[0]) if data else 0
 
     html_table_fragment = _create_table_header(data_map)
     if data_length > rows_number:
@@ -131,7 +130,7 @@ def show_table_tail(data, data_map, rows_number, string_length=255):
                                                  string_length)
 
     html_table_fragment = "".join([html_table_fragment, "</table>"])
-    display(HTML(html_table_fragment))
+    _display_html(html_table_fragment)
 
 
 def _create_table_header(data_map):
@@ -177,7 +176,7 @@ def _create_table_body(html_table_fragment, data, data_map, iterator,
         for column_index, _ in enumerate(data_map):
             html_table_fragment = "".join([
                 html_table_fragment, "<td style='text-align:left;'>",
-                _cell_interior(data[index][column_index], string_length),
+                _cell_interior(data[column_index][index], string_length),
                 "</td>\n"
             ])
         html_table_fragment = "".join([html_table_fragment, "</tr>\n"])
@@ -215,3 +214,11 @@ def _add_dotted_row(html_table_fragment, data_map):
             [html_table_fragment, "<td style='text-align:left;'>...</td>\n"])
     html_table_fragment = "".join([html_table_fragment, "</tr>\n"])
     return html_table_fragment
+
+
+def _display_html(html_table_fragment):
+    """Display the html table in the notebook, IPython is imported only
+    here since importing it is slow."""
+    from IPython.core.display import display, HTML
+
+    display(HTML(html_table_fragment))
@@ -1,48 +1,182 @@
 #!/usr/bin/env python
 from pybox.GLOBALS import GLOBAL_DATA_PATH
 
+import os
 import sqlite3
 import logging
+import threading
+from datetime import date, datetime
+from urllib.request import pathname2url
 
+# Pragmas applied to every opened connection: memory-mapped reads
+# of up to 256 MiB and page cache of up to 64 MiB.
+CONNECTION_PRAGMAS = ["mmap_size=268435456", "cache_size=-65536"]
+# Number of prepared statements cached by a single connection.
+STATEMENT_CACHE_SIZE = 256
 
-def create_connection(database_name, database_directory=GLOBAL_DATA_PATH):
-    """Creates a SQLite database connection.
+# SQLite column types declared for the columns of a given Python type.
+SQLITE_TYPES = {
+    int: "INTEGER",
+    bool: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    bytes: "BLOB",
+    date: "DATE",
+    datetime: "TIMESTAMP"
+}
+
+_LOCAL = threading.local()
+
+
+def create_connection(database_name,
+                      database_directory=GLOBAL_DATA_PATH,
+                      read_only=False):
+    """Return SQLite database connection, which is reused by the subsequent
+    calls made from the same thread (SQLite connections can not be shared
+    between threads) for the same database, so it should not be closed.
+
+    Connections are opened with the performance pragmas and cache prepared
+    statements of up to STATEMENT_CACHE_SIZE queries. Writable connections
+    switch the database into the write-ahead log mode, in which readers
+    do not block the writer.
 
     Args:
         database_name (string): database name without file extension.
         database_directory (string, optional): directory in which database
             is/would be stored. Defaults to GLOBAL_DATA_PATH.
+        read_only (bool, optional): if true, database is opened in read-only
+            mode, which allows many parallel readers. Defaults to False.
     """
-    database = "".join([database_directory, "\\", database_name, ".db"])
+    database = database_path(database_name, database_directory)
+    connections = _thread_connections()
+    connection = connections.get((database, read_only))
+    if connection is not None:
+        return connection
 
-    connection = None
     try:
-        connection = sqlite3.connect(database)
+        if read_only:
+            connection = sqlite3.connect(
+                f"file:{pathname2url(database)}?mode=ro",
+                uri=True,
+                cached_statements=STATEMENT_CACHE_SIZE)
+        else:
+            connection = sqlite3.connect(
+                database, cached_statements=STATEMENT_CACHE_SIZE)
+            connection.execute("PRAGMA journal_mode=WAL")
+        for pragma in CONNECTION_PRAGMAS:
+            connection.execute(f"PRAGMA {pragma}")
         logging.info(
             f"Connection with {database_name} database created successfully.")
     except sqlite3.Error as error:
         logging.error(error)
+        return None
 
+    connections[(database, read_only)] = connection
     return connection
 
 
+def close_connections():
+    """Close all connections opened by the current thread."""
+    connections = _thread_connections()
+    for connection in connections.values():
+        connection.close()
+    connections.clear()
+
+
+def database_path(database_name, database_directory=GLOBAL_DATA_PATH):
+    """Return path of the SQLite database file.
+
+    Args:
+        database_name (string): database name without file extension.
+        database_directory (string, optional): directory in which database
+            is/would be stored. Defaults to GLOBAL_DATA_PATH.
+    """
+    return os.path.join(database_directory, f"{database_name}.db")
+
+
 def check_if_table_exists(table_name,
                           database_name,
                           database_directory=GLOBAL_DATA_PATH):
+    """Check if in a given SQLite database exists certain table.
+
+    Args:
+        table_name (str): name of the SQLite table.
+        database_name (string): database name without file extension.
+        database_directory (string, optional): directory in which database
+            is stored. Defaults to GLOBAL_DATA_PATH.
+    """
+    conn = create_connection(database_name, database_directory)
+    cursor = conn.execute(
+        "SELECT count(name) FROM sqlite_master WHERE type='table' AND name=?",
+        (table_name, ))
+    return cursor.fetchone()[0] == 1
+
+
+def table_columns(connection, table_name):
+    """Return list of [name, type] pairs of the SQLite table columns, where
+    type is the Python type corresponding to the declared column type,
+    or None if values of the column may be of any type.
+
+    Args:
+        connection (sqlite3.Connection): connection with the database.
+        table_name (str): name of the SQLite table.
+
+    Raises:
+        ValueError: If there is no table of a given name.
+    """
+    cursor = connection.execute(
+        f"PRAGMA table_info({quote_identifier(table_name)})")
+    columns = [[column[1], _declared_type(column[2])]
+               for column in cursor.fetchall()]
+    if not columns:
+        raise ValueError(f"Table `{table_name}` not found in the database.")
+    return columns
+
+
+def sqlite_values(values, datatype):
+    """Return list of values converted to the types supported by SQLite.
+    Dates are stored as ISO 8601 strings, values of the other unsupported
+    types as their string representations.
+
+    Args:
+        values (list): values of a single column.
+        datatype (type): data type of the column.
+    """
+    if datatype in [int, float, str, bytes]:
+        return values
+    elif datatype is bool:
+        return [value if value is None else int(value) for value in values]
+    return [
+        value if value is None or type(value) in [int, float, str, bytes] else
+        value.isoformat() if isinstance(value, (date, datetime)) else
+        str(value) for value in values
+    ]
+
+
+def quote_identifier(name):
+    """Return SQLite identifier (e.g. table or column name) quoted, so it
+    can be safely placed in the SQL statement."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _declared_type(declared_type):
+    """Return Python type of the values stored in the column of a given
+    declared type, following the SQLite type affinity rules."""
+    declared_type = (declared_type or "").upper()
+    if "INT" in declared_type:
+        return int
+    elif any(name in declared_type for name in ["CHAR", "CLOB", "TEXT"]):
+        return str
+    elif any(name in declared_type for name in ["REAL", "FLOA", "DOUB"]):
+        return float
+    # BLOB and NUMERIC affinity columns may store values of any type.
+    return None
+
 
-    # Check if in a given SQLite database exists certain table.
-    conn = create_connection(database_name)
-    with conn:
-        cur = conn.cursor()
-        cur.execute(f"""
-            SELECT count(name)
-            FROM sqlite_master
-            WHERE type='table'
-            AND name='{table_name}'
-        """)
-        check_result = cur.fetchone()[0]
-
-    if check_result == 1:
-        return True
-    else:
-        return False
+def _thread_connections():
+    """Return dictionary of the connections opened by the current thread.
+    Connections inherited from the parent process are not reused."""
+    if getattr(_LOCAL, "pid", None) != os.getpid():
+        _LOCAL.pid = os.getpid()
+        _LOCAL.connections = dict()
+    return _LOCAL.connections
@@ -62,7 +62,7 @@ def setup_datasets(ngrams, vocabulary=None, include_unk=False):
     Returns:
         [type]: [description]
     """
-    connection = pbdsdb.create_connection("AGNEWS")
+    connection = pbdsdb.create_connection("AGNEWS", read_only=True)
     with connection:
         cur = connection.cursor()
         cur.execute("SELECT Classification,Lead,Body FROM NewsClassification")
@@ -1,28 +1,103 @@
 #!/usr/bin/env python
-from pybox.helpers.date import to_date, to_datetime
+from pybox.helpers.date import to_date, to_datetime, to_datetime64
 
 import re
+from random import Random
 from sys import getsizeof
-from itertools import chain
+from math import ceil, log
 from bisect import bisect_left
-from operator import itemgetter
 from datetime import datetime, date
+from itertools import chain, islice
+
+# Sample of the values inspected by `recognize_type` contains, with
+# RECOGNITION_CONFIDENCE probability, a value of every type making up
+# at least RECOGNITION_TOLERANCE of all values (919 values by default).
+RECOGNITION_CONFIDENCE = 0.99
+RECOGNITION_TOLERANCE = 0.005
+# Numeric types in the order of their promotion.
+NUMERIC_TYPES = [int, float, complex]
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+ISO_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}"
+                          r"(:\d{2}(\.\d{1,6})?)?(Z|[+-]\d{2}:?\d{2})?$")
+
+
+def recognize_type(vector,
+                   confidence=RECOGNITION_CONFIDENCE,
+                   tolerance=RECOGNITION_TOLERANCE,
+                   parse_dates=False):
+    """Return recognized type of the data from the supplied list.
 
+    Type is recognized on a bounded sample of the values, drawn uniformly
+    from the list (or on the prefix of the iterable without a length).
+    Sample is large enough to contain, with probability `confidence`,
+    a value of every type making up at least `tolerance` of the values.
+    Types of the sampled values are promoted to the common one: int, float
+    and complex to the widest of them, date and datetime to datetime and
+    all other mixed types to object. None values are skipped, NoneType
+    is returned if there are no other values.
+
+    Args:
+        vector (list, iterable): vector from which type is to be recognized.
+        confidence (float, optional): probability that the sample contains
+            every type making up at least `tolerance` of the values.
+            Defaults to RECOGNITION_CONFIDENCE.
+        tolerance (float, optional): share of the values below which
+            a type may be missed. Defaults to RECOGNITION_TOLERANCE.
+        parse_dates (bool, optional): if True strings in the ISO 8601 date
+            or datetime format are recognized as date or datetime values.
+            Defaults to False.
+    """
+    sample_size = ceil(log(1 - confidence) / log(1 - tolerance))
+    if not hasattr(vector, "__len__"):
+        sample = list(islice(vector, sample_size))
+    elif len(vector) <= sample_size:
+        sample = vector
+    else:
+        positions = Random(len(vector)).sample(range(len(vector)),
+                                               sample_size)
+        sample = [vector[position] for position in positions]
+
+    vector_types = set(map(type, sample))
+    vector_types.discard(type(None))
+    if parse_dates and vector_types == {str}:
+        vector_types = _recognize_date_strings(sample)
+    return promote_types(vector_types)
 
-def recognize_type(vector):
-    """Return recognized type of the data from the supplied list.
+
+def promote_types(types):
+    """Return common type of the values of supplied types: the widest
+    of the numeric types, datetime for date and datetime values,
+    NoneType if there are no types and object for all other mixtures.
 
     Args:
-        vector (list): vector from which type is to be recognized.
+        types (iterable): types of the values.
     """
-    vector_types = {}
-    for element in vector:
-        try:
-            vector_types[type(element)] += 1
-        except KeyError:
-            vector_types[type(element)] = 0
-    recognized_type = max(vector_types.items(), key=itemgetter(1))[0]
-    return recognized_type
+    types = set(types)
+    if not types:
+        return type(None)
+    elif len(types) == 1:
+        return types.pop()
+    elif types <= set(NUMERIC_TYPES):
+        return max(types, key=NUMERIC_TYPES.index)
+    elif types <= {date, datetime}:
+        return datetime
+    return object
+
+
+def _recognize_date_strings(strings):
+    """Return set of types of the supplied strings, in which str is
+    replaced by date or datetime if they are in the ISO 8601 format."""
+    date_types = set()
+    for string in strings:
+        if string is None:
+            continue
+        elif ISO_DATE.match(string):
+            date_types.add(date)
+        elif ISO_DATETIME.match(string):
+            date_types.add(datetime)
+        else:
+            return {str}
+    return date_types
 
 
 def change_type(value, target_type):
@@ -44,6 +119,20 @@ def change_type(value, target_type):
         return target_type(value)
 
 
+def change_types(values, target_type):
+    """Return values transformed to a given type, see `change_type`. Values
+    transformed to date or datetime are returned as NumPy datetime64 array
+    (with NaT in place of None values), strings are parsed in bulk.
+
+    Args:
+        values (list): values that types are going to be changed.
+        target_type (type): target type of supplied values.
+    """
+    if target_type in [date, datetime]:
+        return to_datetime64(values, target_type)
+    return [change_type(value, target_type) for value in values]
+
+
 def binary_search(lookup_list, lookup_value, low_end=0, high_end=None):
     """Return index of the searched value in the supplied list, or None value
     if one does not occur in it.
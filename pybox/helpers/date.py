@@ -1,8 +1,18 @@
 #!/usr/bin/env python
 from dateutil import tz
 from dateutil.parser import parse
+import numpy as np
+import warnings
+from functools import lru_cache
 from datetime import datetime, date, timedelta
 
+# Number of distinct strings, whose parsed values are memoized.
+DATE_CACHE_SIZE = 65536
+# Number of strings checked and parsed by NumPy at once.
+DATE_CHUNK_SIZE = 65536
+# Length of the longest ISO 8601 string parsed by NumPy, with nanoseconds.
+ISO_MAX_LENGTH = 29
+
 
 def to_date(date_input):
     """Return date object created from supplied input.
@@ -14,8 +24,10 @@ def to_date(date_input):
         return None
     elif isinstance(date_input, datetime):
         return date_input.date()
+    elif isinstance(date_input, date):
+        return date_input
     else:
-        return parse(date_input, default=date.min)
+        return _parse_date(date_input)
 
 
 def to_datetime(date_input):
@@ -26,11 +38,59 @@ def to_datetime(date_input):
     """
     if date_input is None:
         return None
+    elif isinstance(date_input, datetime):
+        return to_local_time_zone(date_input)
     elif isinstance(date_input, date):
         return to_local_time_zone(
             datetime.combine(date_input, datetime.min.time()))
     else:
-        return to_local_time_zone(parse(date_input))
+        return _parse_datetime(date_input)
+
+
+def to_datetime64(date_inputs, datatype=datetime):
+    """Return NumPy array of the supplied inputs transformed into dates
+    (`datetime64[D]`) or datetimes (`datetime64[us]`), None values are
+    transformed into NaT.
+
+    Strings strictly matching ISO 8601 format without time zone
+    (`YYYY-MM-DD` optionally followed by the time) are parsed by NumPy
+    at once, in chunks of DATE_CHUNK_SIZE strings. All other inputs,
+    including partial dates like `2021` or `20210301`, are transformed
+    one by one with `to_date` or `to_datetime`, which memoize results
+    for the repeated strings and use `dateutil` for non-ISO formats.
+
+    Args:
+        date_inputs (list): strings, date-like objects or None values.
+        datatype (type, optional): date or datetime. Defaults to datetime.
+    """
+    unit = "D" if datatype is date else "us"
+    transform = to_date if datatype is date else to_datetime
+    date_inputs = np.fromiter(date_inputs,
+                              dtype=object,
+                              count=len(date_inputs))
+    result = np.full(len(date_inputs), "NaT", dtype=f"datetime64[{unit}]")
+
+    is_string = np.fromiter(
+        (type(date_input) is str for date_input in date_inputs),
+        dtype=bool,
+        count=len(date_inputs))
+    transformed = ~is_string
+    string_positions = np.flatnonzero(is_string)
+    for start in range(0, len(string_positions), DATE_CHUNK_SIZE):
+        positions = string_positions[start:start + DATE_CHUNK_SIZE]
+        strings = date_inputs[positions]
+        iso = _iso_strings(strings)
+        parsed = _parse_iso_strings(strings[iso])
+        if parsed is None:
+            iso[:] = False
+        if iso.any():
+            result[positions[iso]] = parsed.astype(result.dtype)
+        transformed[positions[~iso]] = True
+
+    for position in np.flatnonzero(transformed):
+        if date_inputs[position] is not None:
+            result[position] = transform(date_inputs[position])
+    return result
 
 
 def to_local_time_zone(date_input):
@@ -57,3 +117,80 @@ def create_dates_list(ending_date, starting_date):
         ending_date - timedelta(days=i)
         for i in range((ending_date - starting_date).days + 1)
     ]
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_datetime(date_string):
+    """Return datetime in the local time zone parsed from the string, ISO 8601
+    strings are parsed without `dateutil`."""
+    try:
+        parsed = datetime.fromisoformat(date_string)
+    except (TypeError, ValueError):
+        parsed = parse(date_string)
+    return to_local_time_zone(parsed)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(date_string):
+    """Return date parsed from the string, ISO 8601 strings are parsed
+    without `dateutil`."""
+    try:
+        parsed = datetime.fromisoformat(date_string)
+    except (TypeError, ValueError):
+        parsed = parse(date_string)
+    return parsed.date()
+
+
+def _parse_iso_strings(strings):
+    """Return `datetime64[us]` array parsed by NumPy from the object array
+    of ISO 8601 strings without time zone, or None if any of the strings
+    can not be parsed this way.
+
+    Args:
+        strings (numpy.ndarray): object array of strings.
+    """
+    with warnings.catch_warnings():
+        # Strings with time zone are parsed by NumPy with a warning
+        # and converted into UTC, instead of the local time zone.
+        warnings.simplefilter("error")
+        try:
+            return strings.astype("datetime64[us]")
+        except (ValueError, Warning):
+            return None
+
+
+def _iso_strings(strings):
+    """Return boolean array marking strings strictly matching ISO 8601 format
+    without time zone, i.e. `YYYY-MM-DD` optionally followed by `T` or space
+    and the time consisting of digits, colons and a dot. Characters of the
+    fixed-width string array are compared column by column, without
+    iterating over the strings.
+
+    Args:
+        strings (numpy.ndarray): object array of strings.
+    """
+    iso = np.zeros(len(strings), dtype=bool)
+    lengths = np.fromiter(map(len, strings),
+                          dtype=np.int64,
+                          count=len(strings))
+    candidates = np.flatnonzero((lengths >= 10) & (lengths <= ISO_MAX_LENGTH))
+    if not len(candidates):
+        return iso
+
+    fixed_width = strings[candidates].astype(str)
+    width = fixed_width.dtype.itemsize // 4
+    characters = fixed_width.view(np.uint32).reshape(len(candidates), width)
+    digits = (characters >= ord("0")) & (characters <= ord("9"))
+    matching = (digits[:, [0, 1, 2, 3, 5, 6, 8, 9]].all(axis=1) &
+                (characters[:, 4] == ord("-")) &
+                (characters[:, 7] == ord("-")))
+    if width > 10:
+        # Strings shorter than the array width are padded with zeros.
+        separator = characters[:, 10]
+        time_part = characters[:, 11:]
+        matching &= ((separator == 0) | (separator == ord("T")) |
+                     (separator == ord(" ")))
+        matching &= (digits[:, 11:] | (time_part == ord(":")) |
+                     (time_part == ord(".")) | (time_part == 0)).all(axis=1)
+    iso[candidates] = matching
+    return iso
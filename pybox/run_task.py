@@ -1,21 +1,26 @@
 #!/usr/bin/env python
-from pybox.GLOBALS import BOXES_PATH
+from pybox.GLOBALS import configure_logging
+import pybox.task_registry as pbtr
 
-import os
 import re
-import ast
 import runpy
 import argparse
 import logging
 import importlib.util
 
+_TASK_REGISTRY = None
+
 
 def run_selected_module(supplied_task_name,
                         inputs_directory=None,
                         outputs_directory=None,
                         show_task_info=False,
                         settings=None,
-                        settings_path=None):
+                        settings_path=None,
+                        use_cache=True,
+                        resolve_inputs=True,
+                        task_io=None,
+                        profile=False):
     """Function used to execute a task distinguished by a specific name.
 
     Args:
@@ -30,6 +35,16 @@ def run_selected_module(supplied_task_name,
             each string contains the name of the setting and its value, they
             are separated from each other by a colon. Defaults to None.
         settings_path (str, optional):
+        use_cache (bool, optional): if true, the task (as well as tasks
+            producing its inputs) is skipped when its outputs are up to date
+            in the task cache. Defaults to True.
+        resolve_inputs (bool, optional): if true, tasks producing inputs
+            of the task are run beforehand. Defaults to True.
+        task_io (dict, optional): if supplied, the task is not run, instead
+            names of its `inputs` and `outputs` are stored in this dictionary.
+            Defaults to None.
+        profile (bool, optional): if true, cProfile statistics of the task
+            are saved in the outputs directory. Defaults to False.
     """
     if settings_path is not None:
         settings = _read_settings_file(settings_path)
@@ -39,24 +54,15 @@ def run_selected_module(supplied_task_name,
         "OUTPUTS_DIRECTORY": outputs_directory,
         "SHOW_TASK_INFO": show_task_info,
         "SUPPLIED_TASK_NAME": supplied_task_name,
-        "SETTINGS": settings
+        "SETTINGS": settings,
+        "USE_CACHE": use_cache,
+        "RESOLVE_INPUTS": resolve_inputs,
+        "TASK_IO": task_io,
+        "PROFILE": profile
     }
 
-    # Finding all python files which contains application's tasks.
-    task_files = list()
-    for path, subdirs, files in os.walk(BOXES_PATH):
-        for name in files:
-            if name.endswith(".py") and name != "__init__.py":
-                task_files.append(os.path.join(path, name))
-
-    task_file_to_run = None
-    for task_file in task_files:
-        if task_file_to_run is None:
-            if _task_name_registered_in_file(task_file, supplied_task_name):
-                task_file_to_run = task_file
-        else:
-            break
-
+    task_registry().refresh()
+    task_file_to_run = find_task_file(supplied_task_name)
     if task_file_to_run is not None:
         globals_dict = _update_globals(task_file_to_run, globals_dict)
         runpy.run_path(task_file_to_run, init_globals=globals_dict)
@@ -65,6 +71,25 @@ def run_selected_module(supplied_task_name,
             f"The task called `{supplied_task_name}` has not been found.")
 
 
+def find_task_file(supplied_task_name):
+    """Return path of the file in which task of a given name is registered,
+    or None if there is no such task.
+
+    Args:
+        supplied_task_name (str): name of the searched task.
+    """
+    return task_registry().find(supplied_task_name)
+
+
+def task_registry():
+    """Return registry of the application's tasks, which is loaded once
+    per process and refreshed by every `run_selected_module` call."""
+    global _TASK_REGISTRY
+    if _TASK_REGISTRY is None:
+        _TASK_REGISTRY = pbtr.TaskRegistry()
+    return _TASK_REGISTRY
+
+
 def _read_settings_file(settings_path):
     """Reads settings from provided python module.
 
@@ -83,46 +108,6 @@ def _read_settings_file(settings_path):
     return settings_module.create_settings()
 
 
-def _task_name_registered_in_file(task_file, supplied_task_name):
-    """
-    Auxiliary function to check if a given file containing AnalyticPy task,
-    has been registered under name supplied from command line.
-
-    Args:
-        task_file (string): complete path and name of a task file to check.
-        supplied_task_name (string): name of the task selected for execution.
-
-    Returns:
-        bool: True if `supplied_task_name` in `task_file`, otherwise False.
-    """
-    check_value = False
-    # Splits are performed to separate parameters from task name
-    # (if parameters exist). At this stage they should not be relevant.
-    supplied_task_name = supplied_task_name.split("(")[0]
-
-    with open(task_file) as task_script:
-        node = ast.parse(task_script.read())
-
-        # Only top-level assignments are selected from each module,
-        # since this is how Task instances are created.
-        assign_objects = [n for n in node.body if isinstance(n, ast.Assign)]
-        for assign_object in assign_objects:
-            if isinstance(assign_object.value, ast.Call):
-                # For each found assignment, it is checked whether
-                # the assignedvalue is of the Call type
-                # (which is assumed to refer to Task).
-                assign_object_keywords = assign_object.value.keywords
-                for keyword in assign_object_keywords:
-                    # If a suitable assignment is found its arguments are
-                    # checked, the task name in Task is found by arg name
-                    # which should be `task_name`.
-                    if keyword.arg == "task_name":
-                        found_task_name = keyword.value.value.split("(")[0]
-                        if found_task_name == supplied_task_name:
-                            check_value = True
-    return check_value
-
-
 def _update_globals(task_file_to_run, globals_dict):
     """Updates globals dictionary with default data path for provided
     task if Inputs/Outputs directories are equal to None.
@@ -140,17 +125,17 @@ def _update_globals(task_file_to_run, globals_dict):
     return globals_dict
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
+def run_from_parameters(run_task_parameters):
+    """Run a task described by the command line parameters string, e.g.:
 
-    # Using one argument instead of the multiple argaprse ones
-    # is to minimize the risk of encountering escape characters
-    # in one of the arguments provided on the command line.
-    parser.add_argument("run_task_parameters", type=str)
-    parser_arg = parser.parse_args()
+        `TaskName -a Setting:'value' -iodir path/to/data -jobs 4`
 
+    Args:
+        run_task_parameters (str): task name followed by the parameters,
+            each of them preceded by ` -`.
+    """
     parameters_list = re.split(''' -(?=(?:[^'"]|'[^']*'|"[^"]*")*$)''',
-                               parser_arg.run_task_parameters)
+                               run_task_parameters)
 
     task_name = parameters_list[0]
     del parameters_list[0]
@@ -159,12 +144,19 @@ if __name__ == "__main__":
     inputs_directory = None
     outputs_directory = None
     task_info = False
+    use_cache = True
+    profile = False
+    jobs = None
     arguments = []
     settings_path = None
 
     for element in parameters_list:
         if element.startswith("ti") or element.startswith("-task_info"):
             task_info = True
+        elif element.startswith("nc") or element.startswith("-no_cache"):
+            use_cache = False
+        elif element.startswith("profile") or element.startswith("-profile"):
+            profile = True
         else:
             arg_type, arg = element.split(" ", 1)
             if arg_type in ["a", "-argument"]:
@@ -177,10 +169,43 @@ if __name__ == "__main__":
                 outputs_directory = arg
             elif arg_type in ["sp", "-settings_path"]:
                 settings_path = arg
+            elif arg_type in ["j", "jobs", "-jobs"]:
+                jobs = int(arg)
 
     if inputs_outputs_directory is not None:
         inputs_directory = inputs_outputs_directory
         outputs_directory = inputs_outputs_directory
 
-    run_selected_module(task_name, inputs_directory, outputs_directory,
-                        task_info, arguments, settings_path)
+    if jobs is not None and not task_info:
+        from pybox.task_scheduler import run_task_graph
+
+        run_task_graph(task_name, jobs, inputs_directory, outputs_directory,
+                       arguments, settings_path, use_cache, profile)
+    else:
+        run_selected_module(task_name,
+                            inputs_directory,
+                            outputs_directory,
+                            task_info,
+                            arguments,
+                            settings_path,
+                            use_cache,
+                            profile=profile)
+    # Outputs are written in the background, errors raised while writing
+    # them are propagated before the run is reported as finished. Store
+    # is imported here, as it requires NumPy, which tasks import anyway.
+    import pybox.artifact_store as pbas
+
+    pbas.ARTIFACT_STORE.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+
+    # Using one argument instead of the multiple argaprse ones
+    # is to minimize the risk of encountering escape characters
+    # in one of the arguments provided on the command line.
+    parser.add_argument("run_task_parameters", type=str)
+    parser_arg = parser.parse_args()
+
+    configure_logging()
+    run_from_parameters(parser_arg.run_task_parameters)
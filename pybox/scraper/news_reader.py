@@ -12,11 +12,6 @@ import time
 from abc import ABC, abstractproperty
 from datetime import datetime, date
 from importlib import import_module
-from selenium.webdriver import Chrome, ChromeOptions, Firefox, FirefoxOptions
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from msedge.selenium_tools import Edge, EdgeOptions
 
 
 def emergency_data_protector(function):
@@ -156,6 +151,12 @@ class NewsReader(ABC):
 
             main_page(str): main page address.
         """
+        # Browser automation modules are slow to import, so they are
+        # imported only once the driver is actually needed.
+        from selenium.webdriver import (Chrome, ChromeOptions, Firefox,
+                                        FirefoxOptions)
+        from msedge.selenium_tools import Edge, EdgeOptions
+
         if sys.platform in ["win32", "win64"]:
             driver_suffix = "_win.exe"
         elif sys.platform.startswith("linux"):
@@ -195,6 +196,10 @@ class NewsReader(ABC):
 
             button_id (str): identificator of the acceptance button.
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         time.sleep(15)
         try:
             accept_button = WebDriverWait(self.driver, 60).until(
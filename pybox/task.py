@@ -1,10 +1,15 @@
 #!/usr/bin/env python
 import ast
+import cProfile
+import contextlib
 import inspect
 import logging
 import yaml
 
 import pybox.run_task as pbrt
+import pybox.task_cache as pbtc
+import pybox.task_profile as pbtp
+import pybox.artifact_store as pbas
 import pybox.datastore.data_flow as pbddf
 from pybox.helpers.text import snake_to_camel_case
 
@@ -28,6 +33,11 @@ class Task:
         self.inputs_directory = global_variables["INPUTS_DIRECTORY"]
         self.outputs_directory = global_variables["OUTPUTS_DIRECTORY"]
         self.supplied_task_name = global_variables["SUPPLIED_TASK_NAME"]
+        self.use_cache = global_variables["USE_CACHE"]
+        self.resolve_inputs = global_variables["RESOLVE_INPUTS"]
+        self.task_io = global_variables["TASK_IO"]
+        self.profile = global_variables["PROFILE"]
+        self.task_file = global_variables.get("__file__")
 
         self.task_settings = dict()
         self.task_settings_info = dict()
@@ -77,7 +87,11 @@ class Task:
             self.task_settings[name] = default_value
             self.task_settings_info[name] = info
 
-    def run(self, main_function, task_inputs=None, task_outputs=None):
+    def run(self,
+            main_function,
+            task_inputs=None,
+            task_outputs=None,
+            inputs_requirements=None):
         """Performs the task if an active task was approved after initiation.
 
         Args:
@@ -86,11 +100,18 @@ class Task:
                 in the task. Defaults to None.
             task_outputs (list, optional): output names which are going to be
                 used in the task. Defaults to None.
+            inputs_requirements (dict, optional): input names mapped to
+                dictionaries with `columns` and/or `filters` keys, which
+                limit the loaded part of the input, see `table_from_parquet`,
+                and `categorical` key listing columns loaded as categorical.
+                If `batch_size` key is supplied, the input is passed to the
+                main function as an iterator of DataTable batches, see
+                `iter_parquet_batches`. Inputs without requirements are
+                loaded fully. Defaults to None.
         """
         if self.show_task_info:
             self._print_task_info()
         elif self.supplied_task_name == self.task_name:
-            logging.info(f"Task {self.task_name} started.")
             function_input_list = list()
 
             # Sorting out task's settings.
@@ -100,31 +121,66 @@ class Task:
                 if self.supplied_settings:
                     self._overwrite_settings
 
+            # Sorting out task's inputs and outputs names.
+            if task_inputs:
+                task_inputs = self._prepare_io_list(task_inputs, "inputs")
+            if task_outputs:
+                task_outputs = self._prepare_io_list(task_outputs, "outputs")
+                output_paths = [
+                    f"{self.outputs_directory}/{name}.parquet"
+                    for name in task_outputs
+                ]
+
+            # Only reporting inputs and outputs names if they are requested
+            # while building the graph of tasks.
+            if self.task_io is not None:
+                self.task_io["inputs"] = list(task_inputs or list())
+                self.task_io["outputs"] = list(task_outputs or list())
+                return
+            logging.info(f"Task {self.task_name} started.")
+            profile = pbtp.TaskProfile(self.task_name)
+
+            # Skipping the task if its outputs for the same source code,
+            # settings and inputs are found in the cache.
+            fingerprint = None
+            if self.use_cache and task_outputs:
+                if self.resolve_inputs:
+                    for name in task_inputs or list():
+                        self._update_input(name)
+                input_paths = [
+                    f"{self.inputs_directory}/{name}.parquet"
+                    for name in task_inputs or list()
+                ]
+                with profile.measure("cache_lookup"):
+                    # Inputs produced in this process may still be written.
+                    pbas.ARTIFACT_STORE.wait(input_paths)
+                    cache = pbtc.TaskCache()
+                    fingerprint = cache.fingerprint(self.task_name,
+                                                    self._task_source,
+                                                    self.task_settings,
+                                                    input_paths, task_outputs)
+                    restored = cache.restore(fingerprint, output_paths)
+                if restored:
+                    for output_path in output_paths:
+                        pbas.ARTIFACT_STORE.discard(output_path)
+                    profile.cached = True
+                    profile.finish(self.outputs_directory)
+                    logging.info(
+                        f"Task {self.task_name} is up to date, skipped.")
+                    return
+
             # Sorting out task's inputs.
             inputs = list()
             if task_inputs:
-                task_inputs = self._prepare_io_list(task_inputs, "inputs")
-                for name in task_inputs:
-                    try:
-                        inputs.append(
-                            pbddf.table_from_parquet(
-                                file_name=name,
-                                directory=self.inputs_directory))
-                    except FileNotFoundError:
-                        logging.info(
-                            f"\tInput file called `{name}` was not found.")
-                        logging.info(
-                            "\tSearching the task with a given name initiated..."
-                        )
-
-                        pbrt.run_selected_module(
-                            supplied_task_name=name,
-                            inputs_directory=self.inputs_directory,
-                            outputs_directory=self.outputs_directory)
+                inputs_requirements = inputs_requirements or dict()
+                with profile.measure("load_inputs"):
+                    for name in task_inputs:
+                        task_input = self._load_input(
+                            name, inputs_requirements.get(name, dict()))
                         inputs.append(
-                            pbddf.table_from_parquet(
-                                file_name=name,
-                                directory=self.inputs_directory))
+                            profile.add_input(
+                                name, task_input,
+                                f"{self.inputs_directory}/{name}.parquet"))
 
             # Merging inputs, settings into one list.
             if inputs:
@@ -132,21 +188,98 @@ class Task:
             if self.task_settings or self.parameters:
                 function_input_list.append(self.task_settings)
 
+            # Only the main function is profiled, upstream tasks run while
+            # loading inputs would nest profilers, they are profiled
+            # by their own runs.
+            profiler = cProfile.Profile() if self.profile else None
+            with profile.measure("main_function"), (
+                    profiler or contextlib.nullcontext()):
+                outputs = main_function(*function_input_list)
+
             # Sorting out task's outputs.
             if task_outputs:
-                task_outputs = self._prepare_io_list(task_outputs, "outputs")
-                outputs = main_function(*function_input_list)
                 if not isinstance(outputs, tuple):
                     outputs = tuple([outputs])
-                for output, name in zip(outputs, task_outputs):
-                    pbddf.table_to_parquet(table=output,
-                                           file_name=name,
-                                           directory=self.outputs_directory)
-            else:
-                main_function(*function_input_list)
-
+                # Outputs are handed to the consuming tasks from memory,
+                # parquet files are written in the background.
+                pbas.ARTIFACT_STORE.submit(profile.start, "write_outputs")
+                with profile.measure("store_outputs"):
+                    for output, name, output_path in zip(
+                            outputs, task_outputs, output_paths):
+                        pbas.ARTIFACT_STORE.put(output, name,
+                                                self.outputs_directory)
+                        profile.add_output(name, output, output_path)
+                if fingerprint is not None:
+                    pbas.ARTIFACT_STORE.submit(cache.store, fingerprint,
+                                               output_paths)
+                pbas.ARTIFACT_STORE.submit(profile.stop, "write_outputs")
+
+            if profiler is not None:
+                profiler.dump_stats(
+                    f"{self.outputs_directory}/{self.task_name}.pstats")
+            # Profile is completed once the outputs are written.
+            pbas.ARTIFACT_STORE.submit(profile.finish, self.outputs_directory)
             logging.info(f"Task {self.task_name} ended.")
 
+    def _update_input(self, name):
+        """Runs the task producing input of a given name (if such task
+        exists), it is skipped by the cache when the input is up to date.
+
+        Args:
+            name (str): name of the input.
+        """
+        if pbrt.find_task_file(name) is not None:
+            pbrt.run_selected_module(supplied_task_name=name,
+                                     inputs_directory=self.inputs_directory,
+                                     outputs_directory=self.outputs_directory,
+                                     use_cache=True,
+                                     profile=self.profile)
+
+    def _load_input(self, name, requirements):
+        """Loads task input from the outputs stored in memory or from the
+        parquet file, if it is not found the task producing it is run
+        beforehand.
+
+        Args:
+            name (str): name of the input.
+            requirements (dict): `columns`, `filters` and `batch_size`
+                of the input. If `batch_size` is supplied iterator
+                of batches is returned instead of the whole table.
+        """
+        try:
+            return self._read_input(name, requirements)
+        except FileNotFoundError:
+            logging.info(f"\tInput file called `{name}` was not found.")
+            logging.info("\tSearching the task with a given name initiated...")
+
+            pbrt.run_selected_module(supplied_task_name=name,
+                                     inputs_directory=self.inputs_directory,
+                                     outputs_directory=self.outputs_directory,
+                                     use_cache=self.use_cache,
+                                     profile=self.profile)
+            return self._read_input(name, requirements)
+
+    def _read_input(self, name, requirements):
+        """Reads task input from the outputs stored in memory, or if it is
+        not there, from the parquet file.
+
+        Args:
+            name (str): name of the input.
+            requirements (dict): `columns`, `filters` and `batch_size`
+                of the input.
+        """
+        stored_input = pbas.ARTIFACT_STORE.load(name, self.inputs_directory,
+                                                **requirements)
+        if stored_input is not None:
+            return stored_input
+        elif "batch_size" in requirements:
+            return pbddf.iter_parquet_batches(file_name=name,
+                                              directory=self.inputs_directory,
+                                              **requirements)
+        return pbddf.table_from_parquet(file_name=name,
+                                        directory=self.inputs_directory,
+                                        **requirements)
+
     def _construct_name_and_parameters(self, task_name):
         """Constructs task name and parameters objects from supplied task name.
 
@@ -219,6 +352,14 @@ class Task:
         else:
             raise ValueError(f"Wrong type of task inputs/outputs: {task_io}")
 
+    @property
+    def _task_source(self):
+        """Returns source code of the task module."""
+        if self.task_file is None:
+            return bytes()
+        with open(self.task_file, "rb") as task_file:
+            return task_file.read()
+
     @property
     def _overwrite_settings(self):
         """Overwrites default settings with new values supplied by user
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+from pybox.GLOBALS import CACHE_PATH
+
+import os
+import json
+import time
+import shutil
+import threading
+import hashlib
+import logging
+
+# Size of the stored outputs above which the least recently used
+# cache entries are evicted.
+MAX_CACHE_BYTES = 10 * 1024**3
+HASH_CHUNK_SIZE = 1024**2
+# Unreferenced outputs changed or linked within this number of seconds
+# are kept by the eviction, as their entries may not be written yet.
+EVICTION_GRACE_SECONDS = 600
+
+
+class TaskCache:
+    """Content-addressed cache of the task outputs.
+
+    Every run of a task is described by a fingerprint, computed from
+    the task module source, effective task settings and content hashes
+    of the input files. Cache entry maps the fingerprint to the content
+    hashes of the produced outputs, which are kept (as hard links when
+    possible) in the cache directory under their hashes. If the entry
+    is found, outputs are restored from the cache and the task is skipped.
+
+    Content hashes of the files are memoized by their size and modification
+    time, so unchanged files are not hashed again.
+    """
+
+    def __init__(self, directory=CACHE_PATH, max_bytes=MAX_CACHE_BYTES):
+        """Initialization of the TaskCache class.
+
+        Args:
+            directory (str, optional): directory in which cache is stored.
+                Defaults to CACHE_PATH.
+            max_bytes (int, optional): maximum size of the stored outputs,
+                exceeding it evicts least recently used entries.
+                Defaults to MAX_CACHE_BYTES.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries_directory = f"{directory}/entries"
+        self.blobs_directory = f"{directory}/blobs"
+        self.hashes_path = f"{directory}/hashes.json"
+        for cache_directory in [self.entries_directory, self.blobs_directory]:
+            os.makedirs(cache_directory, exist_ok=True)
+        self._hashes = _read_json(self.hashes_path, dict())
+
+    def fingerprint(self, task_name, source, settings, input_paths,
+                    output_names):
+        """Return fingerprint of the task run.
+
+        Args:
+            task_name (str): name of the task.
+            source (bytes): source code of the task module.
+            settings (dict): effective settings of the task.
+            input_paths (list): paths of the task input files.
+            output_names (list): names of the task outputs.
+        """
+        fingerprint = hashlib.sha256()
+        fingerprint.update(task_name.encode())
+        fingerprint.update(source)
+        fingerprint.update(
+            json.dumps(settings, sort_keys=True, default=repr).encode())
+        for input_path in input_paths:
+            fingerprint.update(self.file_hash(input_path).encode())
+        fingerprint.update(json.dumps(output_names).encode())
+        return fingerprint.hexdigest()
+
+    def file_hash(self, file_path):
+        """Return content hash of the file, computed only if the file
+        has changed since it was hashed the last time.
+
+        Args:
+            file_path (str): path of the hashed file.
+        """
+        file_path = os.path.abspath(file_path)
+        file_stat = os.stat(file_path)
+        memo = self._hashes.get(file_path)
+        if memo and memo[:2] == [file_stat.st_size, file_stat.st_mtime_ns]:
+            return memo[2]
+
+        content_hash = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+                content_hash.update(chunk)
+        content_hash = content_hash.hexdigest()
+        self._hashes[file_path] = [
+            file_stat.st_size, file_stat.st_mtime_ns, content_hash
+        ]
+        _write_json(self.hashes_path, self._hashes)
+        return content_hash
+
+    def restore(self, fingerprint, output_paths):
+        """Return True if the cache entry of the fingerprint exists and all
+        outputs are in place, outputs which differ from the cached ones are
+        restored from the cache.
+
+        Args:
+            fingerprint (str): fingerprint of the task run.
+            output_paths (list): paths of the task output files.
+        """
+        entry_path = f"{self.entries_directory}/{fingerprint}.json"
+        entry = _read_json(entry_path, None)
+        if entry is None or len(entry["outputs"]) != len(output_paths):
+            return False
+
+        for output_path, output_hash in zip(output_paths, entry["outputs"]):
+            if (os.path.exists(output_path)
+                    and self.file_hash(output_path) == output_hash):
+                continue
+            blob_path = f"{self.blobs_directory}/{output_hash}"
+            if not os.path.exists(blob_path):
+                return False
+            _link_or_copy(blob_path, output_path)
+            logging.info(f"\tOutput `{output_path}` restored from the cache.")
+
+        # Modification time of the entry marks its last use.
+        os.utime(entry_path)
+        return True
+
+    def store(self, fingerprint, output_paths):
+        """Store outputs of the task run in the cache under its fingerprint.
+
+        Args:
+            fingerprint (str): fingerprint of the task run.
+            output_paths (list): paths of the task output files.
+        """
+        output_hashes = list()
+        for output_path in output_paths:
+            output_hash = self.file_hash(output_path)
+            blob_path = f"{self.blobs_directory}/{output_hash}"
+            if not os.path.exists(blob_path):
+                _link_or_copy(output_path, blob_path)
+            output_hashes.append(output_hash)
+
+        _write_json(f"{self.entries_directory}/{fingerprint}.json",
+                    {"outputs": output_hashes})
+        self.evict()
+
+    def evict(self, max_bytes=None):
+        """Remove least recently used entries until stored outputs fit
+        in `max_bytes`, afterwards outputs not referenced by any entry
+        are removed. Temporary files and outputs stored within the last
+        EVICTION_GRACE_SECONDS are kept, as they may belong to the runs
+        storing their outputs at the same time.
+
+        Args:
+            max_bytes (int, optional): maximum size of the stored outputs.
+                Defaults to None, in which case `self.max_bytes` is used.
+        """
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+
+        entries = list()
+        for entry_name in os.listdir(self.entries_directory):
+            entry_path = f"{self.entries_directory}/{entry_name}"
+            entry = _read_json(entry_path, None)
+            if entry is not None:
+                entries.append((os.stat(entry_path).st_mtime_ns, entry_path,
+                                entry["outputs"]))
+        entries.sort(reverse=True)
+
+        kept_blobs = set()
+        kept_bytes = 0
+        for _, entry_path, output_hashes in entries:
+            new_blobs = set(output_hashes) - kept_blobs
+            new_bytes = sum(
+                _file_size(f"{self.blobs_directory}/{blob}")
+                for blob in new_blobs)
+            if kept_bytes + new_bytes > max_bytes:
+                os.remove(entry_path)
+                continue
+            kept_blobs |= new_blobs
+            kept_bytes += new_bytes
+
+        grace_limit = time.time() - EVICTION_GRACE_SECONDS
+        for blob in os.listdir(self.blobs_directory):
+            if blob in kept_blobs or ".tmp" in blob:
+                continue
+            blob_path = f"{self.blobs_directory}/{blob}"
+            try:
+                # Linking the file changes its status time, not modification.
+                blob_stat = os.stat(blob_path)
+                if max(blob_stat.st_mtime, blob_stat.st_ctime) < grace_limit:
+                    os.remove(blob_path)
+            except FileNotFoundError:
+                continue
+
+
+def _link_or_copy(source_path, target_path):
+    """Create hard link of the file, or its copy if linking is impossible.
+    Target is replaced atomically, so no one sees a partially written file.
+    """
+    temporary_path = f"{target_path}.tmp{os.getpid()}"
+    try:
+        os.link(source_path, temporary_path)
+    except OSError:
+        shutil.copy2(source_path, temporary_path)
+    os.replace(temporary_path, target_path)
+
+
+def _file_size(file_path):
+    try:
+        return os.stat(file_path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _read_json(file_path, default):
+    try:
+        with open(file_path, "r") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+def _write_json(file_path, content):
+    """Write JSON file atomically, so concurrent readers never see it
+    partially written."""
+    # Outputs are stored in the background thread, while the main one
+    # may be hashing files, so temporary file is unique per thread.
+    temporary_path = f"{file_path}.tmp{os.getpid()}-{threading.get_ident()}"
+    with open(temporary_path, "w") as file:
+        json.dump(content, file)
+    os.replace(temporary_path, file_path)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+import os
+import sys
+import json
+import socket
+import argparse
+import tempfile
+
+DAEMON_SOCKET_PATH = os.environ.get(
+    "PYBOX_DAEMON_SOCKET",
+    os.path.join(tempfile.gettempdir(), f"pybox-{os.getuid()}.sock"))
+
+
+class DaemonNotRunningError(ConnectionError):
+    """Raised when the task daemon does not listen at the socket. Other
+    connection errors, e.g. closed pipe of the standard output, are not
+    handled by running the task without the daemon."""
+    pass
+
+
+def send_task_request(run_task_parameters, socket_path=DAEMON_SOCKET_PATH):
+    """Send task request to the daemon, print its log and output (to the
+    same standard stream the task wrote it to) and return True if the task
+    succeeded. Client uses only the standard library, so unlike
+    `run_task.py` it starts immediately, while the daemon keeps all
+    modules imported. If the daemon is not running, the task is run
+    by `run_task.py`.
+
+    Args:
+        run_task_parameters (str): parameters string as in `run_task.py`.
+        socket_path (str, optional): path of the daemon Unix socket.
+            Defaults to DAEMON_SOCKET_PATH.
+
+    Raises:
+        DaemonNotRunningError: If the daemon is not running.
+    """
+    request = {"parameters": run_task_parameters, "directory": os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as error:
+            raise DaemonNotRunningError(
+                f"Task daemon is not running at `{socket_path}`.") from error
+        connection.sendall(json.dumps(request).encode() + b"\n")
+
+        with connection.makefile("r") as response:
+            for line in response:
+                message = json.loads(line)
+                if "log" in message:
+                    print(message["log"], flush=True)
+                elif "stdout" in message:
+                    sys.stdout.write(message["stdout"])
+                    sys.stdout.flush()
+                elif "stderr" in message:
+                    sys.stderr.write(message["stderr"])
+                    sys.stderr.flush()
+                else:
+                    if message.get("error"):
+                        print(message["error"], file=sys.stderr)
+                    return message["status"] == "ok"
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("run_task_parameters", type=str)
+    parser_arg = parser.parse_args()
+
+    try:
+        succeeded = send_task_request(parser_arg.run_task_parameters)
+    except DaemonNotRunningError:
+        run_task_path = os.path.join(os.path.dirname(__file__), "run_task.py")
+        os.execv(sys.executable, [
+            sys.executable, run_task_path, parser_arg.run_task_parameters
+        ])
+    sys.exit(0 if succeeded else 1)
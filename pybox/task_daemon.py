@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+from pybox.GLOBALS import configure_logging
+from pybox.task_client import DAEMON_SOCKET_PATH
+import pybox.run_task as pbrt
+import pybox.artifact_store as pbas
+
+import io
+import os
+import json
+import logging
+import argparse
+import importlib
+import contextlib
+import traceback
+import socketserver
+
+DEFAULT_MAX_TASKS = os.cpu_count() or 1
+# Modules imported lazily by pybox, which nearly every task needs.
+DEFAULT_PRELOAD = ["pybox.task", "pyarrow.parquet"]
+
+
+class TaskDaemon(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Long-lived daemon running tasks requested by `task_client`.
+
+    Daemon imports the application modules (and the optional heavy ones)
+    once, afterwards every request is handled in a process forked from it,
+    which starts with all modules already imported. Forked process gets
+    its own copy of the daemon memory, so task globals (as well as any
+    other state changed by the task) never leak between runs.
+
+    Number of tasks run at the same time is limited by `max_children`,
+    requests above the limit wait until one of the running tasks ends.
+    """
+
+    def __init__(self,
+                 socket_path=DAEMON_SOCKET_PATH,
+                 max_tasks=DEFAULT_MAX_TASKS,
+                 preload=None):
+        """Initialization of the TaskDaemon class.
+
+        Args:
+            socket_path (str, optional): path of the Unix socket.
+                Defaults to DAEMON_SOCKET_PATH.
+            max_tasks (int, optional): maximum number of tasks run
+                concurrently. Defaults to DEFAULT_MAX_TASKS.
+            preload (list, optional): names of the modules imported
+                in advance in addition to DEFAULT_PRELOAD, e.g. `torch`
+                or `gensim`. Defaults to None.
+        """
+        for module_name in DEFAULT_PRELOAD + (preload or list()):
+            importlib.import_module(module_name)
+        pbrt.task_registry()
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.socket_path = socket_path
+        self.max_children = max_tasks
+        super().__init__(socket_path, _TaskRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+class _TaskRequestHandler(socketserver.StreamRequestHandler):
+    """Runs single task request, streaming its log, as well as everything
+    it writes to the standard output and error, back to the client."""
+
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        os.chdir(request["directory"])
+
+        log_handler = _SocketLogHandler(self.wfile)
+        log_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s: %(message)s"))
+        root_logger = logging.getLogger()
+        root_logger.handlers = [log_handler]
+
+        response = {"status": "ok"}
+        try:
+            with contextlib.redirect_stdout(
+                    _SocketStream(self.wfile, "stdout")), \
+                    contextlib.redirect_stderr(
+                        _SocketStream(self.wfile, "stderr")):
+                pbrt.run_from_parameters(request["parameters"])
+            pbas.ARTIFACT_STORE.clear()
+        except BaseException:
+            response = {"status": "error", "error": traceback.format_exc()}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class _SocketLogHandler(logging.Handler):
+    """Logging handler sending records to the client as JSON lines."""
+
+    def __init__(self, wfile):
+        super().__init__()
+        self.wfile = wfile
+
+    def emit(self, record):
+        try:
+            message = json.dumps({"log": self.format(record)})
+            self.wfile.write(message.encode() + b"\n")
+        except Exception:
+            self.handleError(record)
+
+
+class _SocketStream(io.TextIOBase):
+    """Text stream sending everything written to it to the client as JSON
+    lines, under the key of the stream name (`stdout` or `stderr`)."""
+
+    def __init__(self, wfile, name):
+        super().__init__()
+        self.wfile = wfile
+        self.name = name
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if text:
+            message = json.dumps({self.name: text})
+            self.wfile.write(message.encode() + b"\n")
+        return len(text)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--socket", type=str, default=DAEMON_SOCKET_PATH)
+    parser.add_argument("--max_tasks", type=int, default=DEFAULT_MAX_TASKS)
+    parser.add_argument("--preload", type=str, default="")
+    parser_arg = parser.parse_args()
+
+    configure_logging()
+    with TaskDaemon(parser_arg.socket, parser_arg.max_tasks,
+                    [name for name in parser_arg.preload.split(",")
+                     if name]) as daemon:
+        logging.info(f"Task daemon listening at {parser_arg.socket}.")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
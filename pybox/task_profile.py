@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+import os
+import sys
+import json
+import time
+from datetime import datetime
+
+# Name of the file, kept in the outputs directory, to which profiles
+# of the task runs are appended as JSON lines.
+PROFILE_FILE_NAME = "task_profile.jsonl"
+
+
+class TaskProfile:
+    """Timings and data volumes of a single task run.
+
+    Wall and CPU time is measured separately for every stage of the run
+    (e.g. loading inputs, main function, writing outputs), together with
+    the number of rows and bytes of every input and output. Sizes of the
+    inputs and outputs are sizes of their parquet files, their approximate
+    in-memory sizes (see `DataTable.memory_usage`) are recorded as `memory`.
+    Finished profile is appended as a JSON line to the PROFILE_FILE_NAME
+    file.
+
+    CPU time is the time of the whole process, so it also includes work
+    of the threads running in the background.
+    """
+
+    def __init__(self, task_name):
+        """Initialization of the TaskProfile class.
+
+        Args:
+            task_name (str): name of the profiled task.
+        """
+        self.task_name = task_name
+        self.started = datetime.now().isoformat(timespec="milliseconds")
+        self.cached = False
+        self.stages = dict()
+        self.inputs = list()
+        self.outputs = list()
+        self._running = dict()
+
+    def start(self, stage):
+        """Start measuring time of the stage.
+
+        Args:
+            stage (str): name of the stage.
+        """
+        self._running[stage] = (time.perf_counter(), time.process_time())
+
+    def stop(self, stage):
+        """Stop measuring time of the stage, time of the stage measured
+        more than once is summed.
+
+        Args:
+            stage (str): name of the stage.
+        """
+        wall_start, cpu_start = self._running.pop(stage)
+        timing = self.stages.setdefault(stage, {"wall": 0.0, "cpu": 0.0})
+        timing["wall"] += time.perf_counter() - wall_start
+        timing["cpu"] += time.process_time() - cpu_start
+
+    def measure(self, stage):
+        """Return context manager measuring time of the stage, e.g.:
+
+            with profile.measure("main_function"):
+                ...
+
+        Args:
+            stage (str): name of the stage.
+        """
+        return _StageTimer(self, stage)
+
+    def add_input(self, name, data, file_path):
+        """Record input of the task and return it. If the input is an
+        iterator of batches, rows are counted while it is consumed.
+        Input handed from memory may not be written yet, so its size
+        is read in `finish`, like the sizes of the outputs.
+
+        Args:
+            name (str): name of the input.
+            data (DataTable, iterator): loaded input.
+            file_path (str): path of the input parquet file.
+        """
+        entry = {
+            "name": name,
+            "rows": None,
+            "bytes": None,
+            "memory": None,
+            "file_path": file_path
+        }
+        self.inputs.append(entry)
+        if hasattr(data, "length"):
+            entry["rows"] = data.length
+            entry["memory"] = data.bytesize
+            return data
+        entry["rows"] = 0
+        return _counted_batches(data, entry)
+
+    def add_output(self, name, data, file_path):
+        """Record output of the task, its size is read once the output
+        file is written, see `finish`.
+
+        Args:
+            name (str): name of the output.
+            data (DataTable): output of the task.
+            file_path (str): path of the output parquet file.
+        """
+        self.outputs.append({
+            "name": name,
+            "rows": data.length,
+            "bytes": None,
+            "memory": getattr(data, "bytesize", None),
+            "file_path": file_path
+        })
+
+    def finish(self, directory):
+        """Complete the profile and append it to the PROFILE_FILE_NAME file.
+
+        Args:
+            directory (str): directory in which the profile file is kept.
+        """
+        for entry in self.inputs + self.outputs:
+            entry["bytes"] = _file_size(entry["file_path"])
+        os.makedirs(directory, exist_ok=True)
+        with open(f"{directory}/{PROFILE_FILE_NAME}", "a") as profile_file:
+            profile_file.write(json.dumps(self.as_dict()) + "\n")
+
+    def as_dict(self):
+        """Return profile as a dictionary."""
+        return {
+            "task": self.task_name,
+            "started": self.started,
+            "pid": os.getpid(),
+            "cached": self.cached,
+            "stages": {
+                stage: {key: round(value, 6)
+                        for key, value in timing.items()}
+                for stage, timing in self.stages.items()
+            },
+            "peak_rss": peak_rss(),
+            "inputs": _without_paths(self.inputs),
+            "outputs": _without_paths(self.outputs)
+        }
+
+
+class _StageTimer:
+    """Context manager measuring time of the profile stage."""
+
+    def __init__(self, profile, stage):
+        self.profile = profile
+        self.stage = stage
+
+    def __enter__(self):
+        self.profile.start(self.stage)
+        return self
+
+    def __exit__(self, *exception_info):
+        self.profile.stop(self.stage)
+
+
+def peak_rss():
+    """Return peak resident set size of the process in bytes, or None
+    if it is not available on the platform."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the size in kilobytes, macOS in bytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _counted_batches(batches, entry):
+    """Yield batches, counting their rows in the input entry."""
+    for batch in batches:
+        entry["rows"] += batch.length
+        yield batch
+
+
+def _without_paths(entries):
+    """Return inputs or outputs entries without their file paths."""
+    return [{key: value
+             for key, value in entry.items() if key != "file_path"}
+            for entry in entries]
+
+
+def _file_size(file_path):
+    """Return size of the file, or None if it does not exist."""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return None
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+from pybox.GLOBALS import BOXES_PATH, CACHE_PATH
+
+import os
+import ast
+import json
+import hashlib
+import logging
+
+REGISTRY_PATH = "/".join([CACHE_PATH, "task_registry.json"])
+# Version of the index entries, entries of other versions are created again.
+REGISTRY_VERSION = 2
+
+
+class TaskRegistry:
+    """Persistent index of the tasks registered in the boxes.
+
+    For every task file the index stores names (with parameters patterns)
+    of the registered tasks, together with their inputs and outputs if they
+    are declared as literal lists. File is parsed again only if both its
+    modification time and its content hash have changed, so looking up
+    a task requires no parsing in the usual case.
+    """
+
+    def __init__(self, boxes_path=BOXES_PATH, registry_path=REGISTRY_PATH):
+        """Initialization of the TaskRegistry class.
+
+        Args:
+            boxes_path (str, optional): directory searched for task files.
+                Defaults to BOXES_PATH.
+            registry_path (str, optional): path of the file in which
+                the index is stored. Defaults to REGISTRY_PATH.
+        """
+        self.boxes_path = boxes_path
+        self.registry_path = registry_path
+        try:
+            with open(registry_path, "r") as registry:
+                self.files = {
+                    task_file: entry
+                    for task_file, entry in json.load(registry).items()
+                    if entry.get("version") == REGISTRY_VERSION
+                }
+        except (FileNotFoundError, ValueError):
+            self.files = dict()
+        self.tasks = dict()
+        self.refresh()
+
+    def refresh(self):
+        """Update the index with the current state of the task files."""
+        files = dict()
+        changed = False
+        for path, subdirs, names in os.walk(self.boxes_path):
+            for name in sorted(names):
+                if not name.endswith(".py") or name == "__init__.py":
+                    continue
+                task_file = os.path.join(path, name)
+                files[task_file], file_changed = self._file_entry(task_file)
+                changed = changed or file_changed
+
+        if changed or files.keys() != self.files.keys():
+            self._write(files)
+        self.files = files
+
+        self.tasks = dict()
+        for task_file, entry in files.items():
+            for task in entry["tasks"]:
+                self.tasks.setdefault(task["name"], dict(task, file=task_file))
+
+    def find(self, task_name):
+        """Return path of the file in which task of a given name is
+        registered, or None if there is no such task.
+
+        Args:
+            task_name (str): name of the task, parameters are ignored.
+        """
+        task = self.tasks.get(task_name.split("(")[0])
+        return task["file"] if task else None
+
+    def declared_io(self, task_name):
+        """Return pair of inputs and outputs names declared by the task,
+        each of them is None if it is created dynamically (or the task
+        is not registered).
+
+        Args:
+            task_name (str): name of the task, parameters are ignored.
+        """
+        task = self.tasks.get(task_name.split("(")[0])
+        if task is None:
+            return None, None
+        return task["inputs"], task["outputs"]
+
+    def _file_entry(self, task_file):
+        """Return index entry of the file and information if it has changed."""
+        file_stat = os.stat(task_file)
+        entry = self.files.get(task_file)
+        if entry and [entry["mtime_ns"], entry["size"]
+                      ] == [file_stat.st_mtime_ns, file_stat.st_size]:
+            return entry, False
+
+        with open(task_file, "rb") as task_script:
+            source = task_script.read()
+        source_hash = hashlib.sha256(source).hexdigest()
+        if not entry or entry["hash"] != source_hash:
+            try:
+                tasks = registered_tasks(source)
+            except (SyntaxError, UnicodeDecodeError, ValueError) as error:
+                # File which can not be parsed registers no tasks, so it does
+                # not prevent looking up tasks of the other files.
+                logging.warning(
+                    f"Tasks of `{task_file}` are not registered: {error}")
+                tasks = list()
+            entry = {
+                "hash": source_hash,
+                "tasks": tasks,
+                "version": REGISTRY_VERSION
+            }
+        entry.update(mtime_ns=file_stat.st_mtime_ns, size=file_stat.st_size)
+        return entry, True
+
+    def _write(self, files):
+        """Store the index atomically in the registry file."""
+        os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
+        temporary_path = f"{self.registry_path}.tmp{os.getpid()}"
+        with open(temporary_path, "w") as registry:
+            json.dump(files, registry)
+        os.replace(temporary_path, self.registry_path)
+
+
+def registered_tasks(source):
+    """Return list of tasks registered in the task module source. Each task
+    is described by its `name` (without parameters), `pattern` (name with
+    parameters) and `inputs` and `outputs` lists, which are None if they
+    are not literal lists of names or the `run` call of the task is not
+    found at the top level of the module.
+
+    Args:
+        source (str, bytes): source code of the task module.
+    """
+    node = ast.parse(source)
+
+    # Only top-level assignments are selected from the module,
+    # since this is how Task instances are created.
+    tasks = dict()
+    for assign_object in node.body:
+        if not (isinstance(assign_object, ast.Assign)
+                and isinstance(assign_object.value, ast.Call)):
+            continue
+        for keyword in assign_object.value.keywords:
+            if keyword.arg == "task_name" and isinstance(
+                    keyword.value, ast.Constant):
+                pattern = keyword.value.value
+                for target in assign_object.targets:
+                    if isinstance(target, ast.Name):
+                        tasks[target.id] = {
+                            "name": pattern.split("(")[0],
+                            "pattern": pattern,
+                            "inputs": None,
+                            "outputs": None
+                        }
+
+    # Inputs and outputs are taken from the `run` calls of the tasks.
+    for expression in node.body:
+        call = getattr(expression, "value", None)
+        if not (isinstance(expression, ast.Expr) and isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Attribute)
+                and call.func.attr == "run"
+                and isinstance(call.func.value, ast.Name)
+                and call.func.value.id in tasks):
+            continue
+        # Arguments unpacked from variables can not be resolved.
+        if any(isinstance(arg, ast.Starred) for arg in call.args) or any(
+                keyword.arg is None for keyword in call.keywords):
+            continue
+        arguments = dict(
+            zip(["main_function", "task_inputs", "task_outputs"], call.args))
+        arguments.update(
+            (keyword.arg, keyword.value) for keyword in call.keywords)
+        for argument in ["task_inputs", "task_outputs"]:
+            value = arguments.get(argument)
+            tasks[call.func.value.id][argument[5:]] = list() \
+                if value is None else _literal_names(value)
+    return list(tasks.values())
+
+
+def _literal_names(node):
+    """Return list of names if the node is a literal list of strings
+    (empty one for literal None), otherwise None."""
+    try:
+        names = ast.literal_eval(node)
+    except ValueError:
+        return None
+    if names is None:
+        return list()
+    if isinstance(names, list) and all(isinstance(n, str) for n in names):
+        return names
+    return None
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+import pybox.run_task as pbrt
+import pybox.artifact_store as pbas
+
+import os
+import shutil
+import logging
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+def task_graph(task_name,
+               inputs_directory=None,
+               outputs_directory=None,
+               settings=None):
+    """Return graph of the task and all tasks producing its inputs,
+    directly or indirectly. Graph is a dictionary mapping every task name
+    to the set of task names producing its inputs.
+
+    Inputs names declared as literal lists are taken from the task registry,
+    the dynamic ones are obtained from the task modules, which are run
+    without executing the tasks themselves.
+
+    Args:
+        task_name (str): name of the final task.
+        inputs_directory (str, optional): directory in which input data
+            of the tasks is searched. Defaults to None.
+        outputs_directory (str, optional): directory in which output data
+            of the tasks is saved. Defaults to None.
+        settings (list, optional): settings of the final task, see
+            `run_selected_module`. Defaults to None.
+    """
+    pbrt.task_registry().refresh()
+    graph = dict()
+    pending = [task_name]
+    while pending:
+        name = pending.pop()
+        if name in graph:
+            continue
+        inputs, _ = pbrt.task_registry().declared_io(name)
+        if inputs is None:
+            task_io = dict()
+            pbrt.run_selected_module(
+                supplied_task_name=name,
+                inputs_directory=inputs_directory,
+                outputs_directory=outputs_directory,
+                settings=settings if name == task_name else None,
+                task_io=task_io)
+            inputs = task_io.get("inputs", list())
+        graph[name] = {
+            input_name for input_name in inputs
+            if pbrt.find_task_file(input_name) is not None
+        }
+        pending.extend(graph[name])
+    return graph
+
+
+def run_task_graph(task_name,
+                   jobs=1,
+                   inputs_directory=None,
+                   outputs_directory=None,
+                   settings=None,
+                   settings_path=None,
+                   use_cache=True,
+                   profile=False):
+    """Run the task together with all tasks producing its inputs. Tasks
+    are run in a pool of processes as soon as all their inputs are ready,
+    so the independent ones are run concurrently.
+
+    Args:
+        task_name (str): name of the final task.
+        jobs (int, optional): number of worker processes. Defaults to 1.
+        inputs_directory (str, optional): directory in which input data
+            of the tasks is searched. Defaults to None.
+        outputs_directory (str, optional): directory in which output data
+            of the tasks is saved. Defaults to None.
+        settings (list, optional): settings of the final task, see
+            `run_selected_module`. Defaults to None.
+        settings_path (str, optional): path of the final task settings file.
+            Defaults to None.
+        use_cache (bool, optional): if true, tasks with up to date outputs
+            are skipped. Defaults to True.
+        profile (bool, optional): if true, cProfile statistics of the tasks
+            are saved in the outputs directory. Defaults to False.
+
+    Raises:
+        ValueError: If tasks depend on each other cyclically.
+    """
+    if settings_path is not None:
+        settings = pbrt._read_settings_file(settings_path)
+    graph = task_graph(task_name, inputs_directory, outputs_directory,
+                       settings)
+    logging.info(f"Running {len(graph)} task(s) with {jobs} worker(s).")
+
+    # Outputs are handed between the workers as Arrow IPC files,
+    # kept in the shared memory if it is available.
+    handoff_directory = tempfile.mkdtemp(
+        prefix="pybox-", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    os.environ[pbas.HANDOFF_DIRECTORY_VARIABLE] = handoff_directory
+
+    try:
+        _run_graph(graph, jobs, task_name, inputs_directory,
+                   outputs_directory, settings, use_cache, profile)
+    finally:
+        del os.environ[pbas.HANDOFF_DIRECTORY_VARIABLE]
+        shutil.rmtree(handoff_directory, ignore_errors=True)
+
+
+def _run_graph(graph, jobs, task_name, inputs_directory, outputs_directory,
+               settings, use_cache, profile):
+    """Run tasks of the graph in a pool of processes, see `run_task_graph`."""
+    remaining = {name: set(upstream) for name, upstream in graph.items()}
+    running = dict()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        while remaining or running:
+            ready = [name for name, upstream in remaining.items() if not upstream]
+            for name in ready:
+                del remaining[name]
+                future = executor.submit(
+                    _run_task,
+                    supplied_task_name=name,
+                    inputs_directory=inputs_directory,
+                    outputs_directory=outputs_directory,
+                    settings=settings if name == task_name else None,
+                    use_cache=use_cache,
+                    resolve_inputs=False,
+                    profile=profile)
+                running[future] = name
+            if not running:
+                raise ValueError(
+                    "Tasks with cyclic dependencies found: "
+                    f"{', '.join(remaining)}.")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                future.result()
+                for upstream in remaining.values():
+                    upstream.discard(name)
+
+
+def _run_task(**kwargs):
+    """Run the task in a worker process and wait until its outputs are
+    written, so they are complete before the dependent tasks start.
+    Outputs are removed from the worker memory, dependent tasks read them
+    from the handoff directory."""
+    pbrt.run_selected_module(**kwargs)
+    pbas.ARTIFACT_STORE.clear()
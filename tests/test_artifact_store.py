@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+from pybox.artifact_store import ArtifactStore
+from pybox.datastore.data_table import DataTable
+
+import pytest
+
+
+def _table():
+    return DataTable({"A": [1, 2, 3], "B": [1.5, 2.5, 3.5], "C": [1, 0, 1]})
+
+
+def test_load_follows_requested_columns_order(tmp_path):
+    store = ArtifactStore()
+    store.put(_table(), "Output", str(tmp_path))
+    assert store.load("Output", str(tmp_path), columns=["C", "A"]).columns \
+        == ["C", "A"]
+    with pytest.raises(IndexError):
+        store.load("Output", str(tmp_path), columns=["A", "Missing"])
+    store.clear()
+
+
+def test_written_outputs_are_discarded_above_max_bytes(tmp_path):
+    store = ArtifactStore(max_bytes=sum(_table().memory_usage().values()))
+    store.put(_table(), "First", str(tmp_path))
+    store.wait()
+    store.put(_table(), "Second", str(tmp_path))
+    assert store.load("First", str(tmp_path)) is None
+    assert store.load("Second", str(tmp_path))["A"] == [1, 2, 3]
+    assert (tmp_path / "First.parquet").exists()
+
+    store.clear()
+    assert store.artifacts == dict()
+    assert (tmp_path / "Second.parquet").exists()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+from pybox.datastore.data_column import CategoricalColumn
+from pybox.datastore.data_table import DataTable
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+
+def assert_consistent(column, expected):
+    categories = column.categories.tolist()
+    assert categories == sorted(set(categories))
+    assert column.codes.dtype == np.int32
+    assert column.codes.min(initial=0) >= -1
+    assert column.codes.max(initial=-1) < len(categories)
+    assert column.to_list() == expected
+    for value in expected:
+        if value is not None:
+            assert categories[column.code(value)] == value
+
+
+def categorical_table():
+    table = DataTable({"A": ["b", "a", None, "b", "c"], "B": [1, 2, 3, 4, 5]})
+    table.categorize(["A"])
+    return table
+
+
+def test_categorize_encodes_values_in_sorted_order():
+    table = categorical_table()
+    column = table._data[table.column_index("A")]
+    assert isinstance(column, CategoricalColumn)
+    assert column.codes.tolist() == [1, 0, -1, 1, 2]
+    assert_consistent(column, ["b", "a", None, "b", "c"])
+
+
+def test_insert_row_with_new_category_reorders_codes():
+    table = categorical_table()
+    table.insert_row(["aa", 0], 1)
+    table.insert_row([None, 6])
+    column = table._data[table.column_index("A")]
+    assert column.categories.tolist() == ["a", "aa", "b", "c"]
+    assert_consistent(column, ["b", "aa", "a", None, "b", "c", None])
+
+
+def test_sort_and_filter_keep_categories():
+    table = categorical_table()
+    table.sort(["A"])
+    assert table["A"] == [None, "a", "b", "b", "c"]
+    assert table["B"] == [3, 2, 1, 4, 5]
+    assert_consistent(table._data[table.column_index("A")], table["A"])
+
+    table.filter(lambda row: row["B"] > 2)
+    column = table._data[table.column_index("A")]
+    assert isinstance(column, CategoricalColumn)
+    assert_consistent(column, [None, "b", "c"])
+
+
+def test_concatenate_merges_categories():
+    table = categorical_table()
+    other = DataTable({"A": ["d", "a"], "B": [6, 7]})
+    other.categorize(["A"])
+    table.concatenate(other)
+    table.concatenate(DataTable({"A": ["0"], "B": [8]}))
+    column = table._data[table.column_index("A")]
+    assert column.categories.tolist() == ["0", "a", "b", "c", "d"]
+    assert_consistent(column, ["b", "a", None, "b", "c", "d", "a", "0"])
+
+
+def test_arrow_dictionary_round_trip():
+    table = categorical_table()
+    arrow_table = table.to_arrow_table
+    assert pa.types.is_dictionary(arrow_table.schema.field("A").type)
+    assert arrow_table.column("A").to_pylist() == table["A"]
+
+    restored = DataTable.from_arrow(arrow_table)
+    column = restored._data[restored.column_index("A")]
+    assert isinstance(column, CategoricalColumn)
+    assert_consistent(column, table["A"])
+
+
+def test_arrow_unsorted_dictionary_is_recoded():
+    array = pa.DictionaryArray.from_arrays(
+        pa.array([0, 1, None, 2, 0], pa.int32()), pa.array(["c", "a", "b"]))
+    column, datatype = CategoricalColumn.from_arrow(array)
+    assert datatype is str
+    assert column.codes.tolist() == [2, 0, -1, 1, 2]
+    assert_consistent(column, ["c", "a", None, "b", "c"])
+
+
+def test_categorize_mixed_types():
+    table = DataTable({"A": [1, 2.5, None, 1]})
+    table.categorize(["A"])
+    column = table._data[table.column_index("A")]
+    assert column.categories.tolist() == [1, 2.5]
+    assert table["A"] == [1, 2.5, None, 1]
+
+    table = DataTable({"A": [1, "a", None]})
+    with pytest.raises(ValueError):
+        table.categorize(["A"])
+    assert table["A"] == [1, "a", None]
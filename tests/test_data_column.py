@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+from pybox.datastore.data_column import DataColumn, CategoricalColumn
+from pybox.datastore.data_table import DataTable
+
+from datetime import date, datetime
+import pyarrow as pa
+
+
+def test_from_arrow_keeps_uint64_values_out_of_int64_range():
+    column, datatype = DataColumn.from_arrow(
+        pa.array([2**63 + 5, None, 1], pa.uint64()))
+    assert datatype is int
+    assert column.to_list() == [2**63 + 5, None, 1]
+
+
+def test_arrow_round_trip_with_nulls():
+    array = pa.array([1, None, 3], pa.int64())
+    column, datatype = DataColumn.from_arrow(array)
+    assert datatype is int
+    assert column.dtype == "int64"
+    assert column.null_count == 1
+    assert column.to_list() == [1, None, 3]
+    assert column.to_arrow().equals(array)
+
+
+def test_arrow_round_trip_of_timestamps_and_dates():
+    timestamps = pa.array([datetime(2021, 3, 1, 10, 30), None],
+                          pa.timestamp("us"))
+    column, datatype = DataColumn.from_arrow(timestamps)
+    assert datatype is datetime
+    assert column.to_list() == [datetime(2021, 3, 1, 10, 30), None]
+    assert column.to_arrow().to_pylist() == timestamps.to_pylist()
+
+    column, datatype = DataColumn.from_arrow(
+        pa.array([date(2021, 3, 1)], pa.date32()))
+    assert datatype is date
+    assert column.to_list() == [date(2021, 3, 1)]
+
+
+def test_arrow_round_trip_of_dictionary_arrays():
+    array = pa.array(["b", None, "a", "b"]).dictionary_encode()
+    column, datatype = DataColumn.from_arrow(array)
+    assert isinstance(column, CategoricalColumn)
+    assert datatype is str
+    assert column.categories.tolist() == ["a", "b"]
+    assert column.to_list() == ["b", None, "a", "b"]
+    assert pa.types.is_dictionary(column.to_arrow().type)
+    assert column.to_arrow().to_pylist() == ["b", None, "a", "b"]
+
+
+def test_arrow_buffers_are_copied_on_write():
+    array = pa.array([1.0, 2.0, 3.0])
+    column, _ = DataColumn.from_arrow(array)
+    column.set_item(0, 10.0)
+    assert array.to_pylist() == [1.0, 2.0, 3.0]
+
+    table = DataTable({"A": [1.0, 2.0, 3.0]})
+    arrow_table = table.to_arrow_table
+    table["A", 0] = 10.0
+    table.insert_row([0.0], 0)
+    assert arrow_table.column("A").to_pylist() == [1.0, 2.0, 3.0]
+    assert table["A"] == [0.0, 10.0, 2.0, 3.0]
+
+    restored = DataTable.from_arrow(arrow_table)
+    restored["A", 1] = 20.0
+    assert arrow_table.column("A").to_pylist() == [1.0, 2.0, 3.0]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+from pybox.datastore.data_table import DataTable
+from pybox.datastore.data_expression import col
+
+from datetime import date
+import pytest
+
+
+def _table(categorical=False):
+    table = DataTable({
+        "A": [1, None, 3, 4, 2],
+        "B": ["x", "y", None, "x", "z"],
+        "C": [1.5, 2.5, None, 0.5, 2.0],
+        "D": [date(2021, 1, 1), date(2021, 2, 1), None,
+              date(2021, 3, 1), date(2021, 2, 1)]
+    })
+    if categorical:
+        table.categorize(["B"])
+    return table
+
+
+def _valid(*values):
+    return all(value is not None for value in values)
+
+
+# Pairs of the same condition written as the expression and as the row
+# function, comparisons involving None are False in both of them.
+CONDITIONS = [
+    (col("A") > 2, lambda r: _valid(r["A"]) and r["A"] > 2),
+    (col("A") == 1, lambda r: r["A"] == 1),
+    (col("C") <= 1.5, lambda r: _valid(r["C"]) and r["C"] <= 1.5),
+    (col("B") == "x", lambda r: r["B"] == "x"),
+    (col("B") != "x", lambda r: _valid(r["B"]) and r["B"] != "x"),
+    (col("D") >= date(2021, 2, 1),
+     lambda r: _valid(r["D"]) and r["D"] >= date(2021, 2, 1)),
+    ((col("A") > 1) & (col("B") == "x"),
+     lambda r: _valid(r["A"]) and r["A"] > 1 and r["B"] == "x"),
+    ((col("A") > 3) | (col("B") == "y"),
+     lambda r: (_valid(r["A"]) and r["A"] > 3) or r["B"] == "y"),
+    (~(col("A") > 2), lambda r: not (_valid(r["A"]) and r["A"] > 2)),
+    (col("B").is_in(["x", "z"]), lambda r: r["B"] in ["x", "z"]),
+    (col("B").is_in(["x", None]),
+     lambda r: _valid(r["B"]) and r["B"] in ["x", None]),
+    (col("A").is_null(), lambda r: r["A"] is None),
+    (~col("C").is_null(), lambda r: r["C"] is not None),
+    (col("A") + col("C") > 3,
+     lambda r: _valid(r["A"], r["C"]) and r["A"] + r["C"] > 3),
+    (col("A") * 2 == col("C") * 2 + 1,
+     lambda r: _valid(r["A"], r["C"]) and r["A"] * 2 == r["C"] * 2 + 1),
+]
+
+
+def _columns(table):
+    return {name: table[name] for name in table.columns}
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+@pytest.mark.parametrize("expression, function", CONDITIONS)
+def test_expression_filter_matches_function_filter(expression, function,
+                                                   categorical):
+    by_expression, by_function = _table(categorical), _table(categorical)
+    expression_out = by_expression.filter(expression, True)
+    function_out = by_function.filter(function, True)
+    assert _columns(by_expression) == _columns(by_function)
+    assert _columns(expression_out) == _columns(function_out)
+
+
+def test_typed_columns_with_nulls_are_evaluated_as_masked_arrays():
+    table = _table()
+    values = (col("A") + 1).evaluate(table)
+    assert table.datatypes["A"] is int
+    assert values.tolist() == [2, None, 4, 5, 3]
+
+
+def test_expression_has_no_truth_value():
+    with pytest.raises(TypeError):
+        _table().filter(lambda r: col("A") > 1 and col("B") == "x")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+from pybox.datastore.data_table import DataTable
+
+import math
+import statistics
+import pytest
+
+DATA = {
+    "K1": ["a", "b", "a", None, "b", "a", None, "c"],
+    "K2": [1, 1, 2, 1, 1, 1, 1, None],
+    "Int": [1, 2, None, 4, 5, 6, 7, None],
+    "Float": [0.5, None, 2.5, 1.0, 4.0, -1.5, 3.0, None],
+    "Text": ["x", "y", "z", None, "w", "v", "u", None],
+}
+PYTHON_REDUCERS = {
+    "count": len,
+    "sum": lambda values: sum(values) if values else None,
+    "mean": lambda values: statistics.mean(values) if values else None,
+    "std": lambda values: (statistics.stdev(values) if len(values) > 1 else
+                           math.nan) if values else None,
+    "min": lambda values: min(values) if values else None,
+    "max": lambda values: max(values) if values else None,
+    "first": lambda values: values[0] if values else None,
+    "last": lambda values: values[-1] if values else None,
+    "n_unique": lambda values: len(set(values)) if values else None,
+}
+
+
+def _expected(keys, column_name, reducer):
+    """Return key tuples and reduced values, with groups in the order
+    of their first appearance and None values skipped."""
+    groups = dict()
+    for row in zip(*DATA.values()):
+        row = dict(zip(DATA, row))
+        values = groups.setdefault(tuple(row[key] for key in keys), list())
+        if row[column_name] is not None:
+            values.append(row[column_name])
+    return list(groups), [reducer(values) for values in groups.values()]
+
+
+def _aggregated(keys, column_name, reducer, categorical=False):
+    table = DataTable(dict(DATA))
+    if categorical:
+        table.categorize(["K1"])
+    result = table.group_by(keys).aggregate({"Out": (column_name, reducer)})
+    return list(zip(*(result[key] for key in keys))), result["Out"]
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+@pytest.mark.parametrize("keys", [["K1"], ["K2"], ["K1", "K2"]])
+@pytest.mark.parametrize("reducer", list(PYTHON_REDUCERS))
+@pytest.mark.parametrize("column_name", ["Int", "Float"])
+def test_numeric_reducers(column_name, reducer, keys, categorical):
+    expected_keys, expected = _expected(keys, column_name,
+                                        PYTHON_REDUCERS[reducer])
+    result_keys, result = _aggregated(keys, column_name, reducer, categorical)
+    assert result_keys == expected_keys
+    assert result == pytest.approx(expected, nan_ok=True)
+
+
+@pytest.mark.parametrize("reducer", ["count", "min", "max", "first", "last",
+                                     "n_unique"])
+def test_text_reducers(reducer):
+    assert _aggregated(["K1"], "Text", reducer) == _expected(
+        ["K1"], "Text", PYTHON_REDUCERS[reducer])
+
+
+def test_custom_reducer_receives_group_values():
+    def joined(values):
+        return "-".join(values)
+
+    # Function is not called for groups without any valid value.
+    assert _aggregated(["K1", "K2"], "Text", joined) == _expected(
+        ["K1", "K2"], "Text", lambda values: joined(values)
+        if values else None)
+
+
+def test_reducer_defaults_to_output_column():
+    table = DataTable(dict(DATA))
+    result = table.group_by("K1").aggregate({"Int": "sum"})
+    assert result.columns == ["K1", "Int"]
+    assert result["Int"] == [7, 7, 11, None]
+
+
+def test_wrong_reducer_raises():
+    with pytest.raises(ValueError):
+        DataTable(dict(DATA)).group_by("K1").aggregate({"Int": "median"})
+
+
+def test_empty_table():
+    table = DataTable({"K": [1], "V": [1.5]})
+    table.filter(lambda row: False)
+    result = table.group_by("K").aggregate({"V": "sum", "N": ("V", "count")})
+    assert result.length == 0
+    assert result.columns == ["K", "V", "N"]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+import pybox.datastore.data_column as pbdsdc
+from pybox.datastore.data_table import DataTable
+from pybox.datastore.data_join import join_indices
+
+import pytest
+
+INNER = {"Key": [1, 2, 2, None, 4], "Inner": ["a", "b", "c", "d", "e"]}
+# Outer keys are sorted (nulls aside), as required by the merge join.
+OUTER = {"Key": [None, 1, 2, 2, 3], "Outer": [10, 20, 30, 40, 50]}
+
+
+def _expected_rows(inner, outer, keys, join_type):
+    """Return joined rows computed with nested loops."""
+    inner_rows = list(zip(*inner.values()))
+    outer_rows = list(zip(*outer.values()))
+    inner_keys = [list(inner).index(key) for key in keys]
+    outer_keys = [list(outer).index(key) for key in keys]
+    outer_values = [
+        idx for idx, name in enumerate(outer) if name not in keys
+    ]
+
+    def key_of(row, positions):
+        key = tuple(row[position] for position in positions)
+        return None if None in key else key
+
+    rows, matched = list(), set()
+    for inner_row in inner_rows:
+        matches = [
+            outer_idx for outer_idx, outer_row in enumerate(outer_rows)
+            if key_of(inner_row, inner_keys) is not None
+            and key_of(inner_row, inner_keys) == key_of(outer_row, outer_keys)
+        ]
+        matched.update(matches)
+        for outer_idx in matches:
+            rows.append(inner_row + tuple(outer_rows[outer_idx][idx]
+                                          for idx in outer_values))
+        if not matches and join_type in ["left", "outer"]:
+            rows.append(inner_row + (None, ) * len(outer_values))
+    if join_type in ["right", "outer"]:
+        for outer_idx, outer_row in enumerate(outer_rows):
+            if outer_idx in matched:
+                continue
+            row = [None] * len(inner)
+            for inner_key, outer_key in zip(inner_keys, outer_keys):
+                row[inner_key] = outer_row[outer_key]
+            rows.append(
+                tuple(row) + tuple(outer_row[idx] for idx in outer_values))
+    return rows
+
+
+def _joined_rows(inner, outer, keys, join_type, join_method="hash"):
+    table = DataTable(dict(inner))
+    table.join(DataTable(dict(outer)), keys, keys, join_type, join_method)
+    return list(zip(*(table[name] for name in table.columns)))
+
+
+@pytest.mark.parametrize("join_method", ["hash", "merge"])
+@pytest.mark.parametrize("join_type", ["inner", "left", "right", "outer"])
+def test_join_matches_nested_loops(join_type, join_method):
+    assert _joined_rows(INNER, OUTER, ["Key"], join_type, join_method) == \
+        _expected_rows(INNER, OUTER, ["Key"], join_type)
+
+
+@pytest.mark.parametrize("join_type", ["inner", "left", "right", "outer"])
+def test_multi_column_keys(join_type):
+    inner = {"K1": [1, 1, 2, None], "K2": ["x", "y", "x", "x"],
+             "Inner": [1.5, 2.5, 3.5, 4.5]}
+    outer = {"K1": [1, 1, 2, 3], "K2": ["y", "y", "z", "x"],
+             "Outer": [True, False, True, False]}
+    assert _joined_rows(inner, outer, ["K1", "K2"], join_type) == \
+        _expected_rows(inner, outer, ["K1", "K2"], join_type)
+
+
+def test_merge_and_hash_join_indices_are_equal():
+    inner_keys = [3, 1, None, 2, 2, 5]
+    outer_keys = [1, 2, 2, 2, 3, 4]
+    for join_type in ["inner", "left", "right", "outer"]:
+        hashed = join_indices(inner_keys, outer_keys, join_type, "hash")
+        merged = join_indices(inner_keys, outer_keys, join_type, "merge")
+        assert [indices.tolist() for indices in hashed] == \
+            [indices.tolist() for indices in merged]
+
+
+def test_merge_join_requires_sorted_outer_keys():
+    with pytest.raises(ValueError):
+        join_indices([1, 2], [2, 1], "inner", "merge")
+
+
+def test_outer_join_keeps_categorical_key_column():
+    table = DataTable({"Key": ["a", "b"], "Inner": [1, 2]})
+    table.categorize(["Key"])
+    table.join(DataTable({"Key": ["b", "c"], "Outer": [3, 4]}), "Key", "Key",
+               "outer")
+    key_column = table._data[table.column_index("Key")]
+    assert isinstance(key_column, pbdsdc.CategoricalColumn)
+    assert table["Key"] == ["a", "b", "c"]
+    assert table["Outer"] == [None, 3, 4]
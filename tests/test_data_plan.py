@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+from pybox.datastore.data_table import DataTable
+from pybox.datastore.data_expression import col
+
+import pytest
+
+
+def _tables():
+    inner = DataTable({"Key": [1, 2, 3], "Value": [10, 20, 30]})
+    outer = DataTable({"Key": [1, 2, 3], "Value": [30, 20, 10],
+                       "Other": [3, 2, 1]})
+    return inner, outer
+
+
+def test_filter_on_outer_column_is_pushed_to_outer_table():
+    inner, outer = _tables()
+    plan = inner.lazy().join(outer, "Key", "Key",
+                             "inner").filter(col("Other") > 1)
+    assert [step[0] for step in plan.optimized_steps()] == ["join"]
+    assert plan.collect()["Key"] == [1, 2]
+
+
+def test_filter_on_overlapping_column_is_not_pushed_down():
+    inner, outer = _tables()
+    plan = inner.lazy().join(outer, "Key", "Key",
+                             "inner").filter(col("Value") > 15)
+    assert [step[0] for step in plan.optimized_steps()] == ["join", "filter"]
+    assert plan.collect()["Key"] == [2, 3]
+
+
+def _source():
+    return DataTable({
+        "Label": ["b", "a", "b", "c", "a", None],
+        "Score": [3, 1, 4, 1, 5, 9],
+        "Weight": [0.5, 1.5, 2.5, 3.5, 4.5, 5.5],
+        "Body": ["Aa", "Bb", "Cc", "Dd", "Ee", "Ff"]
+    })
+
+
+def _eager(steps):
+    """Return the source table with steps executed one by one."""
+    table = _source()
+    for operation, *arguments in steps:
+        if operation == "select":
+            table = table.separate_columns(*arguments)
+        else:
+            getattr(table, operation)(*arguments)
+    return {name: table[name] for name in table.columns}
+
+
+def _lazy(steps, source=None):
+    plan = (_source() if source is None else source).lazy()
+    for operation, *arguments in steps:
+        plan = getattr(plan, operation)(*arguments)
+    return plan
+
+
+PLANS = [
+    [("filter", col("Score") > 1), ("filter", col("Label") == "b")],
+    [("apply", "Body", str.lower), ("apply", "Body", lambda v: v + "!"),
+     ("filter", col("Score") >= 3)],
+    [("sort", ["Score"], True), ("filter", col("Weight") > 1.0),
+     ("select", ["Score", "Weight"])],
+    [("apply", "Body", str.upper), ("select", ["Label", "Score"]),
+     ("filter", col("Label").is_in(["a", "b"]))],
+    [("filter", lambda row: row["Score"] % 2 == 1),
+     ("apply", "Weight", lambda v: v * 2), ("sort", ["Label", "Score"])],
+    [("join", DataTable({"Label": ["a", "b"], "Group": [1, 2]}), "Label",
+      "Label", "inner"), ("filter", col("Group") == 2),
+     ("filter", col("Score") > 3)],
+]
+
+
+@pytest.mark.parametrize("steps", PLANS)
+def test_collect_matches_eager_execution(steps):
+    source = _source()
+    collected = _lazy(steps, source).collect()
+    assert {name: collected[name] for name in collected.columns} == \
+        _eager(steps)
+    assert {name: source[name] for name in source.columns} == \
+        {name: _source()[name] for name in source.columns}
+
+
+def test_consecutive_filters_are_merged():
+    steps = _lazy(PLANS[0]).optimized_steps()
+    assert [step[0] for step in steps] == ["filter"]
+
+
+def test_maps_are_fused_and_filters_pushed_before_them():
+    steps = _lazy(PLANS[1]).optimized_steps()
+    assert [step[0] for step in steps] == ["filter", "apply"]
+    assert steps[1][2]("Ab") == "ab!"
+
+
+def test_filters_are_pushed_before_sort_and_select():
+    steps = _lazy(PLANS[2]).optimized_steps()
+    assert [step[0] for step in steps] == ["filter", "sort", "select"]
+
+
+def test_maps_of_unused_columns_are_pruned():
+    steps = _lazy(PLANS[3]).optimized_steps()
+    assert [step[0] for step in steps] == ["filter", "select"]
+
+
+def test_filter_on_mapped_column_stays_after_map():
+    plan = _source().lazy().apply("Score", lambda v: v * 10).filter(
+        col("Score") > 30)
+    assert [step[0] for step in plan.optimized_steps()] == ["apply", "filter"]
+    assert plan.collect()["Score"] == [40, 50, 90]
+
+
+def test_collected_table_does_not_share_source_buffers():
+    source = _source()
+    collected = source.lazy().select(["Score"]).collect()
+    collected["Score", 0] = 100
+    collected.insert_row([0], 0)
+    assert source["Score"] == [3, 1, 4, 1, 5, 9]
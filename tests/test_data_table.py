@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+from pybox.datastore.data_table import DataTable
+
+
+def _table():
+    return DataTable({"A": [1, 2, 3, 4], "B": ["a", "b", "c", "d"]})
+
+
+def test_source_set_item_does_not_change_views():
+    table = _table()
+    rows, columns = table[1:3], table[["A"]]
+    separated = table.separate_columns(["A"])
+    table["A", 1] = 100
+    assert rows["A"] == [2, 3]
+    assert columns["A"] == [1, 2, 3, 4]
+    assert separated["A"] == [1, 2, 3, 4]
+    assert table["A"] == [1, 100, 3, 4]
+
+
+def test_source_insert_row_does_not_change_views():
+    table = _table()
+    rows = table[0:3]
+    table.insert_row([0, "z"], 0)
+    assert rows["A"] == [1, 2, 3]
+    assert rows["B"] == ["a", "b", "c"]
+    assert table["A"] == [0, 1, 2, 3, 4]
+
+
+def test_source_missing_values_do_not_change_views():
+    table = _table()
+    table["A", 0] = None
+    rows = table[0:2]
+    table["A", 0] = 10
+    table["A", 1] = None
+    assert rows["A"] == [None, 2]
+    assert table["A"] == [10, None, 3, 4]
+
+
+def test_view_modification_does_not_change_source():
+    table = _table()
+    rows = table[0:2]
+    rows["A", 0] = -1
+    rows.insert_row([5, "e"])
+    assert rows["A"] == [-1, 2, 5]
+    assert table["A"] == [1, 2, 3, 4]
+
+
+def test_categorical_source_does_not_change_views():
+    table = _table()
+    table.categorize(["B"])
+    rows = table[0:2]
+    table["B", 0] = "q"
+    table.insert_row([0, "a"], 1)
+    assert rows["B"] == ["a", "b"]
+    assert table["B"] == ["q", "a", "b", "c", "d"]
+
+
+def test_fill_null_converts_compatible_values():
+    table = DataTable({"A": [1.5, None], "B": [1, None]})
+    table.fill_null(2)
+    assert table["A"] == [1.5, 2.0]
+    assert table["B"] == [1, 2]
+    assert table.datatypes == {"A": float, "B": int}
+
+
+def test_fill_null_with_incompatible_value_converts_to_object():
+    table = DataTable({"A": [1, None]})
+    table.fill_null("z")
+    assert table["A"] == [1, "z"]
+    assert table.datatypes["A"] is object
+
+
+def test_insert_row_grows_buffers_geometrically():
+    table = DataTable({"A": [1], "B": [1.5]})
+    column = table._data[table.column_index("A")]
+    capacities = set()
+    for value in range(2, 1001):
+        table.insert_row([value, None])
+        capacities.add(len(column._buffer))
+    assert table["A"] == list(range(1, 1001))
+    assert len(capacities) <= 12
+    assert 1000 <= len(column._buffer) < 2000
+
+
+def test_missing_values_keep_typed_buffers():
+    table = DataTable({"A": [1, 2, 3], "B": [1.5, 2.5, 3.5]})
+    table.insert_row([None, 4.5], 1)
+    table.insert_row([5, None])
+    column_a = table._data[table.column_index("A")]
+    column_b = table._data[table.column_index("B")]
+    assert column_a.dtype == "int64"
+    assert column_b.dtype == "float64"
+    assert column_a.validity.tolist() == [True, False, True, True, True]
+    assert column_b.null_count == 1
+    assert table["A"] == [1, None, 2, 3, 5]
+    assert table["B"] == [1.5, 4.5, 2.5, 3.5, None]
+
+    table["A", 1] = 7
+    assert column_a.null_count == 0
+    assert table["A"] == [1, 7, 2, 3, 5]
+
+
+def test_to_list_after_inserting_and_removing_rows():
+    table = _table()
+    table.insert_row([0, None], 0)
+    table.insert_row([None, "e"])
+    table.insert_row([10, "x"], 3)
+    assert table["A"] == [0, 1, 2, 10, 3, 4, None]
+    assert table["B"] == [None, "a", "b", "x", "c", "d", "e"]
+
+    table.filter(lambda row: row["A"] is not None and row["A"] % 2 == 0)
+    assert table["A"] == [0, 2, 10, 4]
+    assert table["B"] == [None, "b", "x", "d"]
+    table.insert_row([None, "y"], 2)
+    assert table["A"] == [0, 2, None, 10, 4]
+    assert table.length == 5
+
+
+def test_shared_copy_is_copied_on_write():
+    table = _table()
+    table["A", 3] = None
+    copied = table.shared_copy(rows=slice(1, None))
+    assert copied["A"] == [2, 3, None]
+
+    copied["A", 1] = 30
+    copied["B", 0] = "q"
+    assert table["A"] == [1, 2, 3, None]
+    assert table["B"] == ["a", "b", "c", "d"]
+
+    table["A", 1] = 20
+    table.insert_row([5, "e"])
+    assert copied["A"] == [2, 30, None]
+    assert copied["B"] == ["q", "c", "d"]
+    assert table["A"] == [1, 20, 3, None, 5]
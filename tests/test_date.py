@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+from pybox.helpers.date import to_date, to_datetime, to_datetime64
+
+from datetime import date, datetime
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("datatype, transform", [(datetime, to_datetime),
+                                                 (date, to_date)])
+def test_non_iso_strings_are_parsed_as_scalars(datatype, transform):
+    strings = ["20210301", "2021", "2021-03-01", "2021-03-01 10:30:15"]
+    expected = [np.datetime64(transform(string)) for string in strings]
+    parsed = to_datetime64(strings, datatype)
+    assert parsed.tolist() == np.array(expected, dtype=parsed.dtype).tolist()
+
+
+@pytest.mark.parametrize("string", ["1614592800", "today", ""])
+def test_invalid_strings_are_not_parsed_by_numpy(string):
+    with pytest.raises(ValueError):
+        to_datetime64(["2021-03-01", string])
+
+
+def test_missing_and_date_inputs():
+    parsed = to_datetime64([None, date(2021, 3, 1), "2021-03-02"], date)
+    assert parsed.astype(str).tolist() == ["NaT", "2021-03-01", "2021-03-02"]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+from pybox.GLOBALS import APP_PATH
+
+import os
+import logging
+import sys
+import subprocess
+import pytest
+
+# Cumulative import time budget of the lightweight modules, in microseconds.
+IMPORT_TIME_BUDGET = 150000
+HEAVY_MODULES = [
+    "numpy", "pandas", "pyarrow", "nltk", "torch", "spacy", "gensim",
+    "selenium", "IPython", "yaml", "tabulate", "tqdm", "requests", "xmltodict"
+]
+
+
+def _run_python(code, *options):
+    environment = dict(os.environ, PYTHONPATH=APP_PATH)
+    return subprocess.run([sys.executable, *options, "-c", code],
+                          capture_output=True,
+                          text=True,
+                          check=True,
+                          env=environment)
+
+
+@pytest.mark.parametrize("module_name", ["pybox", "pybox.run_task"])
+def test_import_time(module_name):
+    result = _run_python(f"import {module_name}", "-X", "importtime")
+    cumulative_times = {
+        name.strip(): int(cumulative)
+        for _, cumulative, name in (line.split("|")[-3:]
+                                    for line in result.stderr.splitlines()
+                                    if line.startswith("import time:"))
+        if cumulative.strip().isdigit()
+    }
+    assert cumulative_times[module_name] < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize("module_name", ["pybox", "pybox.run_task"])
+def test_heavy_modules_are_not_imported(module_name):
+    result = _run_python(f"import sys, {module_name}; "
+                         "print(' '.join(sorted(sys.modules)))")
+    assert not set(HEAVY_MODULES) & set(result.stdout.split())
+
+
+def test_import_does_not_configure_logging():
+    result = _run_python("import logging, pybox.GLOBALS; "
+                         "root = logging.getLogger(); "
+                         "print(root.level, len(root.handlers))")
+    assert result.stdout.split() == [str(logging.WARNING), "0"]
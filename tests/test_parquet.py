@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+import pybox.datastore.data_flow as pbdsdf
+from pybox.datastore.data_column import CategoricalColumn
+from pybox.datastore.data_flow import (iter_parquet_batches,
+                                       table_from_parquet, table_to_parquet)
+from pybox.datastore.data_table import DataTable
+
+from datetime import datetime
+import os
+import pytest
+
+
+def _table(length=100):
+    return DataTable({
+        "Id": list(range(length)),
+        "Label": [["x", "y", None][idx % 3] for idx in range(length)],
+        "Score": [None if idx % 7 == 0 else idx / 2 for idx in range(length)],
+        "Time": [datetime(2021, 1, 1, idx % 24) for idx in range(length)]
+    })
+
+
+def test_round_trip(tmp_path):
+    table = _table()
+    table_to_parquet(table, "Data", str(tmp_path))
+    loaded = table_from_parquet("Data", str(tmp_path))
+    assert loaded.columns == table.columns
+    assert loaded.datatypes == table.datatypes
+    for column in table.columns:
+        assert loaded[column] == table[column]
+
+
+def test_columns_filters_and_categorical(tmp_path):
+    table_to_parquet(_table(), "Data", str(tmp_path))
+    loaded = table_from_parquet("Data",
+                                str(tmp_path),
+                                columns=["Label", "Id"],
+                                filters=[("Id", ">=", 95)],
+                                categorical=["Label"])
+    assert loaded.columns == ["Label", "Id"]
+    assert loaded["Id"] == [95, 96, 97, 98, 99]
+    assert loaded["Label"] == [None, "x", "y", None, "x"]
+    column = loaded._data[loaded.column_index("Label")]
+    assert isinstance(column, CategoricalColumn)
+    assert column.categories.tolist() == ["x", "y"]
+
+    loaded = table_from_parquet("Data",
+                                str(tmp_path),
+                                filters=[[("Id", "<", 2)], [("Id", ">", 98)]])
+    assert loaded["Id"] == [0, 1, 99]
+
+
+def test_categorical_columns_are_written_as_dictionaries(tmp_path):
+    table = _table()
+    table.categorize(["Label"])
+    table_to_parquet(table, "Data", str(tmp_path))
+    loaded = table_from_parquet("Data", str(tmp_path))
+    assert isinstance(loaded._data[loaded.column_index("Label")],
+                      CategoricalColumn)
+    assert loaded["Label"] == table["Label"]
+
+
+@pytest.mark.parametrize("filters", [None, [("Id", "<", 50)]])
+def test_iter_parquet_batches(tmp_path, filters):
+    table = _table()
+    table_to_parquet(table, "Data", str(tmp_path))
+    batches = list(
+        iter_parquet_batches("Data",
+                             str(tmp_path),
+                             batch_size=16,
+                             columns=["Id", "Label"],
+                             filters=filters,
+                             categorical=["Label"]))
+    length = 100 if filters is None else 50
+    assert all(batch.length <= 16 for batch in batches)
+    assert all(batch.columns == ["Id", "Label"] for batch in batches)
+    assert all(
+        isinstance(batch._data[batch.column_index("Label")],
+                   CategoricalColumn) for batch in batches)
+    assert sum((batch["Id"] for batch in batches), []) == list(range(length))
+    assert sum((batch["Label"] for batch in batches),
+               []) == table["Label"][:length]
+
+    with pytest.raises(FileNotFoundError):
+        iter_parquet_batches("Missing", str(tmp_path))
+
+
+def test_write_replaces_file_atomically(tmp_path, monkeypatch):
+    table_to_parquet(_table(10), "Data", str(tmp_path))
+    # Hard link, as made by the task cache, keeps the replaced version.
+    os.link(tmp_path / "Data.parquet", tmp_path / "Cached.parquet")
+    table_to_parquet(_table(20), "Data", str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ["Cached.parquet", "Data.parquet"]
+    assert table_from_parquet("Data", str(tmp_path)).length == 20
+    assert table_from_parquet("Cached", str(tmp_path)).length == 10
+
+    def interrupted(source, destination):
+        raise OSError("Interrupted write.")
+
+    monkeypatch.setattr(pbdsdf.os, "replace", interrupted)
+    with pytest.raises(OSError):
+        table_to_parquet(_table(30), "Data", str(tmp_path))
+    assert table_from_parquet("Data", str(tmp_path)).length == 20
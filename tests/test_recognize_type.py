@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+from pybox.helpers.data import promote_types, recognize_type
+
+from datetime import date, datetime
+import pytest
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([1, 2, None], int),
+    ([1, 2.5, None], float),
+    ([1, 2.5, 1j], complex),
+    ([date(2021, 1, 1), datetime(2021, 1, 1, 10)], datetime),
+    ([1, "a"], object),
+    ([None, None], type(None)),
+    ([], type(None)),
+])
+def test_types_are_promoted(values, expected):
+    assert recognize_type(values) is expected
+
+
+def test_promote_types():
+    assert promote_types({float, int}) is float
+    assert promote_types({int, bool}) is object
+    assert promote_types(set()) is type(None)
+
+
+def test_short_vectors_are_inspected_whole():
+    values = [1] * 900 + ["a"]
+    assert recognize_type(values) is object
+    assert recognize_type(values[::-1]) is object
+
+
+def test_mixed_numbers_are_recognized_on_sample():
+    values = [float(value) if value % 50 == 0 else value
+              for value in range(100000)]
+    assert recognize_type(values) is float
+
+
+def test_rare_string_is_missed_by_sample():
+    values = list(range(100000))
+    values[0] = "a"
+    # Share of the strings is far below the tolerance.
+    assert recognize_type(values) is int
+    assert recognize_type(values, confidence=0.5, tolerance=0.5) is int
+    assert recognize_type(values, confidence=0.99, tolerance=1e-6) is object
+
+
+def test_frequent_string_is_found_by_sample():
+    values = ["a" if value % 100 == 0 else value for value in range(100000)]
+    assert recognize_type(values) is object
+
+
+def test_iterables_are_sampled_by_prefix():
+    values = (value if value < 10 else "a" for value in range(100000))
+    assert recognize_type(values) is object
+    values = (value if value < 2000 else "a" for value in range(100000))
+    assert recognize_type(values) is int
+
+
+@pytest.mark.parametrize("values, expected", [
+    (["2021-03-01", None, "2021-03-02"], date),
+    (["2021-03-01T10:30:15", "2021-03-01 10:30+01:00"], datetime),
+    (["2021-03-01", "2021-03-01T10:30:15.123456Z"], datetime),
+    (["2021-03-01", "March 1st"], str),
+    (["20210301"], str),
+])
+def test_parse_dates(values, expected):
+    assert recognize_type(values, parse_dates=True) is expected
+    assert recognize_type(values) is str
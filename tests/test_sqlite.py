@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+import pybox.datastore.database as pbdsdb
+from pybox.datastore.data_flow import table_from_sqlite, table_to_sqlite
+from pybox.datastore.data_table import DataTable
+
+from datetime import date
+import sqlite3
+import threading
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def close_connections():
+    yield
+    pbdsdb.close_connections()
+
+
+def _table():
+    return DataTable({
+        "Id": [1, 2, 3],
+        "Name": ["a", None, "c"],
+        "Score": [1.5, 2.5, None],
+        "Day": [date(2021, 1, 1), date(2021, 1, 2), None]
+    })
+
+
+def test_round_trip_keeps_values_and_types(tmp_path):
+    table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path))
+    loaded = table_from_sqlite("Scores", "TEST", str(tmp_path))
+    assert loaded.columns == ["Id", "Name", "Score", "Day"]
+    assert loaded.datatypes == {
+        "Id": int,
+        "Name": str,
+        "Score": float,
+        "Day": date
+    }
+    for column in loaded.columns:
+        assert loaded[column] == _table()[column]
+
+
+def test_columns_where_and_parameters(tmp_path):
+    table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path))
+    loaded = table_from_sqlite("Scores",
+                               "TEST",
+                               str(tmp_path),
+                               columns=["Score", "Id"],
+                               where="Id >= ?",
+                               parameters=(2, ),
+                               chunk_size=1)
+    assert loaded.columns == ["Score", "Id"]
+    assert loaded["Id"] == [2, 3]
+    assert loaded["Score"] == [2.5, None]
+
+    loaded = table_from_sqlite("Scores",
+                               "TEST",
+                               str(tmp_path),
+                               where="Name = :name",
+                               parameters={"name": "c"})
+    assert loaded["Id"] == [3]
+
+    with pytest.raises(ValueError):
+        table_from_sqlite("Scores", "TEST", str(tmp_path), columns=["Other"])
+
+
+def test_if_exists(tmp_path):
+    table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path))
+    with pytest.raises(ValueError):
+        table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path))
+    with pytest.raises(ValueError):
+        table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path),
+                        if_exists="update")
+
+    table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path),
+                    if_exists="append")
+    assert table_from_sqlite("Scores", "TEST",
+                             str(tmp_path))["Id"] == [1, 2, 3, 1, 2, 3]
+
+    table_to_sqlite(DataTable({"Id": [7]}), "Scores", "TEST", str(tmp_path),
+                    if_exists="replace")
+    loaded = table_from_sqlite("Scores", "TEST", str(tmp_path))
+    assert loaded.columns == ["Id"]
+    assert loaded["Id"] == [7]
+
+
+def test_key_upserts_rows(tmp_path):
+    table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path), key="Id")
+    update = DataTable({
+        "Id": [3, 4],
+        "Name": ["x", "d"],
+        "Score": [3.5, 4.5],
+        "Day": [None, date(2021, 1, 4)]
+    })
+    table_to_sqlite(update, "Scores", "TEST", str(tmp_path),
+                    if_exists="append", key="Id", batch_size=1)
+    loaded = table_from_sqlite("Scores", "TEST", str(tmp_path))
+    assert loaded["Id"] == [1, 2, 3, 4]
+    assert loaded["Name"] == ["a", None, "x", "d"]
+    assert loaded["Score"] == [1.5, 2.5, 3.5, 4.5]
+
+    with pytest.raises(ValueError):
+        table_to_sqlite(update, "Scores", "TEST", str(tmp_path),
+                        if_exists="append", key="Other")
+
+
+def test_bulk_load_restores_synchronous_mode(tmp_path):
+    conn = pbdsdb.create_connection("TEST", str(tmp_path))
+    conn.execute("PRAGMA synchronous=FULL")
+    table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path), bulk_load=True)
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    assert table_from_sqlite("Scores", "TEST", str(tmp_path))["Id"] == [1, 2, 3]
+
+
+def test_connections_are_cached_per_thread(tmp_path):
+    conn = pbdsdb.create_connection("TEST", str(tmp_path))
+    assert pbdsdb.create_connection("TEST", str(tmp_path)) is conn
+    assert pbdsdb.create_connection("TEST", str(tmp_path),
+                                    read_only=True) is not conn
+
+    connections = list()
+
+    def connect():
+        connections.append(pbdsdb.create_connection("TEST", str(tmp_path)))
+        pbdsdb.close_connections()
+
+    thread = threading.Thread(target=connect)
+    thread.start()
+    thread.join()
+    assert connections[0] is not None
+    assert connections[0] is not conn
+    assert pbdsdb.create_connection("TEST", str(tmp_path)) is conn
+
+
+def test_connections_are_reset_in_child_process(tmp_path, monkeypatch):
+    conn = pbdsdb.create_connection("TEST", str(tmp_path))
+    pid = pbdsdb.os.getpid()
+    monkeypatch.setattr(pbdsdb.os, "getpid", lambda: pid + 1)
+    child_conn = pbdsdb.create_connection("TEST", str(tmp_path))
+    assert child_conn is not conn
+    monkeypatch.undo()
+    child_conn.close()
+    assert pbdsdb.create_connection("TEST", str(tmp_path)) is not child_conn
+
+
+def test_read_only_connection(tmp_path):
+    assert pbdsdb.create_connection("MISSING", str(tmp_path),
+                                    read_only=True) is None
+    table_to_sqlite(_table(), "Scores", "TEST", str(tmp_path))
+    conn = pbdsdb.create_connection("TEST", str(tmp_path), read_only=True)
+    assert conn.execute("SELECT count(*) FROM Scores").fetchone()[0] == 3
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM Scores")
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+import pybox.task_cache as pbtc
+
+import os
+
+
+def _cache_with_blobs(directory):
+    cache = pbtc.TaskCache(str(directory))
+    for name in ["unreferenced", "unreferenced.tmp123"]:
+        with open(f"{cache.blobs_directory}/{name}", "w") as file:
+            file.write("output")
+    return cache
+
+
+def test_evict_keeps_recent_and_temporary_blobs(tmp_path):
+    cache = _cache_with_blobs(tmp_path)
+    cache.evict(max_bytes=0)
+    assert sorted(os.listdir(cache.blobs_directory)) == [
+        "unreferenced", "unreferenced.tmp123"
+    ]
+
+
+def test_evict_removes_old_unreferenced_blobs(tmp_path, monkeypatch):
+    cache = _cache_with_blobs(tmp_path)
+    monkeypatch.setattr(pbtc, "EVICTION_GRACE_SECONDS", -60)
+    cache.evict(max_bytes=0)
+    assert os.listdir(cache.blobs_directory) == ["unreferenced.tmp123"]
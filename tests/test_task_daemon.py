@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+from pybox.GLOBALS import APP_PATH
+from pybox.task_client import DaemonNotRunningError, send_task_request
+
+import os
+import sys
+import time
+import subprocess
+import pytest
+
+
+@pytest.fixture
+def daemon_socket(tmp_path):
+    socket_path = str(tmp_path / "daemon.sock")
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "pybox.task_daemon", "--socket", socket_path],
+        env=dict(os.environ, PYTHONPATH=APP_PATH),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while not os.path.exists(socket_path) and time.time() < deadline:
+        time.sleep(0.1)
+    yield socket_path
+    daemon.terminate()
+    daemon.wait()
+
+
+def test_task_output_is_sent_to_the_client(daemon_socket, capsys):
+    assert send_task_request("NewsScrap -ti", daemon_socket)
+    assert "Task Info:" in capsys.readouterr().out
+
+
+def test_task_log_is_sent_to_the_client(daemon_socket, capsys):
+    assert send_task_request("NoSuchTask", daemon_socket)
+    assert "`NoSuchTask` has not been found" in capsys.readouterr().out
+
+
+def test_missing_daemon_is_reported(tmp_path):
+    with pytest.raises(DaemonNotRunningError):
+        send_task_request("NoSuchTask", str(tmp_path / "missing.sock"))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+import pybox.run_task as pbrt
+import pybox.artifact_store as pbas
+from pybox.task_profile import PROFILE_FILE_NAME
+from pybox.task_registry import TaskRegistry
+
+import json
+import pstats
+
+TASKS_SOURCE = """
+from pybox.task import Task
+from pybox.datastore.data_table import DataTable
+
+
+def create_source():
+    return DataTable({"A": list(range(10))})
+
+
+def double_source(source):
+    source["A"] = [2 * value for value in source["A"]]
+    return source
+
+
+source_task = Task(task_name="Source", task_info="")
+source_task.run(create_source, task_outputs=["Source"])
+double_task = Task(task_name="Double", task_info="")
+double_task.run(double_source, task_inputs=["Source"], task_outputs=["Double"])
+"""
+
+
+def test_profiled_task_run(tmp_path, monkeypatch):
+    tasks_directory = tmp_path / "boxes" / "box" / "tasks"
+    tasks_directory.mkdir(parents=True)
+    (tasks_directory / "tasks.py").write_text(TASKS_SOURCE)
+    monkeypatch.setattr(
+        pbrt, "_TASK_REGISTRY",
+        TaskRegistry(str(tmp_path / "boxes"), str(tmp_path / "registry.json")))
+    (tmp_path / "data").mkdir()
+    data = str(tmp_path / "data")
+
+    try:
+        for name in ["Source", "Double"]:
+            pbrt.run_selected_module(name,
+                                     data,
+                                     data,
+                                     use_cache=False,
+                                     profile=True)
+        pbas.ARTIFACT_STORE.wait()
+    finally:
+        pbas.ARTIFACT_STORE.clear()
+
+    with open(f"{data}/{PROFILE_FILE_NAME}") as profile_file:
+        records = [json.loads(line) for line in profile_file]
+    assert [record["task"] for record in records] == ["Source", "Double"]
+    for record in records:
+        assert set(record) == {
+            "task", "started", "pid", "cached", "stages", "peak_rss",
+            "inputs", "outputs"
+        }
+        assert record["cached"] is False
+        assert record["peak_rss"] > 0
+        assert {"main_function", "store_outputs",
+                "write_outputs"} <= set(record["stages"])
+        for timing in record["stages"].values():
+            assert set(timing) == {"wall", "cpu"}
+            assert timing["wall"] >= 0
+        output = record["outputs"][0]
+        assert set(output) == {"name", "rows", "bytes", "memory"}
+        assert output["name"] == record["task"]
+        assert output["rows"] == 10
+        assert output["bytes"] == (tmp_path / "data" /
+                                   f"{record['task']}.parquet").stat().st_size
+
+    source, double = records
+    assert source["inputs"] == list()
+    assert "load_inputs" in double["stages"]
+    assert [(task_input["name"], task_input["rows"], task_input["bytes"])
+            for task_input in double["inputs"]
+            ] == [("Source", 10, source["outputs"][0]["bytes"])]
+
+    stats = pstats.Stats(f"{data}/Double.pstats")
+    profiled = {function for _, _, function in stats.stats}
+    assert "double_source" in profiled
+    assert "create_source" not in profiled
+    assert (tmp_path / "data" / "Source.pstats").exists()
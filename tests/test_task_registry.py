@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+from pybox.task_registry import TaskRegistry, registered_tasks
+
+SOURCE = """
+from pybox.task import Task
+
+keyword_task = Task(task_name="KeywordTask", task_info="")
+positional_task = Task(task_name="PositionalTask(Date)", task_info="")
+dynamic_task = Task(task_name="DynamicTask", task_info="")
+bare_task = Task(task_name="BareTask", task_info="")
+hidden_task = Task(task_name="HiddenTask", task_info="")
+
+keyword_task.run(main, task_inputs=["A"], task_outputs=["B"])
+positional_task.run(main, ["B"], ["C"])
+dynamic_task.run(main, INPUTS, task_outputs=["D"])
+bare_task.run(main)
+if __name__ == "__main__":
+    hidden_task.run(main, ["A"], ["E"])
+"""
+
+
+def test_registered_tasks_io():
+    tasks = {task["name"]: task for task in registered_tasks(SOURCE)}
+    assert tasks["PositionalTask"]["pattern"] == "PositionalTask(Date)"
+    assert [(tasks[name]["inputs"], tasks[name]["outputs"]) for name in [
+        "KeywordTask", "PositionalTask", "DynamicTask", "BareTask",
+        "HiddenTask"
+    ]] == [(["A"], ["B"]), (["B"], ["C"]), (None, ["D"]), ([], []),
+           (None, None)]
+
+
+def test_unparsable_files_do_not_break_lookups(tmp_path, caplog):
+    tasks_directory = tmp_path / "box" / "tasks"
+    tasks_directory.mkdir(parents=True)
+    (tasks_directory / "broken.py").write_text("def broken(:\n")
+    (tasks_directory / "binary.py").write_bytes(b"\xff\xfe\x00")
+    (tasks_directory / "valid.py").write_text(
+        'task = Task(task_name="ValidTask", task_info="")\n'
+        'task.run(main, ["A"], ["B"])\n')
+
+    registry = TaskRegistry(str(tmp_path), str(tmp_path / "registry.json"))
+    assert registry.find("ValidTask") == str(tasks_directory / "valid.py")
+    assert registry.declared_io("ValidTask") == (["A"], ["B"])
+    assert "broken.py" in caplog.text and "binary.py" in caplog.text
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+import pybox.run_task as pbrt
+import pybox.artifact_store as pbas
+import pybox.task_scheduler as pbts
+from pybox.task_registry import TaskRegistry
+from pybox.datastore.data_flow import table_from_parquet
+
+import os
+import pytest
+
+TASK_SOURCE = """
+from pybox.task import Task
+from pybox.datastore.data_table import DataTable
+
+
+def main(*inputs):
+    with open(f"{{OUTPUTS_DIRECTORY}}/order.txt", "a") as order:
+        order.write("{name}\\n")
+    return DataTable({{"A": [sum(table.length for table in inputs) + 1]}})
+
+
+task = Task(task_name="{name}", task_info="")
+task.run(main, task_inputs={inputs}, task_outputs=["{name}"])
+"""
+
+
+@pytest.fixture
+def boxes(tmp_path, monkeypatch):
+    tasks_directory = tmp_path / "boxes" / "box" / "tasks"
+    tasks_directory.mkdir(parents=True)
+    monkeypatch.setattr(
+        pbrt, "_TASK_REGISTRY",
+        TaskRegistry(str(tmp_path / "boxes"), str(tmp_path / "registry.json")))
+    (tmp_path / "data").mkdir()
+
+    def add_task(name, inputs):
+        (tasks_directory / f"{name.lower()}.py").write_text(
+            TASK_SOURCE.format(name=name, inputs=inputs))
+
+    yield add_task
+    pbas.ARTIFACT_STORE.clear()
+
+
+def _order(directory):
+    with open(f"{directory}/order.txt") as order:
+        return order.read().split()
+
+
+def test_task_graph(boxes, tmp_path):
+    boxes("First", [])
+    boxes("Second", ["First"])
+    boxes("Third", ["First", "Second", "ExternalData"])
+    data = str(tmp_path / "data")
+    # Inputs without the producing task are not nodes of the graph.
+    assert pbts.task_graph("Third", data, data) == {
+        "Third": {"First", "Second"},
+        "Second": {"First"},
+        "First": set()
+    }
+    assert pbts.task_graph("First", data, data) == {"First": set()}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_tasks_run_after_their_inputs(boxes, tmp_path, jobs):
+    boxes("Source", [])
+    boxes("Left", ["Source"])
+    boxes("Right", ["Source"])
+    boxes("Final", ["Left", "Right"])
+    data = str(tmp_path / "data")
+    pbts.run_task_graph("Final", jobs, data, data, use_cache=False)
+
+    order = _order(data)
+    assert sorted(order) == ["Final", "Left", "Right", "Source"]
+    assert order[0] == "Source" and order[-1] == "Final"
+    assert table_from_parquet("Final", data)["A"] == [3]
+
+
+def test_cyclic_dependencies_raise_value_error(boxes, tmp_path):
+    boxes("Source", [])
+    boxes("First", ["Source", "Second"])
+    boxes("Second", ["First"])
+    data = str(tmp_path / "data")
+    with pytest.raises(ValueError, match="cyclic"):
+        pbts.run_task_graph("Second", 1, data, data, use_cache=False)
+    assert _order(data) == ["Source"]
+
+
+def test_handoff_directory_is_removed(boxes, tmp_path, monkeypatch):
+    boxes("First", [])
+    boxes("Second", ["First"])
+    data = str(tmp_path / "data")
+    created = list()
+    mkdtemp = pbts.tempfile.mkdtemp
+
+    def recorded_mkdtemp(**kwargs):
+        created.append(mkdtemp(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(pbts.tempfile, "mkdtemp", recorded_mkdtemp)
+    pbts.run_task_graph("Second", 2, data, data, use_cache=False)
+    boxes("Second", ["First", "Second"])
+    with pytest.raises(ValueError):
+        pbts.run_task_graph("Second", 2, data, data, use_cache=False)
+
+    assert len(created) == 2
+    assert not any(os.path.exists(directory) for directory in created)
+    assert pbas.HANDOFF_DIRECTORY_VARIABLE not in os.environ